@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""출신별 배경 스토리 텍스트
+
+자주 실행되지 않는 긴 서사 문자열을 본체에서 분리해 둔 모듈.
+_show_origin_story가 처음 호출될 때에만 import되므로
+게임 기동 시에는 이 바이트코드를 읽지 않는다.
+"""
+
+FALLEN_NOBLE_STORY = (
+    "한때는 권세를 누리던 양반가의 자제였으나,",
+    "정변의 소용돌이 속에서 가문이 몰락했다.",
+    "이제 당신에게 남은 것은 낡은 자존심과 복수심뿐...",
+)
+
+BANDIT_STORY = (
+    "도적단에서 자란 당신은 동료의 배신으로 쫓겨났다.",
+    "믿었던 이들에게 등을 찔린 상처는 아직도 쓰리다.",
+    "이제 홀로 살아남아야 한다...",
+)
+
+WAR_ORPHAN_STORY = (
+    "전쟁이 모든 것을 앗아갔다.",
+    "가족도, 집도, 이름조차 잃어버린 당신.",
+    "폐허 속에서 살아남기 위해 발버둥쳤다...",
+)
+
+
+def get(origin_name: str):
+    """Origin 멤버 이름으로 스토리 행 튜플을 돌려준다"""
+    return {
+        "FALLEN_NOBLE": FALLEN_NOBLE_STORY,
+        "BANDIT_OUTCAST": BANDIT_STORY,
+        "WAR_ORPHAN": WAR_ORPHAN_STORY,
+    }[origin_name]
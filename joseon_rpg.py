@@ -1,3204 +1,4072 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-
-import json
-import os
-import random
-import sys
-import time
-from datetime import datetime
-from enum import Enum
-from typing import Dict, List, Optional, Tuple
-
-
-# 게임 상수 정의
-class GameConstants:
-    SAVE_FILE_PATH = "joseon_rpg_save.json"
-    VERSION = "1.0.0"
-
-
-class Colors:
-    """ANSI 색상 코드"""
-    RESET = '\033[0m'
-    BLACK = '\033[30m'
-    RED = '\033[31m'
-    GREEN = '\033[32m'
-    YELLOW = '\033[33m'
-    BLUE = '\033[34m'
-    MAGENTA = '\033[35m'
-    CYAN = '\033[36m'
-    WHITE = '\033[37m'
-    BOLD = '\033[1m'
-    DIM = '\033[2m'
-
-
-class Origin(Enum):
-    """캐릭터 출신"""
-    FALLEN_NOBLE = "몰락한 양반"
-    BANDIT_OUTCAST = "도적단 낙오자"
-    WAR_ORPHAN = "전쟁 고아"
-
-
-class Faction(Enum):
-    """세력"""
-    PALACE = "궁"
-    CULT = "밀교파"
-    SHADOW_GUILD = "암시회"
-    PEOPLE_ALLIANCE = "백성연맹"
-    FOREIGNER_UNION = "이방인연합"
-    NEUTRAL = "중립"
-
-
-class JobPath(Enum):
-    """직업 경로"""
-    WANDERER = "방랑자"
-    WARRIOR_APPRENTICE = "무사 도제"
-    WARRIOR = "정식 무사"
-    BLADE_MASTER = "무형검사"
-    SWORD_DEMON = "검극귀"
-
-
-class ItemType(Enum):
-    """아이템 종류"""
-    WEAPON = "무기"
-    ARMOR = "의복"
-    SPECIAL = "특수 아이템"
-    STORY = "서사 아이템"
-
-
-class CombatAction(Enum):
-    """전투 행동"""
-    ATTACK = "공격"
-    DODGE = "회피"
-    DEFEND = "방어"
-    AMBUSH = "기습"
-    SKILL = "기술"
-
-
-class Item:
-    """아이템 클래스"""
-    def __init__(self, name: str, item_type: ItemType, description: str, 
-                 power: int = 0, defense: int = 0, special_effect: str = ""):
-        self.name = name
-        self.item_type = item_type
-        self.description = description
-        self.power = power
-        self.defense = defense
-        self.special_effect = special_effect
-        self.enhancement_level = 0
-        self.durability = 100
-        
-    def enhance(self) -> Tuple[bool, str]:
-        """아이템 강화 - 개선된 시스템"""
-        success_rate = 80 - (self.enhancement_level * 15)
-        roll = random.randint(1, 100)
-        
-        if roll <= success_rate:
-            # 성공
-            self.enhancement_level += 1
-            self.power = int(self.power * 1.2)
-            self.defense = int(self.defense * 1.2)
-            return True, "normal"
-        else:
-            # 실패
-            if roll <= success_rate + 10:
-                # 일반 실패
-                return False, "normal"
-            elif roll <= success_rate + 20:
-                # 내구도 손상
-                self.durability -= 30
-                return False, "damaged"
-            else:
-                # 파괴 또는 변이
-                if random.randint(1, 100) <= 50:
-                    # 파괴
-                    self.durability = 0
-                    return False, "destroyed"
-                else:
-                    # 저주/변이
-                    self.name = f"저주받은 {self.name}"
-                    self.special_effect = "착용자의 정신력을 갉아먹는다"
-                    self.power = int(self.power * 1.5)
-                    self.defense = int(self.defense * 0.5)
-                    return False, "cursed"
-    
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "item_type": self.item_type.value,
-            "description": self.description,
-            "power": self.power,
-            "defense": self.defense,
-            "special_effect": self.special_effect,
-            "enhancement_level": self.enhancement_level,
-            "durability": self.durability
-        }
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> 'Item':
-        item = cls(
-            name=data["name"],
-            item_type=ItemType(data["item_type"]),
-            description=data["description"],
-            power=data["power"],
-            defense=data["defense"],
-            special_effect=data["special_effect"]
-        )
-        item.enhancement_level = data["enhancement_level"]
-        item.durability = data["durability"]
-        return item
-
-
-class Skill:
-    """기술 클래스"""
-    def __init__(self, name: str, damage_multiplier: float, stamina_cost: int, 
-                 focus_cost: int, description: str):
-        self.name = name
-        self.damage_multiplier = damage_multiplier
-        self.stamina_cost = stamina_cost
-        self.focus_cost = focus_cost
-        self.description = description
-    
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "damage_multiplier": self.damage_multiplier,
-            "stamina_cost": self.stamina_cost,
-            "focus_cost": self.focus_cost,
-            "description": self.description
-        }
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> 'Skill':
-        return cls(**data)
-
-
-class NPC:
-    """NPC 클래스"""
-    def __init__(self, name: str, faction: Faction, initial_trust: int = 50):
-        self.name = name
-        self.faction = faction
-        self.trust = initial_trust
-        self.memories = []
-        self.is_hostile = False
-        
-    def remember_action(self, action: str):
-        """플레이어 행동 기억"""
-        self.memories.append({
-            "action": action,
-            "timestamp": datetime.now().isoformat()
-        })
-        
-    def adjust_trust(self, amount: int):
-        """신뢰도 조정"""
-        self.trust = max(0, min(100, self.trust + amount))
-        if self.trust < 20:
-            self.is_hostile = True
-            
-    def get_reaction(self) -> str:
-        """현재 신뢰도에 따른 반응"""
-        if self.is_hostile:
-            return f"{self.name}이(가) 적대적으로 바라봅니다."
-        elif self.trust >= 80:
-            return f"{self.name}이(가) 당신을 신뢰하는 눈빛으로 바라봅니다."
-        elif self.trust >= 50:
-            return f"{self.name}이(가) 중립적인 표정을 짓습니다."
-        else:
-            return f"{self.name}이(가) 의심스러운 눈초리로 당신을 살핍니다."
-    
-    def to_dict(self) -> dict:
-        return {
-            "name": self.name,
-            "faction": self.faction.value,
-            "trust": self.trust,
-            "memories": self.memories,
-            "is_hostile": self.is_hostile
-        }
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> 'NPC':
-        npc = cls(
-            name=data["name"],
-            faction=Faction(data["faction"]),
-            initial_trust=data["trust"]
-        )
-        npc.memories = data["memories"]
-        npc.is_hostile = data["is_hostile"]
-        return npc
-
-
-class Location:
-    """장소 클래스"""
-    def __init__(self, name: str, description: str, faction: Faction, 
-                 danger_level: int = 1, is_locked: bool = False):
-        self.name = name
-        self.description = description
-        self.faction = faction
-        self.danger_level = danger_level
-        self.is_locked = is_locked
-        self.npcs = []
-        self.items = []
-        self.connected_locations = []
-        
-    def add_npc(self, npc: NPC):
-        self.npcs.append(npc)
-        
-    def add_item(self, item: Item):
-        self.items.append(item)
-        
-    def connect_location(self, location_name: str):
-        if location_name not in self.connected_locations:
-            self.connected_locations.append(location_name)
-            
-    def unlock(self):
-        self.is_locked = False
-
-
-class Character:
-    """플레이어 캐릭터 클래스"""
-    def __init__(self, name: str, origin: Origin):
-        self.name = name
-        self.origin = origin
-        self.job = JobPath.WANDERER
-        self.faction_affinity = self._get_initial_faction(origin)
-        
-        # 능력치
-        self.max_health = 100
-        self.health = self.max_health
-        self.max_stamina = 100
-        self.stamina = self.max_stamina
-        self.max_focus = 100
-        self.focus = self.max_focus
-        self.defense = 10
-        self.sanity = 100
-        
-        # 전투 능력치
-        self.base_attack = self._get_initial_attack(origin)
-        self.base_defense = self._get_initial_defense(origin)
-        
-        # 인벤토리
-        self.inventory = []
-        self.equipped_weapon = None
-        self.equipped_armor = None
-        self.skills = []
-        self.money = self._get_initial_money(origin)  # 화폐 추가
-        
-        # 경험 및 성장
-        self.experience = 0
-        self.level = 1
-        
-        # 전투 상태
-        self.in_combat = False
-        self.turn_action_taken = False
-        
-        # 상태 이상
-        self.is_cursed = False  # 저주 상태
-        self.nightmares = []    # 악몽/환각
-        self.buffs = []         # 버프 리스트
-        self.debuffs = []       # 디버프 리스트
-        
-    def _get_initial_faction(self, origin: Origin) -> Dict[Faction, int]:
-        """출신에 따른 초기 세력 친화도"""
-        if origin == Origin.FALLEN_NOBLE:
-            return {
-                Faction.PALACE: 60,
-                Faction.CULT: 30,
-                Faction.SHADOW_GUILD: 40,
-                Faction.PEOPLE_ALLIANCE: 20,
-                Faction.FOREIGNER_UNION: 30
-            }
-        elif origin == Origin.BANDIT_OUTCAST:
-            return {
-                Faction.PALACE: 10,
-                Faction.CULT: 40,
-                Faction.SHADOW_GUILD: 70,
-                Faction.PEOPLE_ALLIANCE: 50,
-                Faction.FOREIGNER_UNION: 60
-            }
-        else:  # WAR_ORPHAN
-            return {
-                Faction.PALACE: 20,
-                Faction.CULT: 50,
-                Faction.SHADOW_GUILD: 50,
-                Faction.PEOPLE_ALLIANCE: 70,
-                Faction.FOREIGNER_UNION: 40
-            }
-    
-    def _get_initial_attack(self, origin: Origin) -> int:
-        """출신에 따른 초기 공격력"""
-        if origin == Origin.FALLEN_NOBLE:
-            return 15
-        elif origin == Origin.BANDIT_OUTCAST:
-            return 20
-        else:  # WAR_ORPHAN
-            return 12
-            
-    def _get_initial_defense(self, origin: Origin) -> int:
-        """출신에 따른 초기 방어력"""
-        if origin == Origin.FALLEN_NOBLE:
-            return 12
-        elif origin == Origin.BANDIT_OUTCAST:
-            return 10
-        else:  # WAR_ORPHAN
-            return 15
-    
-    def _get_initial_money(self, origin: Origin) -> int:
-        """출신에 따른 초기 자금"""
-        if origin == Origin.FALLEN_NOBLE:
-            return 100  # 약간의 재산 보유
-        elif origin == Origin.BANDIT_OUTCAST:
-            return 50   # 도적 생활로 모은 돈
-        else:  # WAR_ORPHAN
-            return 10   # 거의 없음
-    
-    def take_damage(self, damage: int):
-        """데미지 받기"""
-        actual_damage = max(0, damage - self.defense)
-        self.health -= actual_damage
-        return actual_damage
-        
-    def heal(self, amount: int):
-        """체력 회복"""
-        self.health = min(self.max_health, self.health + amount)
-        
-    def use_stamina(self, amount: int) -> bool:
-        """기력 사용"""
-        if self.stamina >= amount:
-            self.stamina -= amount
-            return True
-        return False
-        
-    def use_focus(self, amount: int) -> bool:
-        """집중도 사용"""
-        if self.focus >= amount:
-            self.focus -= amount
-            return True
-        return False
-        
-    def rest(self):
-        """휴식"""
-        self.stamina = min(self.max_stamina, self.stamina + 30)
-        self.focus = min(self.max_focus, self.focus + 20)
-        self.health = min(self.max_health, self.health + 10)
-        
-    def add_item(self, item: Item):
-        """아이템 획득"""
-        self.inventory.append(item)
-        
-    def equip_weapon(self, weapon: Item):
-        """무기 장착"""
-        if weapon.item_type == ItemType.WEAPON and weapon.durability > 0:
-            self.equipped_weapon = weapon
-            
-    def equip_armor(self, armor: Item):
-        """방어구 장착"""
-        if armor.item_type == ItemType.ARMOR and armor.durability > 0:
-            self.equipped_armor = armor
-            
-    def learn_skill(self, skill: Skill):
-        """기술 습득"""
-        if skill not in self.skills:
-            self.skills.append(skill)
-            
-    def get_total_attack(self) -> int:
-        """총 공격력 계산"""
-        weapon_power = self.equipped_weapon.power if self.equipped_weapon else 0
-        return self.base_attack + weapon_power
-        
-    def get_total_defense(self) -> int:
-        """총 방어력 계산"""
-        armor_defense = self.equipped_armor.defense if self.equipped_armor else 0
-        base_total = self.base_defense + armor_defense
-        
-        # 버프 적용
-        for buff in self.buffs:
-            if buff["type"] == "defense":
-                base_total += buff["value"]
-                
-        return base_total
-        
-    def get_dodge_chance(self) -> int:
-        """회피율 계산"""
-        base_dodge = 10 + (self.focus // 20)
-        
-        # 회피 버프 적용
-        for buff in self.buffs:
-            if buff["type"] == "dodge":
-                base_dodge += buff["value"]
-                
-        return min(base_dodge, 75)  # 최대 75%
-        
-    def advance_job(self):
-        """직업 승급"""
-        job_progression = {
-            JobPath.WANDERER: JobPath.WARRIOR_APPRENTICE,
-            JobPath.WARRIOR_APPRENTICE: JobPath.WARRIOR,
-            JobPath.WARRIOR: JobPath.BLADE_MASTER,
-            JobPath.BLADE_MASTER: JobPath.SWORD_DEMON
-        }
-        
-        if self.job in job_progression and self.level >= (list(JobPath).index(self.job) + 1) * 5:
-            self.job = job_progression[self.job]
-            self.max_health += 20
-            self.max_stamina += 20
-            self.max_focus += 20
-            self.base_attack += 5
-            self.base_defense += 5
-            return True
-        return False
-    
-    def gain_experience(self, amount: int):
-        """경험치 획득"""
-        self.experience += amount
-        while self.experience >= self.level * 100:
-            self.experience -= self.level * 100
-            self.level += 1
-            self.max_health += 10
-            self.max_stamina += 10
-            self.max_focus += 10
-            self.base_attack += 2
-            self.base_defense += 2
-            
-    def to_dict(self) -> dict:
-        """저장용 딕셔너리 변환"""
-        return {
-            "name": self.name,
-            "origin": self.origin.value,
-            "job": self.job.value,
-            "faction_affinity": {k.value: v for k, v in self.faction_affinity.items()},
-            "stats": {
-                "max_health": self.max_health,
-                "health": self.health,
-                "max_stamina": self.max_stamina,
-                "stamina": self.stamina,
-                "max_focus": self.max_focus,
-                "focus": self.focus,
-                "defense": self.defense,
-                "sanity": self.sanity,
-                "base_attack": self.base_attack,
-                "base_defense": self.base_defense
-            },
-            "inventory": [item.to_dict() for item in self.inventory],
-            "equipped_weapon": self.equipped_weapon.to_dict() if self.equipped_weapon else None,
-            "equipped_armor": self.equipped_armor.to_dict() if self.equipped_armor else None,
-            "skills": [skill.to_dict() for skill in self.skills],
-            "experience": self.experience,
-            "level": self.level,
-            "money": self.money,
-            "is_cursed": self.is_cursed,
-            "nightmares": self.nightmares,
-            "buffs": self.buffs,
-            "debuffs": self.debuffs
-        }
-    
-    @classmethod
-    def from_dict(cls, data: dict) -> 'Character':
-        """딕셔너리에서 캐릭터 복원"""
-        character = cls(data["name"], Origin(data["origin"]))
-        character.job = JobPath(data["job"])
-        character.faction_affinity = {Faction(k): v for k, v in data["faction_affinity"].items()}
-        
-        stats = data["stats"]
-        character.max_health = stats["max_health"]
-        character.health = stats["health"]
-        character.max_stamina = stats["max_stamina"]
-        character.stamina = stats["stamina"]
-        character.max_focus = stats["max_focus"]
-        character.focus = stats["focus"]
-        character.defense = stats["defense"]
-        character.sanity = stats["sanity"]
-        character.base_attack = stats["base_attack"]
-        character.base_defense = stats["base_defense"]
-        
-        character.inventory = [Item.from_dict(item) for item in data["inventory"]]
-        if data["equipped_weapon"]:
-            character.equipped_weapon = Item.from_dict(data["equipped_weapon"])
-        if data["equipped_armor"]:
-            character.equipped_armor = Item.from_dict(data["equipped_armor"])
-            
-        character.skills = [Skill.from_dict(skill) for skill in data["skills"]]
-        character.experience = data["experience"]
-        character.level = data["level"]
-        character.money = data.get("money", 50)  # 구버전 호환성
-        character.is_cursed = data.get("is_cursed", False)
-        character.nightmares = data.get("nightmares", [])
-        character.buffs = data.get("buffs", [])
-        character.debuffs = data.get("debuffs", [])
-        
-        return character
-
-
-class Enemy:
-    """적 클래스"""
-    def __init__(self, name: str, health: int, attack: int, defense: int, 
-                 experience_reward: int, loot: List[Item] = None, 
-                 combat_patterns: List[str] = None):
-        self.name = name
-        self.max_health = health
-        self.health = health
-        self.attack = attack
-        self.defense = defense
-        self.experience_reward = experience_reward
-        self.loot = loot or []
-        self.combat_patterns = combat_patterns or ["attack"]
-        self.rage_mode = False
-        self.stance = "normal"  # normal, defensive, aggressive
-        
-    def take_damage(self, damage: int) -> int:
-        """데미지 받기"""
-        actual_damage = max(0, damage - self.defense)
-        self.health -= actual_damage
-        
-        # 체력이 30% 이하로 떨어지면 분노 모드
-        if self.health <= self.max_health * 0.3 and not self.rage_mode:
-            self.rage_mode = True
-            self.attack = int(self.attack * 1.5)
-            
-        return actual_damage
-        
-    def is_alive(self) -> bool:
-        """생존 여부"""
-        return self.health > 0
-        
-    def get_attack_damage(self) -> int:
-        """공격 데미지 계산"""
-        base_damage = self.attack + random.randint(-5, 5)
-        if self.rage_mode:
-            base_damage = int(base_damage * 1.3)
-        if self.stance == "aggressive":
-            base_damage = int(base_damage * 1.2)
-        elif self.stance == "defensive":
-            base_damage = int(base_damage * 0.8)
-        return base_damage
-        
-    def choose_action(self, player_last_action: str = None) -> str:
-        """AI 행동 선택"""
-        if self.rage_mode:
-            # 분노 모드에서는 공격적
-            return random.choice(["strong_attack", "attack", "attack"])
-            
-        if player_last_action == "defend":
-            # 플레이어가 방어 중이면 강공격
-            return "strong_attack"
-        elif player_last_action == "dodge":
-            # 플레이어가 회피 중이면 견제
-            return "feint"
-            
-        # 일반 패턴
-        if len(self.combat_patterns) > 0:
-            return random.choice(self.combat_patterns)
-        return "attack"
-
-
-class Combat:
-    """전투 시스템"""
-    def __init__(self, player: Character, enemy: Enemy):
-        self.player = player
-        self.enemy = enemy
-        self.turn_count = 0
-        self.combat_log = []
-        self.is_active = True
-        self.player_last_action = None
-        
-    def player_attack(self) -> str:
-        """플레이어 공격"""
-        if self.player.turn_action_taken:
-            return "이미 이번 턴에 행동했습니다!"
-            
-        self.player.turn_action_taken = True
-        self.player_last_action = "attack"
-        
-        # 스태미나 체크
-        stamina_cost = 10
-        if self.player.stamina < stamina_cost:
-            return "기력이 부족합니다!"
-            
-        self.player.use_stamina(stamina_cost)
-        
-        # 명중률 계산 (집중도와 피로도 영향)
-        hit_chance = 70 + (self.player.focus // 10) - ((100 - self.player.stamina) // 20)
-        
-        if random.randint(1, 100) <= hit_chance:
-            damage = self.player.get_total_attack() + random.randint(-5, 10)
-            actual_damage = self.enemy.take_damage(damage)
-            
-            # 무기 내구도 감소
-            if self.player.equipped_weapon:
-                self.player.equipped_weapon.durability -= 1
-                if self.player.equipped_weapon.durability <= 0:
-                    return f"공격 성공! {actual_damage}의 피해를 입혔습니다.\n{Colors.RED}무기가 파괴되었습니다!{Colors.RESET}"
-                    
-            # 적 분노 모드 체크
-            if self.enemy.rage_mode and not hasattr(self, 'rage_announced'):
-                self.rage_announced = True
-                return f"공격 성공! {actual_damage}의 피해를 입혔습니다.\n{Colors.RED}{self.enemy.name}이(가) 분노합니다!{Colors.RESET}"
-                
-            return f"공격 성공! {actual_damage}의 피해를 입혔습니다. (적 체력: {self.enemy.health}/{self.enemy.max_health})"
-        else:
-            return "공격이 빗나갔습니다!"
-            
-    def player_dodge(self) -> str:
-        """플레이어 회피"""
-        if self.player.turn_action_taken:
-            return "이미 이번 턴에 행동했습니다!"
-            
-        self.player.turn_action_taken = True
-        self.player_last_action = "dodge"
-        
-        if not self.player.use_stamina(15):
-            return "기력이 부족합니다!"
-            
-        # 회피 버프 추가 (2턴 지속)
-        self.player.buffs.append({"type": "dodge", "turns": 2, "value": 30})
-        return "회피 자세를 취했습니다. 다음 공격을 피할 확률이 증가합니다."
-        
-    def player_defend(self) -> str:
-        """플레이어 방어"""
-        if self.player.turn_action_taken:
-            return "이미 이번 턴에 행동했습니다!"
-            
-        self.player.turn_action_taken = True
-        self.player_last_action = "defend"
-        
-        # 방어 버프 추가 (1턴 지속)
-        self.player.buffs.append({"type": "defense", "turns": 1, "value": 15})
-        self.player.stamina = max(0, self.player.stamina - 5)
-        return "방어 자세를 취했습니다. 받는 피해가 감소합니다."
-        
-    def player_ambush(self) -> str:
-        """플레이어 기습"""
-        if self.player.turn_action_taken:
-            return "이미 이번 턴에 행동했습니다!"
-            
-        self.player.turn_action_taken = True
-        
-        if not self.player.use_stamina(20) or not self.player.use_focus(20):
-            return "기력이나 집중도가 부족합니다!"
-            
-        success_chance = 50 + (self.player.level * 2)
-        if random.randint(1, 100) <= success_chance:
-            damage = self.player.get_total_attack() * 2
-            actual_damage = self.enemy.take_damage(damage)
-            return f"기습 성공! {actual_damage}의 큰 피해를 입혔습니다!"
-        else:
-            return "기습에 실패했습니다! 적에게 반격당합니다!"
-            
-    def player_use_skill(self, skill: Skill) -> str:
-        """플레이어 기술 사용"""
-        if self.player.turn_action_taken:
-            return "이미 이번 턴에 행동했습니다!"
-            
-        self.player.turn_action_taken = True
-        
-        if not self.player.use_stamina(skill.stamina_cost) or not self.player.use_focus(skill.focus_cost):
-            return f"{skill.name} 사용에 필요한 기력이나 집중도가 부족합니다!"
-            
-        damage = int(self.player.get_total_attack() * skill.damage_multiplier)
-        actual_damage = self.enemy.take_damage(damage)
-        return f"{skill.name} 발동! {actual_damage}의 피해를 입혔습니다!"
-        
-    def enemy_turn(self) -> str:
-        """적 턴"""
-        if not self.enemy.is_alive():
-            return ""
-            
-        # 회피 체크
-        if random.randint(1, 100) <= self.player.get_dodge_chance():
-            return f"{self.enemy.name}의 공격을 회피했습니다!"
-            
-        # 적 AI 행동 결정
-        action = self.enemy.choose_action(self.player_last_action)
-        
-        if action == "attack":
-            damage = self.enemy.get_attack_damage()
-            actual_damage = self.player.take_damage(damage)
-            
-            # 방어구 내구도 감소
-            if self.player.equipped_armor:
-                self.player.equipped_armor.durability -= 1
-                if self.player.equipped_armor.durability <= 0:
-                    return f"{self.enemy.name}의 공격! {actual_damage}의 피해를 받았습니다.\n{Colors.RED}방어구가 파괴되었습니다!{Colors.RESET}"
-                    
-            return f"{self.enemy.name}의 공격! {actual_damage}의 피해를 받았습니다. (체력: {self.player.health}/{self.player.max_health})"
-            
-        elif action == "strong_attack":
-            damage = int(self.enemy.get_attack_damage() * 1.5)
-            actual_damage = self.player.take_damage(damage)
-            return f"{self.enemy.name}의 강공격! {actual_damage}의 큰 피해를 받았습니다!"
-            
-        elif action == "feint":
-            # 견제 - 플레이어 집중도 감소
-            self.player.focus = max(0, self.player.focus - 15)
-            return f"{self.enemy.name}이(가) 견제합니다! 집중력이 흐트러집니다."
-            
-        elif action == "defend":
-            self.enemy.defense += 5
-            self.enemy.stance = "defensive"
-            return f"{self.enemy.name}이(가) 방어 자세를 취했습니다."
-            
-        elif action == "taunt":
-            # 도발 - 플레이어 정신력 감소
-            self.player.sanity -= 5
-            return f"{self.enemy.name}이(가) 당신을 조롱합니다! 정신력이 흔들립니다."
-            
-        else:
-            return f"{self.enemy.name}이(가) 이상한 행동을 취합니다..."
-            
-    def end_turn(self):
-        """턴 종료"""
-        self.turn_count += 1
-        self.player.turn_action_taken = False
-        
-        # 버프/디버프 턴 감소
-        for buff in self.player.buffs[:]:
-            buff["turns"] -= 1
-            if buff["turns"] <= 0:
-                self.player.buffs.remove(buff)
-                
-        for debuff in self.player.debuffs[:]:
-            debuff["turns"] -= 1
-            if debuff["turns"] <= 0:
-                self.player.debuffs.remove(debuff)
-            
-    def check_combat_end(self) -> Optional[str]:
-        """전투 종료 확인"""
-        if self.player.health <= 0:
-            self.is_active = False
-            return "death"
-        elif not self.enemy.is_alive():
-            self.is_active = False
-            return "victory"
-        return None
-
-
-class Game:
-    """메인 게임 클래스"""
-    def __init__(self):
-        self.player = None
-        self.current_location = None
-        self.locations = {}
-        self.npcs = {}
-        self.current_combat = None
-        self.is_running = True
-        
-        # 게임 이벤트 플래그 (딕셔너리 구조로 개선)
-        self.game_flags = {
-            "병사_구조": False,
-            "용병_고용": False,
-            "밀교_의식_정보": False,
-            "암시회_지하_정보": False,
-            "왕실_첩자_정보": False,
-            "밀교_비밀_목격": False,
-            "유곽_정보_획득": False,
-            "봉기_참여": False,
-            "고문_가담": False,
-            "밀교_혈맹": False,
-            "궁궐_지하_무기고_정보": False,
-            "밀교_음모_인지": False,
-            "무기_밀수_정보": False,
-            "이방인_반란_정보": False,
-            "호위대장_반역_정보": False,
-            "혼령_퀘스트": False
-        }
-        self.permanent_consequences = []  # 영구적 결과 저장
-        self.game_time = 12  # 게임 내 시간 (0-23)
-        self.death_cause = ""  # 사망 원인
-        
-        # 기본 아이템 생성
-        self.items_database = self._create_items()
-        
-        # 기본 기술 생성
-        self.skills_database = self._create_skills()
-        
-    def _create_items(self) -> Dict[str, Item]:
-        """기본 아이템 데이터베이스 생성"""
-        return {
-            "녹슨 검": Item("녹슨 검", ItemType.WEAPON, "오래된 녹슨 검이다.", power=10),
-            "포도청 검": Item("포도청 검", ItemType.WEAPON, "포도청에서 사용하던 제식 검.", power=25),
-            "명검 청홍": Item("명검 청홍", ItemType.WEAPON, "전설의 명검. 푸른 빛이 감돈다.", power=50),
-            "누더기 옷": Item("누더기 옷", ItemType.ARMOR, "찢어진 누더기 옷.", defense=5),
-            "가죽 갑옷": Item("가죽 갑옷", ItemType.ARMOR, "질긴 가죽으로 만든 갑옷.", defense=15),
-            "철갑옷": Item("철갑옷", ItemType.ARMOR, "두꺼운 철로 만든 갑옷.", defense=30),
-            "비밀 문서": Item("비밀 문서", ItemType.STORY, "암시회의 비밀이 적힌 문서.", special_effect="암시회 은신처 해금"),
-            "왕실 인장": Item("왕실 인장", ItemType.SPECIAL, "왕실의 권위를 상징하는 인장.", special_effect="궁궐 출입 가능"),
-            "독약": Item("독약", ItemType.SPECIAL, "치명적인 독이 든 병.", special_effect="암살 가능"),
-            "회복약": Item("회복약", ItemType.SPECIAL, "체력을 회복하는 약.", special_effect="체력 50 회복")
-        }
-        
-    def _create_skills(self) -> Dict[str, Skill]:
-        """기본 기술 데이터베이스 생성"""
-        return {
-            "일섬": Skill("일섬", 1.5, 20, 10, "빠른 베기 공격"),
-            "연환격": Skill("연환격", 2.0, 30, 20, "연속 공격"),
-            "회전베기": Skill("회전베기", 2.5, 40, 30, "강력한 회전 공격"),
-            "무형검": Skill("무형검", 3.0, 50, 40, "형체 없는 검기"),
-            "천지개벽": Skill("천지개벽", 5.0, 80, 60, "궁극의 일격")
-        }
-        
-    def _create_locations(self):
-        """게임 월드 생성"""
-        # 시작 지점
-        self.locations["폐허가 된 마을"] = Location(
-            "폐허가 된 마을",
-            "전쟁으로 황폐해진 마을. 썩은 냄새가 진동한다.",
-            Faction.NEUTRAL,
-            danger_level=1
-        )
-        
-        # 세력별 주요 거점
-        self.locations["경복궁"] = Location(
-            "경복궁",
-            "왕권의 마지막 보루. 근위병들이 삼엄하게 경비를 서고 있다.",
-            Faction.PALACE,
-            danger_level=3,
-            is_locked=True
-        )
-        
-        self.locations["밀교 사원"] = Location(
-            "밀교 사원",
-            "이상한 주문 소리가 들려오는 음침한 사원.",
-            Faction.CULT,
-            danger_level=4
-        )
-        
-        self.locations["암시회 은신처"] = Location(
-            "암시회 은신처",
-            "어둠 속에 숨겨진 지하 조직의 본거지.",
-            Faction.SHADOW_GUILD,
-            danger_level=4,
-            is_locked=True
-        )
-        
-        self.locations["민중 집회소"] = Location(
-            "민중 집회소",
-            "봉기를 준비하는 백성들이 모이는 곳.",
-            Faction.PEOPLE_ALLIANCE,
-            danger_level=2
-        )
-        
-        self.locations["이방인 주막"] = Location(
-            "이방인 주막",
-            "각지에서 온 이방인들이 모이는 주막.",
-            Faction.FOREIGNER_UNION,
-            danger_level=2
-        )
-        
-        # 중립 지역
-        self.locations["시장"] = Location(
-            "시장",
-            "활기찬 시장. 온갖 물건들이 거래된다.",
-            Faction.NEUTRAL,
-            danger_level=1
-        )
-        
-        self.locations["유곽"] = Location(
-            "유곽",
-            "화려한 등불 아래 은밀한 거래가 이루어지는 곳.",
-            Faction.NEUTRAL,
-            danger_level=2
-        )
-        
-        self.locations["산속 은거지"] = Location(
-            "산속 은거지",
-            "세상과 단절된 은둔자의 거처.",
-            Faction.NEUTRAL,
-            danger_level=3
-        )
-        
-        # 위험 지역
-        self.locations["처형장"] = Location(
-            "처형장",
-            "피비린내가 진동하는 공개 처형장.",
-            Faction.NEUTRAL,
-            danger_level=5
-        )
-        
-        self.locations["저주받은 숲"] = Location(
-            "저주받은 숲",
-            "들어간 자가 돌아오지 못한다는 숲.",
-            Faction.NEUTRAL,
-            danger_level=5,
-            is_locked=True
-        )
-        
-        # 연결 설정
-        self.locations["폐허가 된 마을"].connected_locations = ["시장", "민중 집회소", "이방인 주막"]
-        self.locations["시장"].connected_locations = ["폐허가 된 마을", "유곽", "처형장", "밀교 사원"]
-        self.locations["민중 집회소"].connected_locations = ["폐허가 된 마을", "시장"]
-        self.locations["이방인 주막"].connected_locations = ["폐허가 된 마을", "유곽", "산속 은거지"]
-        self.locations["유곽"].connected_locations = ["시장", "이방인 주막", "암시회 은신처"]
-        self.locations["산속 은거지"].connected_locations = ["이방인 주막", "저주받은 숲"]
-        self.locations["밀교 사원"].connected_locations = ["시장", "경복궁"]
-        self.locations["처형장"].connected_locations = ["시장", "경복궁"]
-        self.locations["경복궁"].connected_locations = ["밀교 사원", "처형장"]
-        self.locations["암시회 은신처"].connected_locations = ["유곽"]
-        self.locations["저주받은 숲"].connected_locations = ["산속 은거지"]
-        
-        # NPC 배치
-        self._place_npcs()
-        
-        # 아이템 배치
-        self._place_items()
-        
-    def _place_npcs(self):
-        """NPC 배치"""
-        # 시장 NPC
-        merchant = NPC("상인 김씨", Faction.NEUTRAL, 60)
-        self.npcs["상인 김씨"] = merchant
-        self.locations["시장"].add_npc(merchant)
-        
-        # 민중 집회소 NPC
-        rebel_leader = NPC("봉기군 수장 박씨", Faction.PEOPLE_ALLIANCE, 40)
-        self.npcs["봉기군 수장 박씨"] = rebel_leader
-        self.locations["민중 집회소"].add_npc(rebel_leader)
-        
-        # 이방인 주막 NPC
-        foreign_merc = NPC("서역 용병 아둘라", Faction.FOREIGNER_UNION, 50)
-        self.npcs["서역 용병 아둘라"] = foreign_merc
-        self.locations["이방인 주막"].add_npc(foreign_merc)
-        
-        # 유곽 NPC
-        courtesan = NPC("기생 월향", Faction.NEUTRAL, 50)
-        self.npcs["기생 월향"] = courtesan
-        self.locations["유곽"].add_npc(courtesan)
-        
-        # 처형장 NPC
-        executioner = NPC("망나니", Faction.PALACE, 20)
-        self.npcs["망나니"] = executioner
-        self.locations["처형장"].add_npc(executioner)
-        
-        # 밀교 사원 NPC
-        cult_priest = NPC("밀교 사제", Faction.CULT, 30)
-        self.npcs["밀교 사제"] = cult_priest
-        self.locations["밀교 사원"].add_npc(cult_priest)
-        
-    def _place_items(self):
-        """아이템 배치"""
-        # 시작 지점 아이템
-        self.locations["폐허가 된 마을"].add_item(self.items_database["녹슨 검"])
-        self.locations["폐허가 된 마을"].add_item(self.items_database["누더기 옷"])
-        
-        # 시장 아이템
-        self.locations["시장"].add_item(self.items_database["가죽 갑옷"])
-        self.locations["시장"].add_item(self.items_database["회복약"])
-        
-        # 밀교 사원 아이템
-        self.locations["밀교 사원"].add_item(self.items_database["독약"])
-        
-        # 이방인 주막 아이템
-        self.locations["이방인 주막"].add_item(self.items_database["비밀 문서"])
-        
-    def clear_screen(self):
-        """화면 지우기"""
-        os.system('cls' if os.name == 'nt' else 'clear')
-        
-    def display_title(self):
-        """타이틀 화면"""
-        self.clear_screen()
-        print(f"{Colors.RED}{'='*60}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.RED}조선 말기: 피와 어둠의 연대기{Colors.RESET}")
-        print(f"{Colors.RED}{'='*60}{Colors.RESET}")
-        print(f"{Colors.DIM}극사실주의 다크 판타지 RPG{Colors.RESET}")
-        print(f"{Colors.DIM}Ver {GameConstants.VERSION}{Colors.RESET}")
-        print(f"{Colors.RED}{'='*60}{Colors.RESET}")
-        print()
-        
-    def main_menu(self) -> str:
-        """메인 메뉴"""
-        while True:
-            self.display_title()
-            print("1. 새 게임")
-            print("2. 이어하기")
-            print("3. 종료")
-            print()
-            
-            choice = input(f"{Colors.YELLOW}선택 >> {Colors.RESET}").strip()
-            
-            if choice in ["1", "2", "3"]:
-                return choice
-            else:
-                print(f"{Colors.RED}올바른 선택지를 입력하세요.{Colors.RESET}")
-                time.sleep(1)
-                
-    def create_character(self):
-        """캐릭터 생성"""
-        self.clear_screen()
-        print(f"{Colors.BOLD}캐릭터 생성{Colors.RESET}")
-        print(f"{Colors.DIM}{'='*40}{Colors.RESET}")
-        
-        # 이름 입력
-        name = ""
-        while not name:
-            name = input(f"{Colors.YELLOW}이름을 입력하세요 >> {Colors.RESET}").strip()
-            
-        # 출신 선택
-        print(f"\n{Colors.BOLD}출신 선택:{Colors.RESET}")
-        origins = list(Origin)
-        for i, origin in enumerate(origins, 1):
-            print(f"{i}. {origin.value}")
-            
-        origin_choice = None
-        while origin_choice is None:
-            try:
-                choice = int(input(f"{Colors.YELLOW}출신 선택 >> {Colors.RESET}"))
-                if 1 <= choice <= len(origins):
-                    origin_choice = origins[choice - 1]
-                else:
-                    print(f"{Colors.RED}올바른 번호를 선택하세요.{Colors.RESET}")
-            except ValueError:
-                print(f"{Colors.RED}숫자를 입력하세요.{Colors.RESET}")
-                
-        # 캐릭터 생성
-        self.player = Character(name, origin_choice)
-        
-        # 출신별 초기 스토리
-        self._show_origin_story(origin_choice)
-        
-        # 월드 생성
-        self._create_locations()
-        self.current_location = self.locations["폐허가 된 마을"]
-        
-        print(f"\n{Colors.GREEN}캐릭터가 생성되었습니다!{Colors.RESET}")
-        time.sleep(2)
-        
-    def _show_origin_story(self, origin: Origin):
-        """출신별 배경 스토리"""
-        self.clear_screen()
-        print(f"{Colors.BOLD}당신의 과거...{Colors.RESET}\n")
-        
-        if origin == Origin.FALLEN_NOBLE:
-            print("한때는 권세를 누리던 양반가의 자제였으나,")
-            print("정변의 소용돌이 속에서 가문이 몰락했다.")
-            print("이제 당신에게 남은 것은 낡은 자존심과 복수심뿐...")
-            self.player.add_item(self.items_database["왕실 인장"])
-            print(f"\n{Colors.GREEN}[왕실 인장]을 소지하고 있습니다.{Colors.RESET}")
-            
-        elif origin == Origin.BANDIT_OUTCAST:
-            print("도적단에서 자란 당신은 동료의 배신으로 쫓겨났다.")
-            print("믿었던 이들에게 등을 찔린 상처는 아직도 쓰리다.")
-            print("이제 홀로 살아남아야 한다...")
-            self.player.learn_skill(self.skills_database["일섬"])
-            print(f"\n{Colors.GREEN}[일섬] 기술을 습득했습니다.{Colors.RESET}")
-            
-        else:  # WAR_ORPHAN
-            print("전쟁이 모든 것을 앗아갔다.")
-            print("가족도, 집도, 이름조차 잃어버린 당신.")
-            print("폐허 속에서 살아남기 위해 발버둥쳤다...")
-            self.player.stamina = self.player.max_stamina + 20
-            self.player.max_stamina += 20
-            print(f"\n{Colors.GREEN}극한의 생존력으로 최대 기력이 증가했습니다.{Colors.RESET}")
-            
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def save_game(self):
-        """게임 저장"""
-        save_data = {
-            "version": GameConstants.VERSION,
-            "player": self.player.to_dict(),
-            "current_location": self.current_location.name,
-            "game_time": self.game_time,
-            "npcs": {name: npc.to_dict() for name, npc in self.npcs.items()},
-            "game_flags": self.game_flags,
-            "permanent_consequences": self.permanent_consequences,
-            "unlocked_locations": [name for name, loc in self.locations.items() if not loc.is_locked]
-        }
-        
-        try:
-            with open(GameConstants.SAVE_FILE_PATH, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
-            print(f"{Colors.GREEN}게임이 저장되었습니다.{Colors.RESET}")
-            return True
-        except Exception as e:
-            print(f"{Colors.RED}저장 실패: {e}{Colors.RESET}")
-            return False
-            
-    def load_game(self) -> bool:
-        """게임 불러오기"""
-        if not os.path.exists(GameConstants.SAVE_FILE_PATH):
-            print(f"{Colors.RED}저장 파일이 없습니다.{Colors.RESET}")
-            return False
-            
-        try:
-            with open(GameConstants.SAVE_FILE_PATH, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
-                
-            # 플레이어 복원
-            self.player = Character.from_dict(save_data["player"])
-            
-            # 월드 생성
-            self._create_locations()
-            
-            # 현재 위치 복원
-            self.current_location = self.locations[save_data["current_location"]]
-            
-            # 게임 시간 복원
-            self.game_time = save_data.get("game_time", 12)
-            
-            # NPC 상태 복원
-            for name, npc_data in save_data["npcs"].items():
-                if name in self.npcs:
-                    self.npcs[name] = NPC.from_dict(npc_data)
-                    
-            # 게임 플래그 복원
-            self.game_flags = save_data.get("game_flags", self.game_flags)
-            
-            # 영구 결과 복원
-            self.permanent_consequences = save_data.get("permanent_consequences", [])
-            
-            # 잠금 해제된 장소 복원
-            for location_name in save_data["unlocked_locations"]:
-                if location_name in self.locations:
-                    self.locations[location_name].unlock()
-                    
-            print(f"{Colors.GREEN}게임을 불러왔습니다.{Colors.RESET}")
-            return True
-            
-        except Exception as e:
-            print(f"{Colors.RED}불러오기 실패: {e}{Colors.RESET}")
-            return False
-            
-    def display_status(self):
-        """플레이어 상태 표시"""
-        p = self.player
-        print(f"\n{Colors.BOLD}=== 상태 ==={Colors.RESET}")
-        print(f"이름: {p.name} | 출신: {p.origin.value} | 직업: {p.job.value}")
-        print(f"레벨: {p.level} | 경험치: {p.experience}/{p.level * 100} | 금전: {p.money}냥")
-        print(f"체력: {Colors.RED}{p.health}/{p.max_health}{Colors.RESET} | "
-              f"기력: {Colors.YELLOW}{p.stamina}/{p.max_stamina}{Colors.RESET} | "
-              f"집중: {Colors.CYAN}{p.focus}/{p.max_focus}{Colors.RESET}")
-        print(f"공격력: {p.get_total_attack()} | 방어력: {p.get_total_defense()} | "
-              f"정신력: {p.sanity}/100")
-        
-        if p.equipped_weapon:
-            print(f"무기: {p.equipped_weapon.name} (+{p.equipped_weapon.enhancement_level})")
-        if p.equipped_armor:
-            print(f"방어구: {p.equipped_armor.name} (+{p.equipped_armor.enhancement_level})")
-            
-        # 상태 이상 표시
-        if p.is_cursed:
-            print(f"{Colors.MAGENTA}[저주받음]{Colors.RESET}")
-        if p.sanity < 30:
-            print(f"{Colors.RED}[정신 불안정]{Colors.RESET}")
-        if p.nightmares:
-            print(f"{Colors.DIM}[악몽에 시달림]{Colors.RESET}")
-            
-    def display_location(self):
-        """현재 위치 표시"""
-        loc = self.current_location
-        
-        # 시간대 표시
-        time_str = self._get_time_string()
-        print(f"\n{Colors.DIM}[{time_str}]{Colors.RESET}")
-        
-        print(f"\n{Colors.BOLD}=== {loc.name} ==={Colors.RESET}")
-        
-        # 시간대별 설명
-        if self.game_time >= 20 or self.game_time < 6:  # 밤
-            print(f"{Colors.DIM}{loc.description} 어둠이 모든 것을 감싸고 있다...{Colors.RESET}")
-        else:
-            print(f"{Colors.DIM}{loc.description}{Colors.RESET}")
-            
-        print(f"위험도: {'★' * loc.danger_level}")
-        
-        if loc.npcs:
-            print(f"\n{Colors.CYAN}인물:{Colors.RESET}")
-            for npc in loc.npcs:
-                # 시간대별 NPC 활동
-                if self._is_npc_active(npc):
-                    print(f"  - {npc.name}")
-                else:
-                    print(f"  - {Colors.DIM}{npc.name} (자는 중){Colors.RESET}")
-                
-        if loc.items:
-            print(f"\n{Colors.YELLOW}아이템:{Colors.RESET}")
-            for item in loc.items:
-                print(f"  - {item.name}")
-                
-    def _get_time_string(self) -> str:
-        """시간대 문자열 반환"""
-        if 6 <= self.game_time < 12:
-            return "아침"
-        elif 12 <= self.game_time < 17:
-            return "낮"
-        elif 17 <= self.game_time < 20:
-            return "저녁"
-        else:
-            return "밤"
-            
-    def _is_npc_active(self, npc: NPC) -> bool:
-        """NPC 활동 시간 체크"""
-        # 기생은 밤에만 활동
-        if npc.name == "기생 월향":
-            return self.game_time >= 20 or self.game_time < 4
-        # 망나니는 낮에만
-        elif npc.name == "망나니":
-            return 10 <= self.game_time < 16
-        # 밀교 사제는 밤에 더 활발
-        elif npc.name == "밀교 사제":
-            return self.game_time >= 22 or self.game_time < 3
-        else:
-            return True
-            
-    def location_menu(self):
-        """위치 메뉴"""
-        while self.is_running and not self.current_combat:
-            self.clear_screen()
-            self.display_status()
-            self.display_location()
-            
-            # 암살 의뢰 확인
-            self._check_assassination_contracts()
-            
-            # 저주 효과 적용
-            if self.player.is_cursed:
-                self._apply_curse_effects()
-            
-            print(f"\n{Colors.BOLD}행동 선택:{Colors.RESET}")
-            print("1. 이동")
-            print("2. 탐색")
-            print("3. 대화")
-            print("4. 인벤토리")
-            print("5. 휴식")
-            print("6. 저장")
-            print("7. 특수 행동")
-            print("8. 메인 메뉴로")
-            
-            choice = input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}").strip()
-            
-            if choice == "1":
-                self.move_location()
-            elif choice == "2":
-                self.explore_location()
-            elif choice == "3":
-                self.talk_to_npc()
-            elif choice == "4":
-                self.inventory_menu()
-            elif choice == "5":
-                self.rest()
-            elif choice == "6":
-                self.save_game()
-                time.sleep(1)
-            elif choice == "7":
-                self.special_actions()
-            elif choice == "8":
-                break
-            else:
-                print(f"{Colors.RED}올바른 선택지를 입력하세요.{Colors.RESET}")
-                time.sleep(1)
-                
-    def _check_assassination_contracts(self):
-        """암살 의뢰 진행 확인"""
-        for consequence in self.permanent_consequences[:]:
-            if "_암살_의뢰" in consequence and random.randint(1, 100) <= 30:
-                target_name = consequence.replace("_암살_의뢰", "")
-                print(f"\n{Colors.RED}암살자가 {target_name}을(를) 제거했습니다...{Colors.RESET}")
-                
-                # NPC 제거
-                for location in self.locations.values():
-                    for npc in location.npcs[:]:
-                        if npc.name == target_name:
-                            location.npcs.remove(npc)
-                            
-                # 의뢰 완료
-                self.permanent_consequences.remove(consequence)
-                self.permanent_consequences.append(f"{target_name}_암살_완료")
-                time.sleep(2)
-                
-    def _apply_curse_effects(self):
-        """저주 효과 적용"""
-        if random.randint(1, 100) <= 10:
-            print(f"\n{Colors.MAGENTA}저주가 당신을 괴롭힙니다...{Colors.RESET}")
-            curse_effects = [
-                ("악몽이 현실로 스며듭니다...", lambda: setattr(self.player, 'sanity', self.player.sanity - 5)),
-                ("체력이 서서히 빠져나갑니다...", lambda: setattr(self.player, 'health', self.player.health - 5)),
-                ("집중력이 흐트러집니다...", lambda: setattr(self.player, 'focus', max(0, self.player.focus - 10)))
-            ]
-            
-            effect_text, effect_func = random.choice(curse_effects)
-            print(f"{Colors.DIM}{effect_text}{Colors.RESET}")
-            effect_func()
-            time.sleep(1)
-            
-    def move_location(self):
-        """위치 이동"""
-        print(f"\n{Colors.BOLD}이동 가능한 장소:{Colors.RESET}")
-        available_locations = []
-        
-        for i, location_name in enumerate(self.current_location.connected_locations, 1):
-            location = self.locations[location_name]
-            if not location.is_locked:
-                available_locations.append(location)
-                danger_indicator = '★' * location.danger_level
-                print(f"{i}. {location.name} (위험도: {danger_indicator})")
-            else:
-                print(f"{i}. {Colors.DIM}??? (잠김){Colors.RESET}")
-                
-        print("0. 취소")
-        
-        try:
-            choice = int(input(f"\n{Colors.YELLOW}이동할 장소 >> {Colors.RESET}"))
-            if choice == 0:
-                return
-            elif 1 <= choice <= len(self.current_location.connected_locations):
-                destination_name = self.current_location.connected_locations[choice - 1]
-                destination = self.locations[destination_name]
-                
-                if destination.is_locked:
-                    print(f"{Colors.RED}아직 갈 수 없는 곳입니다.{Colors.RESET}")
-                    time.sleep(1)
-                else:
-                    # 시간 경과
-                    self.game_time = (self.game_time + 1) % 24
-                    
-                    self.current_location = destination
-                    print(f"{Colors.GREEN}{destination.name}(으)로 이동했습니다.{Colors.RESET}")
-                    
-                    # 밤 이동 시 위험도 증가
-                    danger_modifier = 1.5 if (self.game_time >= 20 or self.game_time < 6) else 1.0
-                    
-                    # 이동 시 랜덤 이벤트 발생 가능
-                    if random.randint(1, 100) <= destination.danger_level * 10 * danger_modifier:
-                        self.random_encounter()
-                    else:
-                        time.sleep(1)
-        except ValueError:
-            print(f"{Colors.RED}올바른 번호를 입력하세요.{Colors.RESET}")
-            time.sleep(1)
-            
-    def explore_location(self):
-        """현재 위치 탐색"""
-        print(f"\n{Colors.CYAN}주변을 살펴봅니다...{Colors.RESET}")
-        time.sleep(1)
-        
-        # 시간대별 특수 발견
-        if self._check_time_based_discovery():
-            return
-        
-        # 아이템 발견
-        if self.current_location.items and random.randint(1, 100) <= 70:
-            found_item = random.choice(self.current_location.items)
-            print(f"\n{Colors.GREEN}[{found_item.name}]을(를) 발견했습니다!{Colors.RESET}")
-            print(f"{Colors.DIM}{found_item.description}{Colors.RESET}")
-            
-            choice = input(f"\n획득하시겠습니까? (y/n) >> ").strip().lower()
-            if choice == 'y':
-                self.player.add_item(found_item)
-                self.current_location.items.remove(found_item)
-                print(f"{Colors.GREEN}[{found_item.name}]을(를) 획득했습니다.{Colors.RESET}")
-                
-                # 특수 효과 처리
-                if found_item.special_effect == "암시회 은신처 해금":
-                    self.locations["암시회 은신처"].unlock()
-                    print(f"{Colors.YELLOW}암시회 은신처의 위치를 알게 되었습니다!{Colors.RESET}")
-                elif found_item.special_effect == "궁궐 출입 가능":
-                    self.locations["경복궁"].unlock()
-                    print(f"{Colors.YELLOW}이제 경복궁에 들어갈 수 있습니다!{Colors.RESET}")
-        else:
-            print(f"{Colors.DIM}특별한 것은 없는 것 같다...{Colors.RESET}")
-            
-        # 랜덤 이벤트
-        if random.randint(1, 100) <= 30:
-            self.random_encounter()
-            
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def _check_time_based_discovery(self) -> bool:
-        """시간대별 특수 발견"""
-        # 자정 특수 이벤트
-        if self.game_time == 0 and self.current_location.name == "밀교 사원":
-            print(f"\n{Colors.MAGENTA}자정... 사원 깊은 곳에서 이상한 빛이 새어나옵니다...{Colors.RESET}")
-            print("숨겨진 지하 통로를 발견했습니다!")
-            
-            choice = input("들어가시겠습니까? (y/n) >> ").strip().lower()
-            if choice == 'y':
-                self._secret_underground_passage()
-            return True
-            
-        # 새벽 특수 이벤트
-        elif 3 <= self.game_time <= 5 and self.current_location.name == "처형장":
-            print(f"\n{Colors.DIM}새벽안개 속에서 떠도는 혼령들이 보입니다...{Colors.RESET}")
-            self.player.sanity -= 10
-            
-            if self.player.sanity < 50:
-                print(f"{Colors.RED}혼령들이 속삭입니다: '우리처럼 되어라...'{Colors.RESET}")
-                self._ghost_encounter()
-            return True
-            
-        return False
-        
-    def _secret_underground_passage(self):
-        """비밀 지하 통로 이벤트"""
-        print(f"\n{Colors.MAGENTA}지하 깊은 곳으로 내려갑니다...{Colors.RESET}")
-        time.sleep(1)
-        
-        print("고대의 제단을 발견했습니다!")
-        print("\n1. 제단에 피를 바친다")
-        print("2. 제단을 파괴한다")
-        print("3. 조용히 돌아간다")
-        
-        choice = input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}").strip()
-        
-        if choice == "1":
-            print(f"\n{Colors.RED}당신의 피가 제단에 스며듭니다...{Colors.RESET}")
-            self.player.health -= 30
-            
-            # 강력한 아이템 획득
-            legendary_weapon = Item("마검 혈귀", ItemType.WEAPON, 
-                                  "피를 갈구하는 저주받은 검", power=80)
-            self.player.add_item(legendary_weapon)
-            print(f"\n{Colors.MAGENTA}[마검 혈귀]를 획득했습니다!{Colors.RESET}")
-            
-            self.player.is_cursed = True
-            self.player.nightmares.append("피의 제단")
-            
-        elif choice == "2":
-            print(f"\n{Colors.YELLOW}제단을 파괴합니다!{Colors.RESET}")
-            print("갑자기 지진이 일어납니다!")
-            
-            # 밀교파와 영구 적대
-            self.player.faction_affinity[Faction.CULT] = -100
-            print(f"{Colors.RED}밀교파가 당신을 이단으로 선포했습니다!{Colors.RESET}")
-            
-            # 붕괴로 인한 부상
-            self.player.health -= 20
-            print("무너지는 돌에 맞아 부상을 입었습니다!")
-            
-    def _ghost_encounter(self):
-        """유령 조우 이벤트"""
-        print(f"\n{Colors.MAGENTA}처형당한 자들의 혼령이 나타났습니다...{Colors.RESET}")
-        
-        if "고문_집행자" in self.permanent_consequences:
-            print(f"{Colors.RED}'네가... 네가 우리를 죽였다...!'{Colors.RESET}")
-            print("혼령들이 당신을 공격합니다!")
-            
-            # 특수 적 - 물리 공격 효과 감소
-            ghost = Enemy("원혼 무리", 100, 25, 20, 80, None,
-                         ["attack", "taunt", "taunt"])
-            ghost.defense = 30  # 물리 방어력 높음
-            self.start_combat(ghost)
-        else:
-            print("혼령들이 슬픈 눈으로 당신을 바라봅니다...")
-            print(f"{Colors.CYAN}'우리의 원한을 풀어주오...'{Colors.RESET}")
-            
-            # 퀘스트 제공
-            self.game_flags["혼령_퀘스트"] = True
-            
-    def talk_to_npc(self):
-        """NPC와 대화"""
-        if not self.current_location.npcs:
-            print(f"{Colors.DIM}대화할 사람이 없습니다.{Colors.RESET}")
-            time.sleep(1)
-            return
-            
-        active_npcs = [npc for npc in self.current_location.npcs if self._is_npc_active(npc)]
-        if not active_npcs:
-            print(f"{Colors.DIM}깨어있는 사람이 없습니다.{Colors.RESET}")
-            time.sleep(1)
-            return
-            
-        print(f"\n{Colors.BOLD}대화 상대 선택:{Colors.RESET}")
-        for i, npc in enumerate(active_npcs, 1):
-            print(f"{i}. {npc.name}")
-        print("0. 취소")
-        
-        try:
-            choice = int(input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}"))
-            if choice == 0:
-                return
-            elif 1 <= choice <= len(active_npcs):
-                npc = active_npcs[choice - 1]
-                self.npc_interaction(npc)
-        except ValueError:
-            print(f"{Colors.RED}올바른 번호를 입력하세요.{Colors.RESET}")
-            time.sleep(1)
-            
-    def npc_interaction(self, npc: NPC):
-        """NPC 상호작용"""
-        self.clear_screen()
-        print(f"{Colors.BOLD}=== {npc.name} ==={Colors.RESET}")
-        print(npc.get_reaction())
-        
-        # NPC 기억 표시
-        if npc.memories:
-            recent_memory = npc.memories[-1]
-            if "배신" in recent_memory["action"]:
-                print(f"{Colors.RED}(당신의 배신을 기억하고 있다...){Colors.RESET}")
-            elif "도움" in recent_memory["action"]:
-                print(f"{Colors.GREEN}(당신의 도움을 기억하고 있다...){Colors.RESET}")
-        
-        if npc.is_hostile:
-            print(f"\n{Colors.RED}{npc.name}이(가) 공격해옵니다!{Colors.RESET}")
-            enemy = Enemy(npc.name, 80, 15, 10, 50)
-            self.start_combat(enemy)
-            return
-            
-        # 출신별 대화 옵션
-        dialogue_options = self._get_origin_based_dialogue(npc)
-        
-        # NPC별 특수 대화
-        if npc.name == "상인 김씨":
-            print("\n'어서 오시게. 무엇을 찾으시나?'")
-            if npc.trust >= 50:
-                print("'믿을만한 손님이군. 특별한 물건도 보여드리지.'")
-                dialogue_options.extend([
-                    ("거래하기", lambda: self.shop_menu(npc)),
-                    ("정보 구매", lambda: self.buy_information(npc))
-                ])
-            else:
-                dialogue_options.extend([
-                    ("거래하기", lambda: self.shop_menu(npc))
-                ])
-                
-        elif npc.name == "봉기군 수장 박씨":
-            print("\n'양반놈들을 몰아내고 새 세상을 열 것이오!'")
-            
-            # 출신별 반응
-            if self.player.origin == Origin.FALLEN_NOBLE:
-                print(f"{Colors.YELLOW}(그가 당신을 의심스럽게 바라본다...){Colors.RESET}")
-                npc.adjust_trust(-10)
-            elif self.player.origin == Origin.WAR_ORPHAN:
-                print(f"{Colors.GREEN}(동병상련의 눈빛을 보낸다...){Colors.RESET}")
-                npc.adjust_trust(10)
-                
-            if self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] >= 60:
-                dialogue_options.extend([
-                    ("봉기에 참여하기", lambda: self.join_rebellion(npc)),
-                    ("정보 공유", lambda: self.share_information(npc))
-                ])
-                
-        elif npc.name == "서역 용병 아둘라":
-            print("\n'돈만 준다면 뭐든 해주지.'")
-            
-            # 도적 출신은 특별 대우
-            if self.player.origin == Origin.BANDIT_OUTCAST:
-                print(f"{Colors.CYAN}'오... 같은 길을 걸었던 자군. 특별히 해주지.'{Colors.RESET}")
-                dialogue_options.append(("암살 의뢰 (도적 출신 전용)", lambda: self.assassination_contract(npc)))
-                
-            dialogue_options.extend([
-                ("용병 고용", lambda: self.hire_mercenary(npc)),
-                ("전투 기술 배우기", lambda: self.learn_combat_skill(npc))
-            ])
-            
-        elif npc.name == "기생 월향":
-            print("\n'어서 오세요, 나리...'")
-            
-            # 양반 출신은 특별 대우
-            if self.player.origin == Origin.FALLEN_NOBLE:
-                print(f"{Colors.CYAN}'아... 옛 영화가 느껴지는군요. 특별히 모시겠습니다.'{Colors.RESET}")
-                dialogue_options.append(("비밀 정보 거래 (양반 전용)", lambda: self.secret_info_trade(npc)))
-                
-            dialogue_options.extend([
-                ("정보 구매 (50냥)", lambda: self.buy_courtesan_info(npc)),
-                ("밤을 보내기 (100냥)", lambda: self.spend_night(npc))
-            ])
-            
-        elif npc.name == "밀교 사제":
-            print("\n'고통을 통해 초월에 이르는 길...'")
-            
-            dialogue_options.extend([
-                ("교리에 대해 묻기", lambda: self.ask_doctrine(npc)),
-                ("금지된 지식 구매 (300냥)", lambda: self.buy_forbidden_knowledge(npc))
-            ])
-            
-            # 자정 특수 이벤트
-            if self.game_time == 0:
-                dialogue_options.append(("심야 의식 참여", lambda: self.midnight_ritual(npc)))
-                
-        elif npc.name == "망나니":
-            print("\n'피의 냄새가 그리운가? 크크크...'")
-            if self.current_location.name == "처형장":
-                dialogue_options.append(("고문 참관", lambda: self.witness_torture()))
-            
-        # 기본 선택지
-        dialogue_options.append(("돌아가기", None))
-        
-        # 선택지 표시
-        print(f"\n{Colors.BOLD}선택:{Colors.RESET}")
-        for i, (text, _) in enumerate(dialogue_options, 1):
-            print(f"{i}. {text}")
-            
-        try:
-            choice = int(input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}"))
-            if 1 <= choice <= len(dialogue_options):
-                _, action = dialogue_options[choice - 1]
-                if action:
-                    action()
-        except ValueError:
-            print(f"{Colors.RED}올바른 번호를 입력하세요.{Colors.RESET}")
-            time.sleep(1)
-            
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def _get_origin_based_dialogue(self, npc: NPC):
-        """출신별 기본 대화 옵션"""
-        options = []
-        
-        if self.player.origin == Origin.FALLEN_NOBLE:
-            options.append(("위엄있게 명령하기", lambda: self.noble_command(npc)))
-            if npc.faction == Faction.PALACE:
-                options.append(("가문의 이름으로 호소하기", lambda: self.family_appeal(npc)))
-                
-        elif self.player.origin == Origin.BANDIT_OUTCAST:
-            options.append(("은밀히 거래 제안", lambda: self.shady_deal(npc)))
-            if npc.faction in [Faction.SHADOW_GUILD, Faction.FOREIGNER_UNION]:
-                options.append(("동업자 코드로 대화", lambda: self.criminal_code(npc)))
-                
-        elif self.player.origin == Origin.WAR_ORPHAN:
-            options.append(("동정심에 호소하기", lambda: self.sympathy_appeal(npc)))
-            if npc.faction == Faction.PEOPLE_ALLIANCE:
-                options.append(("고통의 경험 공유", lambda: self.share_suffering(npc)))
-                
-        return options
-        
-    def noble_command(self, npc: NPC):
-        """양반 출신 - 위엄있게 명령"""
-        print(f"\n당신은 양반의 위엄으로 {npc.name}에게 명령합니다.")
-        
-        if npc.faction == Faction.PALACE or npc.trust >= 60:
-            print(f"{Colors.GREEN}{npc.name}이(가) 고개를 숙입니다.{Colors.RESET}")
-            npc.adjust_trust(5)
-        else:
-            print(f"{Colors.RED}'시대가 바뀌었소. 양반 나부랭이가...'{Colors.RESET}")
-            npc.adjust_trust(-15)
-            npc.remember_action("양반_명령_거부")
-            
-    def family_appeal(self, npc: NPC):
-        """양반 출신 - 가문 호소"""
-        print(f"\n당신은 몰락한 가문의 영광을 언급합니다.")
-        print(f"{Colors.CYAN}'우리 가문은 한때 왕실의 신임을 받았소...'{Colors.RESET}")
-        
-        if "왕실 인장" in [item.name for item in self.player.inventory]:
-            print(f"{Colors.GREEN}왕실 인장을 보인 {npc.name}의 태도가 달라집니다!{Colors.RESET}")
-            npc.adjust_trust(20)
-            npc.remember_action("왕실_인장_확인")
-        else:
-            print(f"{Colors.DIM}{npc.name}이(가) 시큰둥해합니다.{Colors.RESET}")
-            
-    def shady_deal(self, npc: NPC):
-        """도적 출신 - 은밀한 거래"""
-        print(f"\n당신은 {npc.name}에게 은밀히 속삭입니다.")
-        
-        if npc.faction in [Faction.SHADOW_GUILD, Faction.CULT]:
-            print(f"{Colors.GREEN}'흥미로운 제안이군... 들어보지.'{Colors.RESET}")
-            npc.adjust_trust(10)
-        else:
-            print(f"{Colors.RED}'수상한 놈... 꺼져!'{Colors.RESET}")
-            npc.adjust_trust(-10)
-            
-    def criminal_code(self, npc: NPC):
-        """도적 출신 - 범죄자 암호"""
-        print(f"\n당신은 도적들만 아는 은어로 말합니다.")
-        print(f"{Colors.CYAN}'달빛 아래 그림자가 춤춘다...'{Colors.RESET}")
-        
-        print(f"{Colors.GREEN}{npc.name}이(가) 같은 은어로 답합니다!{Colors.RESET}")
-        print("'...그리고 칼날은 침묵한다.'")
-        
-        npc.adjust_trust(25)
-        npc.remember_action("동업자_확인")
-        
-        # 특별 보상
-        if "암시회 은신처" in self.locations and self.locations["암시회 은신처"].is_locked:
-            print(f"\n{Colors.YELLOW}암시회 은신처의 위치를 알려줍니다!{Colors.RESET}")
-            self.locations["암시회 은신처"].unlock()
-            
-    def sympathy_appeal(self, npc: NPC):
-        """전쟁 고아 - 동정심 호소"""
-        print(f"\n당신은 전쟁으로 잃은 모든 것을 이야기합니다.")
-        
-        if npc.trust >= 40 or npc.faction == Faction.PEOPLE_ALLIANCE:
-            print(f"{Colors.GREEN}{npc.name}의 눈가가 촉촉해집니다.{Colors.RESET}")
-            npc.adjust_trust(15)
-            
-            # 작은 도움
-            if self.player.health < self.player.max_health:
-                print(f"{Colors.GREEN}약초를 건네줍니다. 체력이 회복됩니다!{Colors.RESET}")
-                self.player.heal(20)
-        else:
-            print(f"{Colors.DIM}'안타깝지만... 모두가 고통받고 있소.'{Colors.RESET}")
-            
-    def share_suffering(self, npc: NPC):
-        """전쟁 고아 - 고통 공유"""
-        print(f"\n당신은 전쟁의 참상을 생생히 묘사합니다.")
-        print(f"{Colors.DIM}불타는 마을... 비명소리... 죽어가는 부모...{Colors.RESET}")
-        
-        self.player.sanity -= 5
-        npc.adjust_trust(20)
-        npc.remember_action("전쟁_경험_공유")
-        
-        print(f"{Colors.GREEN}{npc.name}이(가) 당신을 동지로 받아들입니다.{Colors.RESET}")
-        self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] += 15
-        
-    def shop_menu(self, merchant: NPC):
-        """상점 메뉴"""
-        shop_items = {
-            "포도청 검": (self.items_database["포도청 검"], 200),
-            "가죽 갑옷": (self.items_database["가죽 갑옷"], 150),
-            "회복약": (self.items_database["회복약"], 50),
-            "철갑옷": (self.items_database["철갑옷"], 500)
-        }
-        
-        while True:
-            self.clear_screen()
-            print(f"\n{Colors.BOLD}=== 상점 ==={Colors.RESET}")
-            print(f"보유 금액: {Colors.YELLOW}{self.player.money}냥{Colors.RESET}\n")
-            
-            items_list = list(shop_items.items())
-            for i, (name, (item, price)) in enumerate(items_list, 1):
-                print(f"{i}. {name} - {price}냥")
-                print(f"   {Colors.DIM}{item.description}{Colors.RESET}")
-                
-            print("0. 나가기")
-            
-            try:
-                choice = int(input(f"\n{Colors.YELLOW}구매할 아이템 >> {Colors.RESET}"))
-                if choice == 0:
-                    break
-                elif 1 <= choice <= len(items_list):
-                    name, (item, price) = items_list[choice - 1]
-                    
-                    if self.player.money >= price:
-                        self.player.money -= price
-                        new_item = Item(item.name, item.item_type, item.description, 
-                                      item.power, item.defense, item.special_effect)
-                        self.player.add_item(new_item)
-                        print(f"\n{Colors.GREEN}[{name}]을(를) 구매했습니다!{Colors.RESET}")
-                        merchant.adjust_trust(5)
-                    else:
-                        print(f"\n{Colors.RED}금액이 부족합니다!{Colors.RESET}")
-                    
-                    time.sleep(1.5)
-            except ValueError:
-                print(f"{Colors.RED}올바른 번호를 입력하세요.{Colors.RESET}")
-                time.sleep(1)
-                
-    def buy_information(self, npc: NPC):
-        """정보 구매"""
-        print("\n'이런 정보들이 있소...'")
-        print("1. 저주받은 숲의 비밀 (100냥)")
-        print("2. 밀교파의 음모 (200냥)")
-        print("3. 돌아가기")
-        
-        choice = input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}").strip()
-        if choice == "1" and self.player.money >= 100:
-            self.player.money -= 100
-            print(f"\n{Colors.CYAN}'저주받은 숲 깊은 곳에 전설의 무기가 숨겨져 있다고 하오.'{Colors.RESET}")
-            self.locations["저주받은 숲"].unlock()
-            npc.adjust_trust(5)
-        elif choice == "2" and self.player.money >= 200:
-            self.player.money -= 200
-            print(f"\n{Colors.CYAN}'밀교파가 왕실 전복을 꾀하고 있소. 조심하시오.'{Colors.RESET}")
-            self.game_flags["밀교_음모_인지"] = True
-            npc.adjust_trust(5)
-            
-    def join_rebellion(self, npc: NPC):
-        """봉기 참여"""
-        print(f"\n{Colors.RED}경고: 봉기에 참여하면 왕실과 적대 관계가 됩니다!{Colors.RESET}")
-        choice = input("정말 참여하시겠습니까? (y/n) >> ").strip().lower()
-        
-        if choice == 'y':
-            self.player.faction_affinity[Faction.PALACE] -= 50
-            self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] += 30
-            self.game_flags["봉기_참여"] = True
-            print(f"\n{Colors.GREEN}봉기군에 합류했습니다!{Colors.RESET}")
-            npc.adjust_trust(20)
-            npc.remember_action("봉기_참여")
-            
-            # 봉기군 무기 지급
-            rebel_sword = Item("봉기군 검", ItemType.WEAPON, "거친 만듦새지만 단단한 검", power=20)
-            self.player.add_item(rebel_sword)
-            print(f"{Colors.GREEN}[봉기군 검]을 받았습니다!{Colors.RESET}")
-            
-    def share_information(self, npc: NPC):
-        """정보 공유"""
-        shared_something = False
-        
-        if self.game_flags.get("밀교_의식_정보", False):
-            print("\n밀교파의 음모에 대해 알려주었습니다.")
-            npc.adjust_trust(15)
-            npc.remember_action("밀교파_정보_공유")
-            shared_something = True
-            
-        if self.game_flags.get("무기_밀수_정보", False):
-            print("\n암시회의 무기 밀수 계획을 알려주었습니다.")
-            npc.adjust_trust(20)
-            npc.remember_action("무기_밀수_정보_공유")
-            shared_something = True
-            
-        if shared_something:
-            print(f"\n{Colors.GREEN}신뢰도가 상승했습니다!{Colors.RESET}")
-        else:
-            print("\n공유할 만한 정보가 없습니다.")
-            
-    def assassination_contract(self, npc: NPC):
-        """도적 출신 전용 - 암살 계약"""
-        print(f"\n{Colors.RED}'제거해야 할 대상이 있나?'{Colors.RESET}")
-        print("'200냥이면 누구든 조용히 사라지게 해주지.'")
-        
-        if self.player.money >= 200:
-            # 암살 대상 선택
-            targets = ["밀교 사제", "봉기군 수장 박씨", "상인 김씨"]
-            print("\n암살 대상:")
-            for i, target in enumerate(targets, 1):
-                print(f"{i}. {target}")
-            print("0. 취소")
-            
-            try:
-                choice = int(input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}"))
-                if 1 <= choice <= len(targets):
-                    target_name = targets[choice - 1]
-                    self.player.money -= 200
-                    self.permanent_consequences.append(f"{target_name}_암살_의뢰")
-                    print(f"\n{Colors.RED}'3일 내로 처리하겠네...'{Colors.RESET}")
-                    npc.remember_action(f"암살_의뢰_{target_name}")
-            except ValueError:
-                pass
-                
-    def hire_mercenary(self, npc: NPC):
-        """용병 고용"""
-        print("\n'하루에 50냥. 전투에서 도움을 주지.'")
-        
-        if self.player.money >= 50:
-            choice = input("고용하시겠습니까? (y/n) >> ").strip().lower()
-            if choice == 'y':
-                self.player.money -= 50
-                self.game_flags["용병_고용"] = True
-                print(f"{Colors.GREEN}용병을 고용했습니다! 다음 전투에서 도움을 받습니다.{Colors.RESET}")
-                npc.adjust_trust(5)
-                
-    def learn_combat_skill(self, npc: NPC):
-        """전투 기술 학습"""
-        available_skills = []
-        
-        # 학습 가능한 기술 확인
-        if "연환격" not in [s.name for s in self.player.skills]:
-            available_skills.append(("연환격", 100))
-        if "회전베기" not in [s.name for s in self.player.skills] and self.player.level >= 5:
-            available_skills.append(("회전베기", 200))
-            
-        if not available_skills:
-            print("더 이상 배울 기술이 없습니다.")
-            return
-            
-        print("\n학습 가능한 기술:")
-        for i, (skill_name, price) in enumerate(available_skills, 1):
-            skill = self.skills_database[skill_name]
-            print(f"{i}. {skill_name} - {price}냥")
-            print(f"   {Colors.DIM}{skill.description}{Colors.RESET}")
-        print("0. 취소")
-        
-        try:
-            choice = int(input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}"))
-            if choice == 0:
-                return
-            elif 1 <= choice <= len(available_skills):
-                skill_name, price = available_skills[choice - 1]
-                if self.player.money >= price:
-                    self.player.money -= price
-                    self.player.learn_skill(self.skills_database[skill_name])
-                    print(f"{Colors.GREEN}[{skill_name}] 기술을 습득했습니다!{Colors.RESET}")
-                    npc.adjust_trust(10)
-                else:
-                    print(f"{Colors.RED}금액이 부족합니다!{Colors.RESET}")
-        except ValueError:
-            pass
-            
-    def secret_info_trade(self, npc: NPC):
-        """양반 전용 - 비밀 정보 거래"""
-        print(f"\n{Colors.CYAN}'아, 나리께서는 특별한 정보를 원하시는군요...'{Colors.RESET}")
-        print("'궁중의 비밀, 세력들의 음모... 300냥이면 알려드리죠.'")
-        
-        if self.player.money >= 300:
-            choice = input("구매하시겠습니까? (y/n) >> ").strip().lower()
-            if choice == 'y':
-                self.player.money -= 300
-                print(f"\n{Colors.MAGENTA}[극비 정보 획득]{Colors.RESET}")
-                print("1. 왕실 내부에 밀교파 첩자가 있습니다.")
-                print("2. 암시회가 대규모 무기 밀수를 준비 중입니다.")
-                print("3. 이방인연합이 반란을 계획하고 있습니다.")
-                
-                self.game_flags["왕실_첩자_정보"] = True
-                self.game_flags["무기_밀수_정보"] = True
-                self.game_flags["이방인_반란_정보"] = True
-                self.locations["저주받은 숲"].unlock()
-                print(f"\n{Colors.YELLOW}저주받은 숲의 비밀 통로를 알게 되었습니다!{Colors.RESET}")
-                
-    def buy_courtesan_info(self, npc: NPC):
-        """기생 정보 구매"""
-        if self.player.money >= 50:
-            self.player.money -= 50
-            
-            # 랜덤 정보 제공
-            info_list = [
-                ("밀교파가 매달 보름에 비밀 의식을 연다", "밀교_의식_정보"),
-                ("암시회 두목이 처형장 지하에 은신처를 만들었다", "암시회_지하_정보"),
-                ("왕실 호위대장이 반역을 꾀한다", "호위대장_반역_정보")
-            ]
-            
-            info_text, event_flag = random.choice(info_list)
-            print(f"\n{Colors.CYAN}'{info_text}고 하더군요...'{Colors.RESET}")
-            self.game_flags[event_flag] = True
-            npc.adjust_trust(10)
-        else:
-            print(f"{Colors.RED}금액이 부족합니다!{Colors.RESET}")
-            
-    def spend_night(self, npc: NPC):
-        """유곽에서 밤 보내기"""
-        if self.player.money >= 100:
-            self.player.money -= 100
-            
-            print(f"\n{Colors.DIM}화려한 등불 아래, 달콤한 향이 가득한 방...{Colors.RESET}")
-            time.sleep(1)
-            
-            # 선택적 묘사
-            print("\n1. 담소를 나눈다 (안전)")
-            print("2. 깊은 밤을 보낸다 (체력/정신력 대폭 회복)")
-            print("3. 금기를 넘는다 (특별한 효과, 정신력 감소)")
-            
-            choice = input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}").strip()
-            
-            if choice == "1":
-                print(f"\n{Colors.GREEN}편안한 대화로 마음이 안정됩니다.{Colors.RESET}")
-                self.player.sanity = min(100, self.player.sanity + 10)
-                self.player.stamina = self.player.max_stamina
-                
-            elif choice == "2":
-                print(f"\n{Colors.DIM}열정적인 밤이 지나갑니다...{Colors.RESET}")
-                self.player.health = self.player.max_health
-                self.player.stamina = self.player.max_stamina
-                self.player.focus = self.player.max_focus
-                self.player.sanity = min(100, self.player.sanity + 20)
-                npc.adjust_trust(20)
-                
-            elif choice == "3":
-                print(f"\n{Colors.RED}금기의 쾌락에 빠져듭니다...{Colors.RESET}")
-                print(f"{Colors.DIM}이성을 잃고 본능에 충실한 밤...{Colors.RESET}")
-                
-                # 특별한 효과
-                self.player.max_stamina += 10
-                self.player.stamina = self.player.max_stamina
-                self.player.sanity -= 15
-                npc.adjust_trust(30)
-                npc.remember_action("금기의_밤")
-                
-                # 특수 능력 획득
-                if random.randint(1, 100) <= 30:
-                    print(f"\n{Colors.MAGENTA}타락한 쾌락 속에서 이상한 깨달음을 얻었습니다...{Colors.RESET}")
-                    self.player.base_attack += 3
-                    
-            # 시간 경과
-            self.game_time = 6  # 다음날 아침
-            time.sleep(2)
-        else:
-            print(f"{Colors.RED}금액이 부족합니다!{Colors.RESET}")
-            
-    def ask_doctrine(self, npc: NPC):
-        """교리 문답"""
-        print(f"\n{Colors.CYAN}'우리는 고통을 통해 초월에 이른다...'{Colors.RESET}")
-        print("밀교 사제가 금지된 경전을 펼칩니다.")
-        
-        self.player.sanity -= 5
-        self.player.focus += 10
-        npc.adjust_trust(5)
-        
-        print(f"\n{Colors.DIM}이상한 깨달음이 당신의 정신을 파고듭니다...{Colors.RESET}")
-        
-    def buy_forbidden_knowledge(self, npc: NPC):
-        """금지된 지식 구매"""
-        print("\n'300냥이면 금지된 비술을 가르쳐주지...'")
-        
-        if self.player.money >= 300:
-            choice = input("구매하시겠습니까? (y/n) >> ").strip().lower()
-            if choice == 'y':
-                self.player.money -= 300
-                
-                # 랜덤 비술 습득
-                forbidden_skills = ["무형검", "천지개벽"]
-                available = [s for s in forbidden_skills if s not in [sk.name for sk in self.player.skills]]
-                
-                if available:
-                    skill_name = random.choice(available)
-                    self.player.learn_skill(self.skills_database[skill_name])
-                    print(f"{Colors.MAGENTA}[{skill_name}] 비술을 전수받았습니다!{Colors.RESET}")
-                    self.player.sanity -= 15
-                else:
-                    print("더 이상 배울 비술이 없습니다.")
-                    self.player.money += 300  # 환불
-        else:
-            print(f"{Colors.RED}금액이 부족합니다!{Colors.RESET}")
-            
-    def midnight_ritual(self, npc: NPC):
-        """심야 의식 이벤트"""
-        print(f"\n{Colors.MAGENTA}자정의 종이 울리고, 의식이 시작됩니다...{Colors.RESET}")
-        print("검은 두건의 신도들이 원을 그리며 둘러섭니다.")
-        
-        print("\n1. 피의 맹세를 한다 (영구적 변화)")
-        print("2. 관찰만 한다")
-        print("3. 의식을 방해한다")
-        
-        choice = input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}").strip()
-        
-        if choice == "1":
-            print(f"\n{Colors.RED}당신은 손목을 그어 피를 제단에 바칩니다...{Colors.RESET}")
-            self.player.health -= 20
-            self.player.is_cursed = True
-            self.permanent_consequences.append("밀교_혈맹")
-            
-            # 영구적 능력 변화
-            self.player.max_focus += 30
-            self.player.base_attack += 5
-            self.player.sanity = max(0, self.player.sanity - 30)
-            
-            print(f"{Colors.MAGENTA}어둠의 힘이 당신의 영혼에 각인됩니다...{Colors.RESET}")
-            print(f"{Colors.GREEN}집중력과 공격력이 영구적으로 상승했습니다!{Colors.RESET}")
-            print(f"{Colors.RED}하지만 당신의 영혼은 영원히 저주받았습니다...{Colors.RESET}")
-            
-            # 특수 기술 획득
-            if "천지개벽" not in [s.name for s in self.player.skills]:
-                print(f"\n{Colors.MAGENTA}금지된 기술 [천지개벽]을 깨달았습니다!{Colors.RESET}")
-                self.player.learn_skill(self.skills_database["천지개벽"])
-                
-            # 다른 세력과의 관계 파탄
-            self.player.faction_affinity[Faction.PALACE] = 0
-            self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] = 0
-            print(f"\n{Colors.RED}왕실과 백성연맹과의 모든 관계가 단절되었습니다!{Colors.RESET}")
-            
-            npc.adjust_trust(50)
-            npc.remember_action("혈맹_체결")
-            
-        elif choice == "2":
-            print(f"\n{Colors.CYAN}당신은 의식의 비밀을 목격했습니다.{Colors.RESET}")
-            self.game_flags["밀교_비밀_목격"] = True
-            self.player.sanity -= 5
-            npc.adjust_trust(5)
-            
-        elif choice == "3":
-            print(f"\n{Colors.RED}당신은 의식을 방해했습니다!{Colors.RESET}")
-            print("분노한 신도들이 공격해옵니다!")
-            
-            # 다수의 적과 전투
-            for i in range(3):
-                if self.player.health <= 0:
-                    break
-                enemy = Enemy(f"밀교 신도 {i+1}", 60, 15, 8, 30, None,
-                             ["attack", "strong_attack"])
-                print(f"\n{Colors.RED}[{enemy.name}]이(가) 나타났습니다!{Colors.RESET}")
-                self.start_combat(enemy)
-                
-            self.player.faction_affinity[Faction.CULT] -= 50
-            npc.adjust_trust(-100)
-            npc.is_hostile = True
-            
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def witness_torture(self):
-        """고문 참관 - 개선된 버전"""
-        print(f"\n{Colors.RED}처형장에서 끔찍한 고문이 진행되고 있습니다.{Colors.RESET}")
-        
-        # 고문 대상 확인
-        victim = "반역자" if self.game_flags.get("왕실_첩자_정보", False) else "무고한 백성"
-        print(f"고문받는 자: {victim}")
-        
-        print("\n1. 고문을 지켜본다")
-        print("2. 고문을 중단시킨다") 
-        print("3. 직접 참여한다 (극도로 잔혹함)")
-        print("4. 정보를 캐낸다")
-        print("5. 자리를 떠난다")
-        
-        choice = input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}").strip()
-        
-        if choice == "1":
-            print(f"\n{Colors.DIM}비명과 신음 소리가 처형장을 가득 채웁니다...{Colors.RESET}")
-            print("당신은 차가운 눈으로 광경을 지켜봅니다.")
-            self.player.sanity -= 10
-            self.player.faction_affinity[Faction.PALACE] += 5
-            
-        elif choice == "2":
-            print(f"\n{Colors.GREEN}당신은 고문을 중단시켰습니다.{Colors.RESET}")
-            self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] += 10
-            self.player.faction_affinity[Faction.PALACE] -= 10
-            
-            # 망나니와 전투 가능성
-            if random.randint(1, 100) <= 50:
-                print(f"\n{Colors.RED}망나니가 분노하여 공격해옵니다!{Colors.RESET}")
-                enemy = Enemy("분노한 망나니", 90, 22, 12, 50, None,
-                             ["attack", "strong_attack", "taunt"])
-                self.start_combat(enemy)
-                
-        elif choice == "3":
-            print(f"\n{Colors.RED}당신은 직접 고문 도구를 들었습니다...{Colors.RESET}")
-            print(f"{Colors.DIM}피가 당신의 손을 적십니다. 희생자의 눈에서 생기가 사라집니다...{Colors.RESET}")
-            
-            self.player.sanity -= 40
-            self.player.nightmares.append("고문한 자의 얼굴")
-            self.player.faction_affinity[Faction.PALACE] += 20
-            self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] -= 30
-            self.game_flags["고문_가담"] = True
-            self.permanent_consequences.append("고문_집행자")
-            
-            # 특수 기술 습득
-            if "회전베기" not in [s.name for s in self.player.skills]:
-                print(f"\n{Colors.MAGENTA}잔혹한 경험으로 [회전베기] 기술을 깨달았습니다...{Colors.RESET}")
-                self.player.learn_skill(self.skills_database["회전베기"])
-                
-            # 영구적 변화
-            print(f"\n{Colors.RED}당신의 손은 이제 영원히 피로 물들었습니다...{Colors.RESET}")
-            self._apply_permanent_consequence("고문_집행자")
-            
-        elif choice == "4":
-            print(f"\n당신은 고문을 이용해 정보를 캐냅니다...")
-            
-            if victim == "반역자":
-                print(f"{Colors.CYAN}'암시회가... 궁궐 지하에... 무기를...'{Colors.RESET}")
-                self.game_flags["궁궐_지하_무기고_정보"] = True
-                print(f"\n{Colors.YELLOW}중요한 정보를 얻었습니다!{Colors.RESET}")
-            else:
-                print(f"{Colors.DIM}희생자는 아무것도 모릅니다...{Colors.RESET}")
-                self.player.sanity -= 20
-                
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def _apply_permanent_consequence(self, consequence: str):
-        """영구 결과 적용"""
-        if consequence == "고문_집행자":
-            # 모든 NPC의 초기 신뢰도 감소
-            for npc in self.npcs.values():
-                if npc.faction != Faction.PALACE:
-                    npc.adjust_trust(-20)
-                    
-    def inventory_menu(self):
-        """인벤토리 메뉴"""
-        while True:
-            self.clear_screen()
-            print(f"{Colors.BOLD}=== 인벤토리 ==={Colors.RESET}")
-            print(f"금전: {Colors.YELLOW}{self.player.money}냥{Colors.RESET}\n")
-            
-            if not self.player.inventory:
-                print(f"{Colors.DIM}소지품이 없습니다.{Colors.RESET}")
-            else:
-                for i, item in enumerate(self.player.inventory, 1):
-                    enhancement = f" (+{item.enhancement_level})" if item.enhancement_level > 0 else ""
-                    durability = f" (내구도: {item.durability}%)" if item.item_type in [ItemType.WEAPON, ItemType.ARMOR] else ""
-                    
-                    # 장착 중인 아이템 표시
-                    equipped = ""
-                    if item == self.player.equipped_weapon:
-                        equipped = f" {Colors.GREEN}[장착중]{Colors.RESET}"
-                    elif item == self.player.equipped_armor:
-                        equipped = f" {Colors.GREEN}[장착중]{Colors.RESET}"
-                        
-                    print(f"{i}. {item.name}{enhancement}{durability}{equipped}")
-                    print(f"   {Colors.DIM}{item.description}{Colors.RESET}")
-                    
-            print("\n1. 장비 장착")
-            print("2. 아이템 사용")
-            print("3. 아이템 강화")
-            print("4. 아이템 버리기")
-            print("0. 돌아가기")
-            
-            choice = input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}").strip()
-            
-            if choice == "0":
-                break
-            elif choice == "1":
-                self.equip_item()
-            elif choice == "2":
-                self.use_item()
-            elif choice == "3":
-                self.enhance_item()
-            elif choice == "4":
-                self.drop_item()
-                
-    def equip_item(self):
-        """아이템 장착"""
-        if not self.player.inventory:
-            return
-            
-        equippable = [item for item in self.player.inventory 
-                     if item.item_type in [ItemType.WEAPON, ItemType.ARMOR] and item.durability > 0]
-                     
-        if not equippable:
-            print(f"{Colors.DIM}장착 가능한 아이템이 없습니다.{Colors.RESET}")
-            time.sleep(1)
-            return
-            
-        print("\n장착할 아이템:")
-        for i, item in enumerate(equippable, 1):
-            print(f"{i}. {item.name}")
-            
-        print("0. 취소")
-        
-        try:
-            choice = int(input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}"))
-            if choice == 0:
-                return
-            elif 1 <= choice <= len(equippable):
-                item = equippable[choice - 1]
-                
-                if item.item_type == ItemType.WEAPON:
-                    self.player.equip_weapon(item)
-                    print(f"{Colors.GREEN}[{item.name}]을(를) 장착했습니다.{Colors.RESET}")
-                elif item.item_type == ItemType.ARMOR:
-                    self.player.equip_armor(item)
-                    print(f"{Colors.GREEN}[{item.name}]을(를) 장착했습니다.{Colors.RESET}")
-                    
-                time.sleep(1)
-        except ValueError:
-            print(f"{Colors.RED}올바른 번호를 입력하세요.{Colors.RESET}")
-            time.sleep(1)
-            
-    def use_item(self):
-        """아이템 사용"""
-        if not self.player.inventory:
-            return
-            
-        usable_items = [item for item in self.player.inventory if item.item_type == ItemType.SPECIAL]
-        if not usable_items:
-            print(f"{Colors.DIM}사용할 수 있는 아이템이 없습니다.{Colors.RESET}")
-            time.sleep(1)
-            return
-            
-        print("\n사용 가능한 아이템:")
-        for i, item in enumerate(usable_items, 1):
-            print(f"{i}. {item.name} - {item.special_effect}")
-            
-        print("0. 취소")
-        
-        try:
-            choice = int(input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}"))
-            if choice == 0:
-                return
-            elif 1 <= choice <= len(usable_items):
-                item = usable_items[choice - 1]
-                
-                if item.name == "회복약":
-                    self.player.heal(50)
-                    self.player.inventory.remove(item)
-                    print(f"{Colors.GREEN}체력을 50 회복했습니다!{Colors.RESET}")
-                elif item.name == "독약":
-                    print(f"{Colors.RED}독약은 전투나 암살에 사용됩니다.{Colors.RESET}")
-                else:
-                    print(f"{Colors.DIM}여기서는 사용할 수 없습니다.{Colors.RESET}")
-                    
-                time.sleep(1)
-        except ValueError:
-            print(f"{Colors.RED}올바른 번호를 입력하세요.{Colors.RESET}")
-            time.sleep(1)
-            
-    def enhance_item(self):
-        """아이템 강화"""
-        enhanceable = [item for item in self.player.inventory 
-                      if item.item_type in [ItemType.WEAPON, ItemType.ARMOR] and item.durability > 0]
-                      
-        if not enhanceable:
-            print(f"{Colors.DIM}강화할 수 있는 아이템이 없습니다.{Colors.RESET}")
-            time.sleep(1)
-            return
-            
-        print("\n강화 가능한 아이템:")
-        for i, item in enumerate(enhanceable, 1):
-            print(f"{i}. {item.name} (+{item.enhancement_level}) - 성공률: {80 - item.enhancement_level * 15}%")
-            
-        print("0. 취소")
-        
-        try:
-            choice = int(input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}"))
-            if choice == 0:
-                return
-            elif 1 <= choice <= len(enhanceable):
-                item = enhanceable[choice - 1]
-                
-                print(f"\n{Colors.YELLOW}[{item.name}] 강화를 시도합니다...{Colors.RESET}")
-                time.sleep(1)
-                
-                success, result_type = item.enhance()
-                
-                if success:
-                    print(f"{Colors.GREEN}강화 성공! [{item.name}] (+{item.enhancement_level}){Colors.RESET}")
-                else:
-                    if result_type == "normal":
-                        print(f"{Colors.YELLOW}강화 실패!{Colors.RESET}")
-                    elif result_type == "damaged":
-                        print(f"{Colors.RED}강화 실패! 내구도가 크게 감소했습니다!{Colors.RESET}")
-                    elif result_type == "destroyed":
-                        print(f"{Colors.RED}강화 대실패! [{item.name}]이(가) 파괴되었습니다!{Colors.RESET}")
-                        self.player.inventory.remove(item)
-                        if self.player.equipped_weapon == item:
-                            self.player.equipped_weapon = None
-                        elif self.player.equipped_armor == item:
-                            self.player.equipped_armor = None
-                    elif result_type == "cursed":
-                        print(f"{Colors.MAGENTA}강화 실패! 아이템에 저주가 걸렸습니다!{Colors.RESET}")
-                        print(f"{Colors.DIM}불길한 기운이 아이템을 감싸고 있다...{Colors.RESET}")
-                        
-                time.sleep(2)
-        except ValueError:
-            print(f"{Colors.RED}올바른 번호를 입력하세요.{Colors.RESET}")
-            time.sleep(1)
-            
-    def drop_item(self):
-        """아이템 버리기"""
-        if not self.player.inventory:
-            return
-            
-        print("\n버릴 아이템 번호를 입력하세요 (0: 취소):")
-        try:
-            choice = int(input(f"{Colors.YELLOW}선택 >> {Colors.RESET}"))
-            if choice == 0:
-                return
-            elif 1 <= choice <= len(self.player.inventory):
-                item = self.player.inventory[choice - 1]
-                
-                confirm = input(f"\n정말 [{item.name}]을(를) 버리시겠습니까? (y/n) >> ").strip().lower()
-                if confirm == 'y':
-                    self.player.inventory.remove(item)
-                    self.current_location.add_item(item)
-                    print(f"{Colors.YELLOW}[{item.name}]을(를) 버렸습니다.{Colors.RESET}")
-                    
-                    # 장착 중인 아이템 체크
-                    if item == self.player.equipped_weapon:
-                        self.player.equipped_weapon = None
-                    elif item == self.player.equipped_armor:
-                        self.player.equipped_armor = None
-                    
-                time.sleep(1)
-        except ValueError:
-            print(f"{Colors.RED}올바른 번호를 입력하세요.{Colors.RESET}")
-            time.sleep(1)
-            
-    def rest(self):
-        """휴식"""
-        print(f"\n{Colors.CYAN}잠시 휴식을 취합니다...{Colors.RESET}")
-        
-        # 악몽 체크
-        if self.player.sanity < 30 or self.player.nightmares:
-            print(f"\n{Colors.RED}불안한 잠에 빠집니다...{Colors.RESET}")
-            self._nightmare_event()
-        else:
-            self.player.rest()
-            
-            # 휴식 중 랜덤 이벤트
-            if random.randint(1, 100) <= 20:
-                print(f"\n{Colors.RED}휴식 중 습격을 받았습니다!{Colors.RESET}")
-                self.random_encounter()
-            else:
-                print(f"\n{Colors.GREEN}충분한 휴식을 취했습니다.{Colors.RESET}")
-                print("체력, 기력, 집중도가 일부 회복되었습니다.")
-                
-                # 저주 체크
-                if self.player.is_cursed:
-                    print(f"{Colors.MAGENTA}저주가 당신의 정신을 갉아먹습니다...{Colors.RESET}")
-                    self.player.sanity -= 5
-                    
-                # 시간 경과
-                self.game_time = (self.game_time + 3) % 24
-                time.sleep(2)
-                
-    def _nightmare_event(self):
-        """악몽 이벤트"""
-        nightmares = [
-            "죽인 자들의 얼굴이 어둠 속에서 나타납니다...",
-            "피로 물든 손이 씻겨지지 않습니다...",
-            "비명소리가 귓가에 맴돕니다...",
-            "당신이 저지른 일들이 악몽이 되어 찾아옵니다..."
-        ]
-        
-        print(f"\n{Colors.MAGENTA}{random.choice(nightmares)}{Colors.RESET}")
-        self.player.sanity -= 10
-        self.player.stamina = max(0, self.player.stamina - 20)
-        
-        # 극심한 정신 불안정
-        if self.player.sanity <= 0:
-            print(f"\n{Colors.RED}정신이 완전히 붕괴했습니다!{Colors.RESET}")
-            self.death_cause = "광기에 빠져 스스로 목숨을 끊었습니다..."
-            self.player_death()
-            
-    def special_actions(self):
-        """특수 행동 메뉴"""
-        print(f"\n{Colors.BOLD}특수 행동:{Colors.RESET}")
-        
-        actions = []
-        
-        # 장소별 특수 행동
-        if self.current_location.name == "밀교 사원" and self.game_time == 0:
-            actions.append(("심야 의식 수행", self._midnight_special_ritual))
-            
-        if self.current_location.name == "처형장":
-            actions.append(("처형 집행", self._execute_prisoner))
-            
-        if self.current_location.name == "유곽":
-            actions.append(("정보 거래", self._information_broker))
-            
-        # 출신별 특수 행동
-        if self.player.origin == Origin.FALLEN_NOBLE:
-            actions.append(("권세 회복 시도", self._restore_authority))
-            
-        elif self.player.origin == Origin.BANDIT_OUTCAST:
-            actions.append(("은밀한 도둑질", self._stealth_theft))
-            
-        elif self.player.origin == Origin.WAR_ORPHAN:
-            actions.append(("생존 기술 사용", self._survival_skills))
-            
-        # 상태별 특수 행동
-        if self.player.is_cursed:
-            actions.append(("저주 해제 시도", self._attempt_curse_removal))
-            
-        if not actions:
-            print(f"{Colors.DIM}특별한 행동이 없습니다.{Colors.RESET}")
-            time.sleep(1)
-            return
-            
-        for i, (name, _) in enumerate(actions, 1):
-            print(f"{i}. {name}")
-        print("0. 돌아가기")
-        
-        try:
-            choice = int(input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}"))
-            if choice == 0:
-                return
-            elif 1 <= choice <= len(actions):
-                _, action = actions[choice - 1]
-                action()
-        except ValueError:
-            print(f"{Colors.RED}올바른 번호를 입력하세요.{Colors.RESET}")
-            time.sleep(1)
-            
-    def _midnight_special_ritual(self):
-        """심야 특수 의식"""
-        print(f"\n{Colors.MAGENTA}어둠의 힘이 절정에 달했습니다...{Colors.RESET}")
-        
-        # 특수 능력 일시 강화
-        self.player.buffs.append({"type": "attack", "turns": 10, "value": 20})
-        self.player.buffs.append({"type": "defense", "turns": 10, "value": 10})
-        
-        print(f"{Colors.GREEN}어둠의 축복을 받았습니다!{Colors.RESET}")
-        print("일시적으로 전투력이 크게 상승했습니다!")
-        
-        self.player.sanity -= 15
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def _execute_prisoner(self):
-        """죄수 처형"""
-        print(f"\n{Colors.RED}처형대에 죄수가 끌려옵니다...{Colors.RESET}")
-        
-        print("\n1. 직접 처형한다")
-        print("2. 자비를 베푼다")
-        print("3. 구경만 한다")
-        
-        choice = input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}").strip()
-        
-        if choice == "1":
-            print(f"\n{Colors.RED}당신의 칼날이 죄수의 목을 베었습니다...{Colors.RESET}")
-            self.player.sanity -= 20
-            self.player.faction_affinity[Faction.PALACE] += 15
-            self.player.money += 50
-            print(f"{Colors.YELLOW}처형 수당으로 50냥을 받았습니다.{Colors.RESET}")
-            
-            # 처형 기술 습득
-            if random.randint(1, 100) <= 30:
-                if "일섬" not in [s.name for s in self.player.skills]:
-                    print(f"\n{Colors.MAGENTA}깨끗한 참수로 [일섬] 기술을 깨달았습니다!{Colors.RESET}")
-                    self.player.learn_skill(self.skills_database["일섬"])
-                    
-        elif choice == "2":
-            print(f"\n{Colors.GREEN}당신은 죄수를 몰래 풀어주었습니다.{Colors.RESET}")
-            self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] += 20
-            self.player.faction_affinity[Faction.PALACE] -= 20
-            
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def _information_broker(self):
-        """정보 거래소"""
-        print(f"\n{Colors.CYAN}은밀한 정보들이 오가는 곳입니다...{Colors.RESET}")
-        
-        if self.player.money >= 100:
-            print("\n100냥으로 중요 정보를 살 수 있습니다.")
-            choice = input("구매하시겠습니까? (y/n) >> ").strip().lower()
-            
-            if choice == 'y':
-                self.player.money -= 100
-                secrets = [
-                    ("밀교파 지하 제단의 위치", lambda: self.locations["밀교 사원"].items.append(
-                        Item("금지된 경전", ItemType.STORY, "밀교의 비밀이 담긴 책"))),
-                    ("왕실 비자금 은닉처", lambda: setattr(self.player, 'money', self.player.money + 500)),
-                    ("전설의 무기 소재지", lambda: self.locations["저주받은 숲"].items.append(
-                        self.items_database["명검 청홍"]))
-                ]
-                
-                secret_name, secret_func = random.choice(secrets)
-                print(f"\n{Colors.YELLOW}[{secret_name}]의 정보를 얻었습니다!{Colors.RESET}")
-                secret_func()
-                
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def _restore_authority(self):
-        """양반 - 권세 회복"""
-        print(f"\n{Colors.CYAN}당신은 옛 가문의 권위를 되찾으려 합니다...{Colors.RESET}")
-        
-        if "왕실 인장" in [item.name for item in self.player.inventory]:
-            print(f"{Colors.GREEN}왕실 인장의 힘으로 일부 권한을 되찾았습니다!{Colors.RESET}")
-            
-            # 모든 NPC 신뢰도 소폭 상승
-            for npc in self.npcs.values():
-                if npc.faction == Faction.PALACE:
-                    npc.adjust_trust(15)
-                else:
-                    npc.adjust_trust(5)
-                    
-            print("사람들이 당신을 다시 존중하기 시작합니다.")
-        else:
-            print(f"{Colors.DIM}권위를 증명할 방법이 없습니다...{Colors.RESET}")
-            
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def _stealth_theft(self):
-        """도적 - 은밀한 도둑질"""
-        print(f"\n{Colors.CYAN}주변을 살피며 훔칠 만한 것을 찾습니다...{Colors.RESET}")
-        
-        # 성공률 계산 (집중도와 레벨 영향)
-        success_rate = 50 + (self.player.focus // 10) + (self.player.level * 2)
-        
-        if random.randint(1, 100) <= success_rate:
-            print(f"{Colors.GREEN}성공적으로 물건을 훔쳤습니다!{Colors.RESET}")
-            
-            stolen_money = random.randint(20, 100)
-            self.player.money += stolen_money
-            print(f"{Colors.YELLOW}{stolen_money}냥을 획득했습니다!{Colors.RESET}")
-            
-            # 가끔 특별한 아이템도 훔침
-            if random.randint(1, 100) <= 20:
-                special_item = random.choice([
-                    self.items_database["독약"],
-                    self.items_database["회복약"]
-                ])
-                self.player.add_item(special_item)
-                print(f"{Colors.GREEN}[{special_item.name}]도 함께 훔쳤습니다!{Colors.RESET}")
-                
-        else:
-            print(f"{Colors.RED}들켰습니다!{Colors.RESET}")
-            
-            # 경비병과 전투
-            guard = Enemy("경비병", 70, 15, 10, 30)
-            self.start_combat(guard)
-            
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def _survival_skills(self):
-        """전쟁고아 - 생존 기술"""
-        print(f"\n{Colors.CYAN}극한의 환경에서 익힌 생존 기술을 사용합니다...{Colors.RESET}")
-        
-        print("\n1. 약초 채집 (체력 회복)")
-        print("2. 함정 설치 (다음 전투에서 유리)")
-        print("3. 은신처 만들기 (안전한 휴식)")
-        
-        choice = input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}").strip()
-        
-        if choice == "1":
-            print(f"\n{Colors.GREEN}치료용 약초를 찾았습니다!{Colors.RESET}")
-            self.player.heal(30)
-            self.player.stamina = min(self.player.max_stamina, self.player.stamina + 20)
-            
-        elif choice == "2":
-            print(f"\n{Colors.GREEN}교묘한 함정을 설치했습니다!{Colors.RESET}")
-            self.player.buffs.append({"type": "trap", "turns": 5, "value": 30})
-            print("다음 전투에서 적이 함정에 걸릴 확률이 있습니다.")
-            
-        elif choice == "3":
-            print(f"\n{Colors.GREEN}안전한 은신처를 만들었습니다!{Colors.RESET}")
-            self.player.rest()
-            self.player.rest()  # 두 배 회복
-            self.player.sanity = min(100, self.player.sanity + 10)
-            print("편안한 휴식으로 정신력도 회복되었습니다.")
-            
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def _attempt_curse_removal(self):
-        """저주 해제 시도"""
-        print(f"\n{Colors.MAGENTA}저주를 풀기 위해 노력합니다...{Colors.RESET}")
-        
-        if self.current_location.name == "밀교 사원":
-            print("밀교 사제가 당신을 바라봅니다.")
-            print(f"{Colors.CYAN}'그 저주는... 스스로 받아들인 것. 쉽게 풀리지 않을 것이오.'{Colors.RESET}")
-            
-            if self.player.money >= 1000:
-                print("\n'1000냥과 당신의 피를 바친다면... 시도는 해볼 수 있소.'")
-                choice = input("시도하시겠습니까? (y/n) >> ").strip().lower()
-                
-                if choice == 'y':
-                    self.player.money -= 1000
-                    self.player.health -= 50
-                    
-                    if random.randint(1, 100) <= 30:
-                        print(f"\n{Colors.GREEN}저주가 풀렸습니다!{Colors.RESET}")
-                        self.player.is_cursed = False
-                        self.player.sanity += 20
-                    else:
-                        print(f"\n{Colors.RED}저주가 더욱 강해졌습니다...{Colors.RESET}")
-                        self.player.sanity -= 10
-                        self.player.nightmares.append("실패한 정화 의식")
-        else:
-            print(f"{Colors.DIM}이곳에서는 저주를 풀 수 없습니다...{Colors.RESET}")
-            print("밀교 사원을 찾아가보세요.")
-            
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def random_encounter(self):
-        """랜덤 조우"""
-        encounter_type = random.choice(["combat", "event", "discovery"])
-        
-        if encounter_type == "combat":
-            # 시간대와 위치에 따른 적 선택
-            if self.game_time >= 20 or self.game_time < 6:  # 밤
-                enemies = [
-                    Enemy("도적", 50, 12, 5, 20, [self.items_database["회복약"]], 
-                          ["attack", "feint", "strong_attack"]),
-                    Enemy("굶주린 늑대", 40, 15, 3, 15, None,
-                          ["attack", "attack", "strong_attack"]),
-                    Enemy("밤의 살인귀", 80, 20, 10, 50, None,
-                          ["attack", "feint", "strong_attack", "taunt"]),
-                    Enemy("귀신들린 자", 60, 18, 8, 35, None,
-                          ["attack", "taunt", "strong_attack"])
-                ]
-            else:  # 낮
-                enemies = [
-                    Enemy("관군 병사", 70, 16, 12, 30, [self.items_database["포도청 검"]],
-                          ["attack", "defend", "strong_attack"]),
-                    Enemy("탈영병", 60, 14, 8, 25, None,
-                          ["attack", "feint"]),
-                    Enemy("미친 수도승", 70, 18, 10, 35, None,
-                          ["attack", "taunt", "strong_attack"]),
-                    Enemy("노상강도", 55, 13, 7, 20, [self.items_database["회복약"]],
-                          ["attack", "feint", "defend"])
-                ]
-            
-            # 위험도에 따른 적 선택
-            danger_level = self.current_location.danger_level
-            suitable_enemies = enemies[:min(danger_level + 1, len(enemies))]
-            enemy = random.choice(suitable_enemies)
-            
-            print(f"\n{Colors.RED}[{enemy.name}]이(가) 나타났습니다!{Colors.RESET}")
-            
-            # 특정 적의 특수 등장
-            if enemy.name == "귀신들린 자":
-                print(f"{Colors.MAGENTA}불길한 기운이 주변을 감쌉니다...{Colors.RESET}")
-                self.player.sanity -= 5
-                
-            time.sleep(1)
-            self.start_combat(enemy)
-            
-        elif encounter_type == "event":
-            events = [
-                ("상인을 만났습니다.", self.merchant_encounter),
-                ("부상당한 병사를 발견했습니다.", self.wounded_soldier_event),
-                ("수상한 문서를 발견했습니다.", self.mysterious_document_event),
-                ("길 잃은 아이를 만났습니다.", self.lost_child_event)
-            ]
-            
-            event_text, event_func = random.choice(events)
-            print(f"\n{Colors.CYAN}{event_text}{Colors.RESET}")
-            time.sleep(1)
-            event_func()
-            
-        else:  # discovery
-            print(f"\n{Colors.GREEN}숨겨진 무언가를 발견했습니다!{Colors.RESET}")
-            time.sleep(1)
-            
-            discoveries = [
-                ("낡은 지도", "특별한 장소가 표시된 지도다.", self._old_map_discovery),
-                ("신비한 약초", "체력을 회복시키는 약초다.", self._herb_discovery),
-                ("부적", "불길한 기운이 느껴지는 부적이다.", self._talisman_discovery)
-            ]
-            
-            name, desc, func = random.choice(discoveries)
-            print(f"\n[{name}]: {desc}")
-            func()
-            
-    def _old_map_discovery(self):
-        """낡은 지도 발견"""
-        choice = input("\n지도를 살펴보시겠습니까? (y/n) >> ").strip().lower()
-        if choice == 'y':
-            # 랜덤하게 잠긴 장소 하나 해금
-            locked_locations = [loc for loc in self.locations.values() if loc.is_locked]
-            if locked_locations:
-                unlock_loc = random.choice(locked_locations)
-                unlock_loc.unlock()
-                print(f"{Colors.YELLOW}[{unlock_loc.name}]의 위치를 발견했습니다!{Colors.RESET}")
-            else:
-                print("지도가 너무 낡아 알아볼 수 없습니다...")
-                
-    def _herb_discovery(self):
-        """약초 발견"""
-        choice = input("\n약초를 먹어보시겠습니까? (y/n) >> ").strip().lower()
-        if choice == 'y':
-            self.player.heal(30)
-            print(f"{Colors.GREEN}체력이 30 회복되었습니다!{Colors.RESET}")
-            
-    def _talisman_discovery(self):
-        """부적 발견"""
-        choice = input("\n부적을 가져가시겠습니까? (y/n) >> ").strip().lower()
-        if choice == 'y':
-            if random.randint(1, 100) <= 50:
-                print(f"{Colors.GREEN}부적이 당신을 보호합니다!{Colors.RESET}")
-                self.player.buffs.append({"type": "defense", "turns": 10, "value": 5})
-            else:
-                print(f"{Colors.RED}저주받은 부적이었습니다!{Colors.RESET}")
-                self.player.sanity -= 10
-                self.player.nightmares.append("저주받은 부적")
-                
-    def merchant_encounter(self):
-        """행상인 조우"""
-        print("\n'여행자여, 좋은 물건이 있소!'")
-        print("\n1. 거래하기")
-        print("2. 무시하고 지나가기")
-        print("3. 협박하기 (도적 출신)")
-        
-        choice = input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}").strip()
-        
-        if choice == "1":
-            # 간단한 거래
-            print("\n행상인이 물건을 보여줍니다...")
-            items_for_sale = [
-                ("회복약", 30),
-                ("독약", 50),
-                ("가죽 갑옷", 100)
-            ]
-            
-            for i, (name, price) in enumerate(items_for_sale, 1):
-                print(f"{i}. {name} - {price}냥")
-            print("0. 취소")
-            
-            try:
-                buy_choice = int(input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}"))
-                if 1 <= buy_choice <= len(items_for_sale):
-                    item_name, price = items_for_sale[buy_choice - 1]
-                    if self.player.money >= price:
-                        self.player.money -= price
-                        self.player.add_item(self.items_database[item_name])
-                        print(f"{Colors.GREEN}[{item_name}]을(를) 구매했습니다!{Colors.RESET}")
-                    else:
-                        print(f"{Colors.RED}금액이 부족합니다!{Colors.RESET}")
-            except ValueError:
-                pass
-                
-        elif choice == "3" and self.player.origin == Origin.BANDIT_OUTCAST:
-            print(f"\n{Colors.RED}당신은 행상인을 위협합니다!{Colors.RESET}")
-            if random.randint(1, 100) <= 60:
-                print(f"{Colors.GREEN}행상인이 겁에 질려 물건을 내놓습니다!{Colors.RESET}")
-                self.player.add_item(self.items_database["회복약"])
-                self.player.money += 20
-            else:
-                print(f"{Colors.RED}행상인이 숨겨둔 무기를 꺼냅니다!{Colors.RESET}")
-                enemy = Enemy("무장한 행상인", 60, 14, 8, 25)
-                self.start_combat(enemy)
-                
-        else:
-            print("\n행상인을 무시하고 지나갑니다.")
-            
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def wounded_soldier_event(self):
-        """부상병 이벤트"""
-        print("\n피를 흘리며 쓰러져 있는 병사를 발견했습니다.")
-        print("\n1. 도와주기")
-        print("2. 무시하기")
-        print("3. 소지품을 뒤지기")
-        
-        choice = input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}").strip()
-        
-        if choice == "1":
-            if "회복약" in [item.name for item in self.player.inventory]:
-                print(f"\n{Colors.GREEN}회복약을 사용해 병사를 치료했습니다.{Colors.RESET}")
-                # 회복약 제거
-                for item in self.player.inventory:
-                    if item.name == "회복약":
-                        self.player.inventory.remove(item)
-                        break
-                        
-                print("병사가 감사를 표하며 정보를 알려줍니다.")
-                print(f"{Colors.CYAN}'밀교파가 수상한 움직임을 보이고 있소. 조심하시오.'{Colors.RESET}")
-                self.game_flags["병사_구조"] = True
-                self.player.sanity += 5
-                self.player.faction_affinity[Faction.PALACE] += 10
-            else:
-                print("치료할 수단이 없습니다...")
-                
-        elif choice == "3":
-            print(f"\n{Colors.RED}죽어가는 병사의 소지품을 뒤집니다...{Colors.RESET}")
-            self.player.sanity -= 10
-            if random.randint(1, 100) <= 50:
-                self.player.add_item(self.items_database["포도청 검"])
-                print(f"{Colors.GREEN}[포도청 검]을 획득했습니다.{Colors.RESET}")
-                self.player.money += 30
-                print(f"{Colors.YELLOW}30냥을 획득했습니다.{Colors.RESET}")
-            else:
-                print("아무것도 없습니다.")
-                
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def mysterious_document_event(self):
-        """수상한 문서 이벤트"""
-        print("\n길바닥에 떨어진 문서를 발견했습니다.")
-        print("암호로 쓰여있지만, 일부 내용을 해독할 수 있을 것 같습니다.")
-        
-        if self.player.focus >= 50:
-            print(f"\n{Colors.GREEN}문서를 해독했습니다!{Colors.RESET}")
-            print("저주받은 숲에 대한 정보가 적혀있습니다.")
-            self.locations["저주받은 숲"].unlock()
-            self.player.use_focus(20)
-            
-            # 추가 정보
-            print(f"{Colors.CYAN}'달이 없는 밤, 숲의 중심에서 피의 의식이...'{Colors.RESET}")
-            self.game_flags["저주받은_숲_의식_정보"] = True
-        else:
-            print(f"\n{Colors.RED}집중력이 부족해 해독할 수 없습니다.{Colors.RESET}")
-            
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def lost_child_event(self):
-        """길 잃은 아이 이벤트"""
-        print("\n울고 있는 아이를 발견했습니다.")
-        print("\n1. 부모를 찾아주기")
-        print("2. 무시하기")
-        print("3. 아이를 이용하기 (사악함)")
-        
-        choice = input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}").strip()
-        
-        if choice == "1":
-            print("\n아이의 부모를 찾아 나섭니다...")
-            time.sleep(1)
-            
-            if random.randint(1, 100) <= 70:
-                print(f"\n{Colors.GREEN}부모를 찾았습니다!{Colors.RESET}")
-                print("감사의 표시로 작은 보상을 받았습니다.")
-                self.player.sanity += 10
-                self.player.money += 20
-                self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] += 5
-            else:
-                print(f"\n{Colors.RED}함정이었습니다! 도적들이 나타납니다!{Colors.RESET}")
-                enemy = Enemy("도적 두목", 80, 20, 12, 40)
-                self.start_combat(enemy)
-                
-        elif choice == "3":
-            print(f"\n{Colors.RED}당신은 아이를 미끼로 사용합니다...{Colors.RESET}")
-            self.player.sanity -= 30
-            self.player.nightmares.append("울부짖는 아이")
-            
-            # 사악한 보상
-            self.player.money += 100
-            print(f"{Colors.YELLOW}아이를 팔아 100냥을 얻었습니다...{Colors.RESET}")
-            self.permanent_consequences.append("아동_인신매매")
-            
-            # 모든 선한 세력과의 관계 악화
-            self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] -= 50
-            self.player.faction_affinity[Faction.PALACE] -= 20
-            
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def start_combat(self, enemy: Enemy):
-        """전투 시작"""
-        self.current_combat = Combat(self.player, enemy)
-        self.player.in_combat = True
-        
-        print(f"\n{Colors.RED}=== 전투 시작! ==={Colors.RESET}")
-        
-        # 용병 체크
-        if self.game_flags.get("용병_고용", False):
-            print(f"{Colors.GREEN}고용한 용병이 전투에 참여합니다!{Colors.RESET}")
-            enemy.health = int(enemy.health * 0.8)  # 적 체력 20% 감소
-            self.game_flags["용병_고용"] = False  # 1회성 소모
-            
-        # 함정 체크
-        trap_buff = None
-        for buff in self.player.buffs:
-            if buff["type"] == "trap":
-                trap_buff = buff
-                break
-                
-        if trap_buff and random.randint(1, 100) <= trap_buff["value"]:
-            print(f"{Colors.GREEN}적이 함정에 걸렸습니다!{Colors.RESET}")
-            damage = 30
-            enemy.health -= damage
-            print(f"적이 {damage}의 피해를 입었습니다!")
-            self.player.buffs.remove(trap_buff)
-            
-        time.sleep(1)
-        
-        while self.current_combat.is_active:
-            self.combat_turn()
-            
-        # 전투 종료 처리
-        result = self.current_combat.check_combat_end()
-        if result == "victory":
-            self.combat_victory(enemy)
-        elif result == "death":
-            self.player_death()
-            
-        self.current_combat = None
-        self.player.in_combat = False
-        
-    def combat_turn(self):
-        """전투 턴"""
-        self.clear_screen()
-        print(f"{Colors.RED}=== 전 투 ==={Colors.RESET}")
-        print(f"\n{self.current_combat.enemy.name}")
-        print(f"체력: {Colors.RED}{self.current_combat.enemy.health}/{self.current_combat.enemy.max_health}{Colors.RESET}")
-        
-        print(f"\n{self.player.name}")
-        print(f"체력: {Colors.GREEN}{self.player.health}/{self.player.max_health}{Colors.RESET}")
-        print(f"기력: {Colors.YELLOW}{self.player.stamina}/{self.player.max_stamina}{Colors.RESET}")
-        print(f"집중: {Colors.CYAN}{self.player.focus}/{self.player.max_focus}{Colors.RESET}")
-        
-        if self.player.turn_action_taken:
-            print(f"\n{Colors.DIM}이미 행동을 완료했습니다. 적의 턴입니다...{Colors.RESET}")
-            time.sleep(1)
-            enemy_action = self.current_combat.enemy_turn()
-            if enemy_action:
-                print(f"\n{enemy_action}")
-            self.current_combat.end_turn()
-            time.sleep(2)
-        else:
-            print(f"\n{Colors.BOLD}행동 선택:{Colors.RESET}")
-            print("1. 공격")
-            print("2. 회피")
-            print("3. 방어")
-            print("4. 기습")
-            print("5. 기술")
-            print("6. 아이템")
-            
-            choice = input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}").strip()
-            
-            result = ""
-            if choice == "1":
-                result = self.current_combat.player_attack()
-            elif choice == "2":
-                result = self.current_combat.player_dodge()
-            elif choice == "3":
-                result = self.current_combat.player_defend()
-            elif choice == "4":
-                result = self.current_combat.player_ambush()
-            elif choice == "5":
-                result = self.skill_menu_combat()
-            elif choice == "6":
-                result = self.combat_item_use()
-            else:
-                print(f"{Colors.RED}올바른 선택지를 입력하세요.{Colors.RESET}")
-                time.sleep(1)
-                return
-                
-            if result:
-                print(f"\n{result}")
-                time.sleep(2)
-                
-        # 전투 종료 확인
-        end_result = self.current_combat.check_combat_end()
-        if end_result:
-            self.current_combat.is_active = False
-            
-    def skill_menu_combat(self) -> str:
-        """전투 중 기술 메뉴"""
-        if not self.player.skills:
-            return "사용할 수 있는 기술이 없습니다!"
-            
-        print(f"\n{Colors.BOLD}사용 가능한 기술:{Colors.RESET}")
-        for i, skill in enumerate(self.player.skills, 1):
-            print(f"{i}. {skill.name} (기력: {skill.stamina_cost}, 집중: {skill.focus_cost})")
-            print(f"   {Colors.DIM}{skill.description}{Colors.RESET}")
-            
-        print("0. 취소")
-        
-        try:
-            choice = int(input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}"))
-            if choice == 0:
-                return ""
-            elif 1 <= choice <= len(self.player.skills):
-                skill = self.player.skills[choice - 1]
-                return self.current_combat.player_use_skill(skill)
-            else:
-                return "올바른 번호를 선택하세요."
-        except ValueError:
-            return "올바른 번호를 입력하세요."
-            
-    def combat_item_use(self) -> str:
-        """전투 중 아이템 사용"""
-        usable_items = [item for item in self.player.inventory 
-                       if item.item_type == ItemType.SPECIAL]
-                       
-        if not usable_items:
-            return "사용할 수 있는 아이템이 없습니다!"
-            
-        print(f"\n{Colors.BOLD}사용 가능한 아이템:{Colors.RESET}")
-        for i, item in enumerate(usable_items, 1):
-            print(f"{i}. {item.name}")
-            
-        print("0. 취소")
-        
-        try:
-            choice = int(input(f"\n{Colors.YELLOW}선택 >> {Colors.RESET}"))
-            if choice == 0:
-                return ""
-            elif 1 <= choice <= len(usable_items):
-                item = usable_items[choice - 1]
-                
-                if item.name == "회복약":
-                    self.player.heal(50)
-                    self.player.inventory.remove(item)
-                    self.player.turn_action_taken = True
-                    return f"{Colors.GREEN}체력을 50 회복했습니다!{Colors.RESET}"
-                elif item.name == "독약":
-                    # 독약을 무기에 바름
-                    if self.player.equipped_weapon:
-                        self.player.buffs.append({"type": "poison", "turns": 3, "value": 10})
-                        self.player.inventory.remove(item)
-                        self.player.turn_action_taken = True
-                        return f"{Colors.MAGENTA}무기에 독을 발랐습니다!{Colors.RESET}"
-                    else:
-                        return "무기가 없어 독을 바를 수 없습니다!"
-                else:
-                    return "전투 중에는 사용할 수 없습니다!"
-        except ValueError:
-            return "올바른 번호를 입력하세요."
-            
-    def combat_victory(self, enemy: Enemy):
-        """전투 승리"""
-        print(f"\n{Colors.GREEN}=== 승 리! ==={Colors.RESET}")
-        print(f"{enemy.name}을(를) 물리쳤습니다!")
-        
-        # 경험치 획득
-        self.player.gain_experience(enemy.experience_reward)
-        print(f"경험치 +{enemy.experience_reward}")
-        
-        # 레벨업 확인
-        if self.player.experience == 0:  # 레벨업 했다면
-            print(f"{Colors.YELLOW}레벨 업! 현재 레벨: {self.player.level}{Colors.RESET}")
-            
-            # 직업 승급 확인
-            if self.player.advance_job():
-                print(f"{Colors.MAGENTA}직업이 [{self.player.job.value}](으)로 승급했습니다!{Colors.RESET}")
-                
-        # 전리품 획득
-        if enemy.loot:
-            print(f"\n{Colors.YELLOW}전리품 발견:{Colors.RESET}")
-            for item in enemy.loot:
-                print(f"- {item.name}")
-                self.player.add_item(item)
-                
-        # 금전 획득
-        money_reward = random.randint(10, 50) + (enemy.experience_reward // 2)
-        self.player.money += money_reward
-        print(f"금전 +{money_reward}냥")
-        
-        # 특수 승리 보상
-        if enemy.name == "원혼 무리" and "혼령_퀘스트" in self.game_flags:
-            print(f"\n{Colors.MAGENTA}혼령들이 성불했습니다...{Colors.RESET}")
-            self.player.sanity += 20
-            print(f"{Colors.GREEN}정신력이 회복되었습니다!{Colors.RESET}")
-            
-        input(f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}")
-        
-    def player_death(self):
-        """플레이어 사망"""
-        self.clear_screen()
-        
-        # 사망 연출 강화
-        death_messages = [
-            "그대의 피가 차가운 땅에 스며든다...",
-            "시야가 흐려진다... 모든 것이 어둠 속으로...",
-            "마지막 숨결이 끊어진다...",
-            "이제 모든 것이 끝났다..."
-        ]
-        
-        # 타이핑 효과로 사망 메시지 출력
-        for message in death_messages:
-            for char in message:
-                print(f"{Colors.RED}{char}{Colors.RESET}", end='', flush=True)
-                time.sleep(0.05)
-            print()
-            time.sleep(0.8)
-        
-        print(f"\n{Colors.RED}{'='*60}{Colors.RESET}")
-        print(f"{Colors.RED}{Colors.BOLD}死 亡{Colors.RESET}")
-        print(f"{Colors.RED}{'='*60}{Colors.RESET}")
-        print()
-        
-        # 사망 원인별 메시지
-        if hasattr(self, 'death_cause'):
-            print(f"{Colors.DIM}{self.death_cause}{Colors.RESET}")
-        else:
-            print(f"{Colors.DIM}당신의 여정은 여기서 끝났습니다...{Colors.RESET}")
-            
-        print(f"{Colors.DIM}레벨 {self.player.level}에서 {self.current_location.name}에서 사망{Colors.RESET}")
-        print()
-        
-        # 영구 사망 경고
-        print(f"{Colors.RED}{'='*60}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.RED}이 죽음은 되돌릴 수 없습니다.{Colors.RESET}")
-        print(f"{Colors.DIM}그대의 이야기는 역사 속으로 사라집니다...{Colors.RESET}")
-        print(f"{Colors.RED}{'='*60}{Colors.RESET}")
-        
-        # 세이브 파일 자동 삭제 (영구 사망)
-        if os.path.exists(GameConstants.SAVE_FILE_PATH):
-            try:
-                os.remove(GameConstants.SAVE_FILE_PATH)
-                print(f"\n{Colors.RED}운명의 기록이 소멸되었습니다...{Colors.RESET}")
-            except:
-                pass
-        
-        # 페이드 아웃 효과
-        time.sleep(2)
-        for i in range(3):
-            print(f"{Colors.DIM}{'.' * (10 - i*3)}{Colors.RESET}")
-            time.sleep(1)
-            
-        input(f"\n{Colors.DIM}Enter를 눌러 어둠 속으로...{Colors.RESET}")
-        self.is_running = False
-        
-    def run(self):
-        """게임 실행"""
-        while True:
-            choice = self.main_menu()
-            
-            if choice == "1":  # 새 게임
-                self.create_character()
-                self.location_menu()
-                
-            elif choice == "2":  # 이어하기
-                if self.load_game():
-                    time.sleep(1)
-                    self.location_menu()
-                else:
-                    input(f"\n{Colors.DIM}Enter를 눌러 계속...{Colors.RESET}")
-                    
-            elif choice == "3":  # 종료
-                print(f"\n{Colors.DIM}조선의 어둠은 계속됩니다...{Colors.RESET}")
-                time.sleep(1)
-                break
-                
-            # 게임 오버 후 리셋
-            self.__init__()  # 게임 객체 재초기화
-
-
-def main():
-    """메인 함수"""
-    try:
-        game = Game()
-        game.run()
-    except KeyboardInterrupt:
-        print(f"\n\n{Colors.RED}강제 종료됨{Colors.RESET}")
-    except Exception as e:
-        print(f"\n{Colors.RED}오류 발생: {e}{Colors.RESET}")
-        import traceback
-        traceback.print_exc()
-
-
-if __name__ == "__main__":
-    game = Game()
-    while game.is_running:
-        choice = game.main_menu()
-        if choice == "1":
-            game.create_character()
-            game.location_menu()
-        elif choice == "2":
-            if game.load_game():
-                game.location_menu()
-        elif choice == "3":
-            print("게임을 종료합니다.")
-            break
\ No newline at end of file
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import copy
+import functools
+import gzip
+import json
+import os
+from array import array
+import random
+import signal
+import sys
+import time
+from collections import deque
+from enum import Enum, IntEnum
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    # 선택 의존성: 설치돼 있으면 저장/불러오기 인코딩에 사용 (수 배 빠름)
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj):
+    """json 인코더가 게임 객체를 만날 때 지연 변환한다
+
+    저장 시 to_dict를 미리 전부 펼쳐 중간 dict 트리를 만드는 대신,
+    인코더가 객체를 순회하는 시점에 한 번만 변환해 이중 순회를 없앤다.
+    """
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    raise TypeError(f"직렬화할 수 없는 객체: {type(obj).__name__}")
+
+
+def _json_encode(obj) -> bytes:
+    """저장용 JSON 인코딩 - orjson이 있으면 그쪽으로 내려간다"""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: faction_affinity 등 정수 키를 stdlib처럼 문자열화
+        return orjson.dumps(obj, default=_json_default,
+                            option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _json_decode(raw: bytes):
+    """저장 파일 JSON 디코딩"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+# 게임 상수 정의
+class GameConstants:
+    SAVE_FILE_PATH = "joseon_rpg_save.json"
+    VERSION = "1.0.0"
+
+
+# gzip 프레임 매직 바이트 - 저장 파일 형식 판별용
+_GZIP_MAGIC = b'\x1f\x8b'
+
+
+# 화면 지우기용 ANSI 시퀀스 (매 프레임 os.system 셸 생성 대신 직접 출력).
+# 커서 홈 이동(\x1b[H) 후 아래로 지우기(\x1b[J) - 전체 소거(2J)보다
+# 스크롤백을 건드리지 않고 깜빡임이 적다.
+_CLEAR_SEQ = "\x1b[H\x1b[J"
+if os.name == 'nt':
+    # 윈도우 콘솔의 ANSI(VT) 처리를 셸 생성 없이 한 번만 활성화
+    try:
+        import ctypes
+        _kernel32 = ctypes.windll.kernel32
+        _handle = _kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        _mode = ctypes.c_uint32()
+        if _kernel32.GetConsoleMode(_handle, ctypes.byref(_mode)):
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+            _kernel32.SetConsoleMode(_handle, _mode.value | 0x0004)
+    except (OSError, AttributeError):
+        os.system('')
+
+
+# 연출 대기 중 키 입력을 감지하는 플랫폼별 헬퍼.
+# 입력이 있으면 True를 돌려주고, 대기 자체를 건너뛴다.
+if os.name == 'nt':
+    import msvcrt
+
+    def _kbwait(seconds: float) -> bool:
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit():
+                msvcrt.getch()
+                return True
+            time.sleep(0.05)
+        return False
+else:
+    import select
+
+    def _kbwait(seconds: float) -> bool:
+        try:
+            ready, _, _ = select.select([sys.stdin], [], [], seconds)
+        except (OSError, ValueError):
+            time.sleep(seconds)
+            return False
+        # 줄바꿈은 읽지 않고 남겨 둔다 - 뒤따르는 input()이 소비한다
+        return bool(ready)
+
+
+class Colors:
+    """ANSI 색상 코드"""
+    RESET = '\033[0m'
+    BLACK = '\033[30m'
+    RED = '\033[31m'
+    GREEN = '\033[32m'
+    YELLOW = '\033[33m'
+    BLUE = '\033[34m'
+    MAGENTA = '\033[35m'
+    CYAN = '\033[36m'
+    WHITE = '\033[37m'
+    BOLD = '\033[1m'
+    DIM = '\033[2m'
+
+    # 바이트 출력 경로용 선인코딩 (os.write는 str을 받지 않는다)
+    RESET_B = RESET.encode('ascii')
+    RED_B = RED.encode('ascii')
+
+
+# 매 프레임 다시 조립되던 정적 UI 문자열 (색상 코드 포함, import 시 1회 구성)
+@functools.lru_cache(maxsize=256)
+def _colorize(text: str, color: str) -> str:
+    """색상 래핑 문자열 캐시 - 세션 중 같은 문구가 반복되는 경로용.
+
+    고정 문구는 모듈 상수가 우선이고, 이 헬퍼는 사망 원인처럼
+    런타임에 정해지지만 값의 가짓수가 적은 텍스트에 쓴다.
+    """
+    return f"{color}{text}{Colors.RESET}"
+
+
+_BAR = f"{Colors.RED}{'='*60}{Colors.RESET}"
+_THIN_BAR = f"{Colors.DIM}{'='*40}{Colors.RESET}"
+_TITLE = f"{Colors.BOLD}{Colors.RED}조선 말기: 피와 어둠의 연대기{Colors.RESET}"
+_PROMPT = f"{Colors.YELLOW}선택 >> {Colors.RESET}"
+_PROMPT_NL = f"\n{Colors.YELLOW}선택 >> {Colors.RESET}"
+_PROMPT_BUY = f"\n{Colors.YELLOW}구매할 아이템 >> {Colors.RESET}"
+_PRESS_ENTER = f"\n{Colors.DIM}계속하려면 Enter...{Colors.RESET}"
+# 호출마다 재조립되던 고정 텍스트 풀 - 모듈 튜플로 공유한다
+_NIGHTMARE_LINES = (
+    "죽인 자들의 얼굴이 어둠 속에서 나타납니다...",
+    "피로 물든 손이 씻겨지지 않습니다...",
+    "비명소리가 귓가에 맴돕니다...",
+    "당신이 저지른 일들이 악몽이 되어 찾아옵니다...",
+)
+_COURTESAN_RUMORS = (
+    ("밀교파가 매달 보름에 비밀 의식을 연다", "밀교_의식_정보"),
+    ("암시회 두목이 처형장 지하에 은신처를 만들었다", "암시회_지하_정보"),
+    ("왕실 호위대장이 반역을 꾀한다", "호위대장_반역_정보"),
+)
+_PEDDLER_WARES = (
+    ("회복약", 30),
+    ("독약", 50),
+    ("가죽 갑옷", 100),
+)
+_THEFT_LOOT = ("독약", "회복약")
+_DEATH_TYPING_LINES = (
+    "그대의 피가 차가운 땅에 스며든다...",
+    "시야가 흐려진다... 모든 것이 어둠 속으로...",
+    "마지막 숨결이 끊어진다...",
+    "이제 모든 것이 끝났다...",
+)
+# 사망 화면 고정 문구 - 호출마다 f-string으로 재조립하지 않는다
+_DEATH_HEADER = f"{Colors.RED}{Colors.BOLD}死 亡{Colors.RESET}"
+_MSG_PERMADEATH = f"{Colors.BOLD}{Colors.RED}이 죽음은 되돌릴 수 없습니다.{Colors.RESET}"
+_MSG_STORY_ENDS = f"{Colors.DIM}그대의 이야기는 역사 속으로 사라집니다...{Colors.RESET}"
+_FADE_DOTS = tuple(f"{Colors.DIM}{'.' * (10 - i * 3)}{Colors.RESET}"
+                   for i in range(3))
+
+# 오류 배너 뒤에 멈춰 있는 시간 - 환경변수로 0까지 줄일 수 있다
+_ERROR_DELAY = float(os.environ.get("RPG_ERROR_DELAY", "1"))
+
+_MSG_NO_MONEY = f"{Colors.RED}금액이 부족합니다!{Colors.RESET}"
+_MSG_BAD_NUMBER = f"{Colors.RED}올바른 번호를 입력하세요.{Colors.RESET}"
+_EQUIPPED_TAG = f" {Colors.GREEN}[장착중]{Colors.RESET}"
+_DANGER_STARS = tuple("★" * i for i in range(6))  # 위험도 0~5 표시
+
+
+class _RngPool:
+    """배치 생성 난수 풀 - 호출마다 random.randint를 거치는 오버헤드를 상쇄한다"""
+    __slots__ = ("_low", "_high", "_rng", "_buf", "_idx")
+
+    _BATCH = 4096
+
+    def __init__(self, low: int, high: int):
+        self._low = low
+        self._high = high
+        self._rng = random.Random()
+        self._buf = []
+        self._idx = 0
+        self._refill()
+
+    def _refill(self):
+        """버퍼를 한 번에 다시 채운다 (지연 리필)"""
+        low = self._low
+        span = self._high - self._low + 1
+        rand = self._rng.random
+        self._buf = [low + int(rand() * span) for _ in range(self._BATCH)]
+        self._idx = 0
+
+    def next(self) -> int:
+        """풀에서 정수 하나를 꺼낸다"""
+        if self._idx >= len(self._buf):
+            self._refill()
+        value = self._buf[self._idx]
+        self._idx += 1
+        return value
+
+    def next_index(self, n: int) -> int:
+        """0 <= i < n 인 인덱스 하나를 꺼낸다 (시퀀스 샘플링용)"""
+        return self.next() % n
+
+
+# 전투/강화에서 쓰는 1~100 판정용 풀과 적 공격 편차(-5~5)용 풀
+_rng_pool = _RngPool(1, 100)
+_jitter_pool = _RngPool(-5, 5)
+
+# 게임 전용 Random 인스턴스 하나를 공유하고, 자주 부르는 메서드는
+# 바운드 메서드로 묶어 둔다 (모듈 속성 조회 + 전역 인스턴스 간접 호출 제거)
+_rng = random.Random()
+_rand = _rng.random          # 프레임 경로의 확률 게이트용 C-레벨 난수
+_randint = _rng.randint
+_choice = _rng.choice
+
+
+# 전투 판정 순수 연산 커널 - 상태 추출 후 호출되며 부수 효과가 없다
+def _resolve_attack(total_attack: int, focus: int, stamina: int,
+                    roll: int, damage_roll: int) -> Tuple[bool, int]:
+    """일반 공격 판정: (명중 여부, 피해량)"""
+    hit_chance = 70 + (focus // 10) - ((100 - stamina) // 20)
+    if roll > hit_chance:
+        return False, 0
+    return True, total_attack + damage_roll
+
+
+def _resolve_ambush(total_attack: int, level: int, roll: int) -> Tuple[bool, int]:
+    """기습 판정: (성공 여부, 피해량)"""
+    if roll > 50 + (level * 2):
+        return False, 0
+    return True, total_attack * 2
+
+
+def _resolve_skill_damage(total_attack: int, multiplier: float) -> int:
+    """기술 피해량 계산"""
+    return int(total_attack * multiplier)
+
+
+def _resolve_enemy_damage(attack: int, jitter: int, rage_mode: bool, stance: str) -> int:
+    """적 공격 피해량 계산"""
+    base_damage = attack + jitter
+    if rage_mode:
+        base_damage = int(base_damage * 1.3)
+    if stance == "aggressive":
+        base_damage = int(base_damage * 1.2)
+    elif stance == "defensive":
+        base_damage = int(base_damage * 0.8)
+    return base_damage
+
+
+class Origin(Enum):
+    """캐릭터 출신"""
+    FALLEN_NOBLE = "몰락한 양반"
+    BANDIT_OUTCAST = "도적단 낙오자"
+    WAR_ORPHAN = "전쟁 고아"
+
+
+class Faction(IntEnum):
+    """세력 - 핫패스 비교가 잦아 IntEnum으로 두고 한글 표기는 별도 테이블로"""
+    PALACE = 1
+    CULT = 2
+    SHADOW_GUILD = 3
+    PEOPLE_ALLIANCE = 4
+    FOREIGNER_UNION = 5
+    NEUTRAL = 6
+
+    @property
+    def label(self) -> str:
+        """화면 표기용 한글 이름"""
+        return _FACTION_NAMES[self]
+
+    @classmethod
+    def from_save(cls, value) -> 'Faction':
+        """저장값 복원 - 신규 int와 구버전 한글 문자열 모두 허용"""
+        if isinstance(value, str) and value in _FACTION_BY_NAME:
+            return _FACTION_BY_NAME[value]
+        return cls(int(value))
+
+
+_FACTION_NAMES = {
+    Faction.PALACE: "궁",
+    Faction.CULT: "밀교파",
+    Faction.SHADOW_GUILD: "암시회",
+    Faction.PEOPLE_ALLIANCE: "백성연맹",
+    Faction.FOREIGNER_UNION: "이방인연합",
+    Faction.NEUTRAL: "중립"
+}
+_FACTION_BY_NAME = {name: member for member, name in _FACTION_NAMES.items()}
+
+
+class JobPath(IntEnum):
+    """직업 경로"""
+    WANDERER = 1
+    WARRIOR_APPRENTICE = 2
+    WARRIOR = 3
+    BLADE_MASTER = 4
+    SWORD_DEMON = 5
+
+    @property
+    def label(self) -> str:
+        """화면 표기용 한글 이름"""
+        return _JOB_NAMES[self]
+
+    @classmethod
+    def from_save(cls, value) -> 'JobPath':
+        """저장값 복원 - 신규 int와 구버전 한글 문자열 모두 허용"""
+        if isinstance(value, str) and value in _JOB_BY_NAME:
+            return _JOB_BY_NAME[value]
+        return cls(int(value))
+
+
+_JOB_NAMES = {
+    JobPath.WANDERER: "방랑자",
+    JobPath.WARRIOR_APPRENTICE: "무사 도제",
+    JobPath.WARRIOR: "정식 무사",
+    JobPath.BLADE_MASTER: "무형검사",
+    JobPath.SWORD_DEMON: "검극귀"
+}
+_JOB_BY_NAME = {name: member for member, name in _JOB_NAMES.items()}
+
+
+class ItemType(IntEnum):
+    """아이템 종류"""
+    WEAPON = 1
+    ARMOR = 2
+    SPECIAL = 3
+    STORY = 4
+
+    @property
+    def label(self) -> str:
+        """화면 표기용 한글 이름"""
+        return _ITEM_TYPE_NAMES[self]
+
+    @classmethod
+    def from_save(cls, value) -> 'ItemType':
+        """저장값 복원 - 신규 int와 구버전 한글 문자열 모두 허용"""
+        if isinstance(value, str) and value in _ITEM_TYPE_BY_NAME:
+            return _ITEM_TYPE_BY_NAME[value]
+        return cls(int(value))
+
+
+_ITEM_TYPE_NAMES = {
+    ItemType.WEAPON: "무기",
+    ItemType.ARMOR: "의복",
+    ItemType.SPECIAL: "특수 아이템",
+    ItemType.STORY: "서사 아이템"
+}
+_ITEM_TYPE_BY_NAME = {name: member for member, name in _ITEM_TYPE_NAMES.items()}
+
+
+class CombatAction(Enum):
+    """전투 행동"""
+    ATTACK = "공격"
+    DODGE = "회피"
+    DEFEND = "방어"
+    AMBUSH = "기습"
+    SKILL = "기술"
+
+
+class LocationKind(IntEnum):
+    """자주 판정하는 특수 장소 구분
+
+    장소 이름(한글 문자열) 비교 대신 enum 동일성 비교 한 번으로
+    특수 행동 분기를 태운다. 대부분의 장소는 GENERIC.
+    """
+    GENERIC = 0
+    TEMPLE = 1      # 밀교 사원
+    EXECUTION = 2   # 처형장
+    BROTHEL = 3     # 유곽
+
+
+# 이름 → 특수 구분 (생성 시 한 번만 조회)
+_LOCATION_KINDS = {
+    "밀교 사원": LocationKind.TEMPLE,
+    "처형장": LocationKind.EXECUTION,
+    "유곽": LocationKind.BROTHEL,
+}
+
+
+# 자주 쓰는 Enum 묶음 - 호출마다 리스트를 만들지 않고 O(1) 멤버십 검사
+_SHADOW_FACTIONS = frozenset({Faction.SHADOW_GUILD, Faction.FOREIGNER_UNION})
+_DEAL_FACTIONS = frozenset({Faction.SHADOW_GUILD, Faction.CULT})
+_EQUIPPABLE_TYPES = frozenset({ItemType.WEAPON, ItemType.ARMOR})
+
+# 직업/출신 정적 테이블 - 호출마다 dict와 Enum 리스트를 재구성하지 않는다
+_JOB_PROGRESSION = {
+    JobPath.WANDERER: JobPath.WARRIOR_APPRENTICE,
+    JobPath.WARRIOR_APPRENTICE: JobPath.WARRIOR,
+    JobPath.WARRIOR: JobPath.BLADE_MASTER,
+    JobPath.BLADE_MASTER: JobPath.SWORD_DEMON
+}
+_JOB_INDEX = {job: i for i, job in enumerate(JobPath)}
+
+_INITIAL_FACTIONS = {
+    Origin.FALLEN_NOBLE: {
+        Faction.PALACE: 60,
+        Faction.CULT: 30,
+        Faction.SHADOW_GUILD: 40,
+        Faction.PEOPLE_ALLIANCE: 20,
+        Faction.FOREIGNER_UNION: 30
+    },
+    Origin.BANDIT_OUTCAST: {
+        Faction.PALACE: 10,
+        Faction.CULT: 40,
+        Faction.SHADOW_GUILD: 70,
+        Faction.PEOPLE_ALLIANCE: 50,
+        Faction.FOREIGNER_UNION: 60
+    },
+    Origin.WAR_ORPHAN: {
+        Faction.PALACE: 20,
+        Faction.CULT: 50,
+        Faction.SHADOW_GUILD: 50,
+        Faction.PEOPLE_ALLIANCE: 70,
+        Faction.FOREIGNER_UNION: 40
+    }
+}
+_INITIAL_ATTACK = {Origin.FALLEN_NOBLE: 15, Origin.BANDIT_OUTCAST: 20, Origin.WAR_ORPHAN: 12}
+_INITIAL_DEFENSE = {Origin.FALLEN_NOBLE: 12, Origin.BANDIT_OUTCAST: 10, Origin.WAR_ORPHAN: 15}
+_INITIAL_MONEY = {Origin.FALLEN_NOBLE: 100, Origin.BANDIT_OUTCAST: 50, Origin.WAR_ORPHAN: 10}
+
+# Character.stats 배열 인덱스
+(STAT_MAX_HEALTH, STAT_HEALTH, STAT_MAX_STAMINA, STAT_STAMINA,
+ STAT_MAX_FOCUS, STAT_FOCUS, STAT_DEFENSE, STAT_SANITY,
+ STAT_BASE_ATTACK, STAT_BASE_DEFENSE, STAT_EXPERIENCE, STAT_LEVEL) = range(12)
+
+# 생성 직후 기본 능력치 (STAT_* 순서와 일치)
+_DEFAULT_STATS = (100, 100, 100, 100, 100, 100, 10, 100, 0, 0, 0, 1)
+
+
+def _stat_property(index: int) -> property:
+    """stats 배열의 한 칸을 기존 속성 이름으로 노출한다"""
+    def _get(self):
+        return self.stats[index]
+
+    def _set(self, value):
+        self.stats[index] = int(value)
+        # 능력치가 바뀌면 전투 수치 캐시를 무효화한다
+        self._stats_dirty = True
+
+    return property(_get, _set)
+
+
+# 강화 결과 사전 계산 테이블.
+# 강화 단계별로 1~100 판정값 → 결과 코드(0=성공, 1=일반 실패,
+# 2=내구도 손상, 3=파괴/저주 2차 판정)를 미리 펼쳐 둔다.
+def _build_enhance_tables() -> Tuple[bytes, ...]:
+    tables = []
+    for level in range(6):
+        success_rate = 80 - (level * 15)
+        row = bytearray(101)
+        for roll in range(1, 101):
+            if roll <= success_rate:
+                row[roll] = 0
+            elif roll <= success_rate + 10:
+                row[roll] = 1
+            elif roll <= success_rate + 20:
+                row[roll] = 2
+            else:
+                row[roll] = 3
+        tables.append(bytes(row))
+    return tuple(tables)
+
+
+_ENHANCE_TABLES = _build_enhance_tables()
+_MAX_ENHANCE_TABLE = len(_ENHANCE_TABLES) - 1
+
+
+class Item:
+    """아이템 클래스"""
+    __slots__ = ("name", "item_type", "description", "power", "defense",
+                 "special_effect", "enhancement_level", "durability")
+
+    def __init__(self, name: str, item_type: ItemType, description: str,
+                 power: int = 0, defense: int = 0, special_effect: str = ""):
+        self.name = name
+        self.item_type = item_type
+        self.description = description
+        self.power = power
+        self.defense = defense
+        self.special_effect = special_effect
+        self.enhancement_level = 0
+        self.durability = 100
+
+    def clone(self) -> 'Item':
+        """사본 생성 - __init__ 재실행 없이 슬롯 필드만 복사한다"""
+        new = object.__new__(Item)
+        for field in Item.__slots__:
+            setattr(new, field, getattr(self, field))
+        return new
+
+    def enhance(self) -> Tuple[bool, str]:
+        """아이템 강화 - 개선된 시스템"""
+        table = _ENHANCE_TABLES[min(self.enhancement_level, _MAX_ENHANCE_TABLE)]
+        outcome = table[_rng_pool.next()]
+
+        if outcome == 0:
+            # 성공
+            self.enhancement_level += 1
+            self.power = int(self.power * 1.2)
+            self.defense = int(self.defense * 1.2)
+            return True, "normal"
+        elif outcome == 1:
+            # 일반 실패
+            return False, "normal"
+        elif outcome == 2:
+            # 내구도 손상
+            self.durability -= 30
+            return False, "damaged"
+        else:
+            # 파괴 또는 변이
+            if _rng_pool.next() <= 50:
+                # 파괴
+                self.durability = 0
+                return False, "destroyed"
+            else:
+                # 저주/변이
+                self.name = f"저주받은 {self.name}"
+                self.special_effect = "착용자의 정신력을 갉아먹는다"
+                self.power = int(self.power * 1.5)
+                self.defense = int(self.defense * 0.5)
+                return False, "cursed"
+    
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "item_type": self.item_type.value,
+            "description": self.description,
+            "power": self.power,
+            "defense": self.defense,
+            "special_effect": self.special_effect,
+            "enhancement_level": self.enhancement_level,
+            "durability": self.durability
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Item':
+        return _item_from_dict(data)
+
+
+# 저장 파일 로드 시 아이템 수만큼 호출되는 역직렬화 핫 패스.
+# 생성자 경유 대신 필드 대입을 한 줄씩 펼친 전용 언패커를
+# import 시점에 exec로 생성해 dict 조회 외의 오버헤드를 없앤다.
+# 필드 목록은 슬롯 선언과 어긋나지 않게 거기서 가져온다.
+_ITEM_FIELDS = Item.__slots__
+
+
+def _make_item_unpacker():
+    lines = ["def _item_from_dict(data, _new=Item.__new__, _Item=Item,",
+             "                    _from_save=ItemType.from_save):",
+             "    item = _new(_Item)"]
+    for field in _ITEM_FIELDS:
+        if field == "item_type":
+            lines.append("    item.item_type = _from_save(data['item_type'])")
+        else:
+            lines.append(f"    item.{field} = data['{field}']")
+    lines.append("    return item")
+    namespace = {"Item": Item, "ItemType": ItemType}
+    exec("\n".join(lines), namespace)
+    return namespace["_item_from_dict"]
+
+
+_item_from_dict = _make_item_unpacker()
+
+
+class Skill:
+    """기술 클래스"""
+    __slots__ = ("name", "damage_multiplier", "stamina_cost", "focus_cost",
+                 "description")
+
+    def __init__(self, name: str, damage_multiplier: float, stamina_cost: int,
+                 focus_cost: int, description: str):
+        self.name = name
+        self.damage_multiplier = damage_multiplier
+        self.stamina_cost = stamina_cost
+        self.focus_cost = focus_cost
+        self.description = description
+    
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "damage_multiplier": self.damage_multiplier,
+            "stamina_cost": self.stamina_cost,
+            "focus_cost": self.focus_cost,
+            "description": self.description
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Skill':
+        return cls(**data)
+
+
+# 기본 아이템/기술 원본 템플릿.
+# 게임 인스턴스마다 새로 만들지 않고 모듈 로드 시 한 번만 구성한 뒤
+# _create_items/_create_skills 에서 얕은 복사로 나눠준다.
+_ITEM_TEMPLATES: Dict[str, Item] = {
+    "녹슨 검": Item("녹슨 검", ItemType.WEAPON, "오래된 녹슨 검이다.", power=10),
+    "포도청 검": Item("포도청 검", ItemType.WEAPON, "포도청에서 사용하던 제식 검.", power=25),
+    "명검 청홍": Item("명검 청홍", ItemType.WEAPON, "전설의 명검. 푸른 빛이 감돈다.", power=50),
+    "누더기 옷": Item("누더기 옷", ItemType.ARMOR, "찢어진 누더기 옷.", defense=5),
+    "가죽 갑옷": Item("가죽 갑옷", ItemType.ARMOR, "질긴 가죽으로 만든 갑옷.", defense=15),
+    "철갑옷": Item("철갑옷", ItemType.ARMOR, "두꺼운 철로 만든 갑옷.", defense=30),
+    "비밀 문서": Item("비밀 문서", ItemType.STORY, "암시회의 비밀이 적힌 문서.", special_effect="암시회 은신처 해금"),
+    "왕실 인장": Item("왕실 인장", ItemType.SPECIAL, "왕실의 권위를 상징하는 인장.", special_effect="궁궐 출입 가능"),
+    "독약": Item("독약", ItemType.SPECIAL, "치명적인 독이 든 병.", special_effect="암살 가능"),
+    "회복약": Item("회복약", ItemType.SPECIAL, "체력을 회복하는 약.", special_effect="체력 50 회복"),
+}
+
+_SKILL_TEMPLATES: Dict[str, Skill] = {
+    "일섬": Skill("일섬", 1.5, 20, 10, "빠른 베기 공격"),
+    "연환격": Skill("연환격", 2.0, 30, 20, "연속 공격"),
+    "회전베기": Skill("회전베기", 2.5, 40, 30, "강력한 회전 공격"),
+    "무형검": Skill("무형검", 3.0, 50, 40, "형체 없는 검기"),
+    "천지개벽": Skill("천지개벽", 5.0, 80, 60, "궁극의 일격"),
+}
+
+# 암시회에서만 배울 수 있는 금지 비술
+_FORBIDDEN_SKILLS = ("무형검", "천지개벽")
+
+
+# NPC가 기억하는 행동 수 상한
+_MEMORY_LIMIT = 64
+
+# NPC 상태의 위치 기반 직렬화 스키마 (이름은 딕셔너리 키로 이미 존재)
+_NPC_FIELDS = ("faction", "trust", "is_hostile", "memories")
+
+
+class NPC:
+    """NPC 클래스"""
+    __slots__ = ("name", "faction", "trust", "memories", "is_hostile")
+
+    def __init__(self, name: str, faction: Faction, initial_trust: int = 50):
+        self.name = name
+        self.faction = faction
+        self.trust = initial_trust
+        # 기억은 최근 64건만 유지 - 무한 증식과 저장 파일 팽창을 막는다
+        self.memories = deque(maxlen=_MEMORY_LIMIT)
+        self.is_hostile = False
+        
+    def remember_action(self, action: str):
+        """플레이어 행동 기억"""
+        # isoformat 문자열 대신 float 시각을 저장하고 표시 시점에만 포맷한다
+        self.memories.append({
+            "action": action,
+            "t": time.time()
+        })
+        
+    def adjust_trust(self, amount: int):
+        """신뢰도 조정"""
+        self.trust = max(0, min(100, self.trust + amount))
+        if self.trust < 20:
+            self.is_hostile = True
+            
+    def get_reaction(self) -> str:
+        """현재 신뢰도에 따른 반응"""
+        if self.is_hostile:
+            return f"{self.name}이(가) 적대적으로 바라봅니다."
+        elif self.trust >= 80:
+            return f"{self.name}이(가) 당신을 신뢰하는 눈빛으로 바라봅니다."
+        elif self.trust >= 50:
+            return f"{self.name}이(가) 중립적인 표정을 짓습니다."
+        else:
+            return f"{self.name}이(가) 의심스러운 눈초리로 당신을 살핍니다."
+    
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "faction": self.faction.value,
+            "trust": self.trust,
+            "memories": list(self.memories),
+            "is_hostile": self.is_hostile
+        }
+    
+    def to_state(self) -> tuple:
+        """_NPC_FIELDS 순서의 위치 기반 튜플 직렬화
+
+        딕셔너리보다 납작한 형태라 키 해싱/인코딩 비용이 없다.
+        """
+        return (self.faction.value, self.trust, self.is_hostile,
+                list(self.memories))
+
+    def apply_state(self, data):
+        """저장된 상태를 기존 객체에 덮어쓴다
+
+        객체를 교체하지 않으므로 장소의 npcs 딕셔너리가 들고 있는
+        참조가 그대로 유효하게 유지된다. 신형 튜플 형식과
+        구버전 딕셔너리 형식을 모두 받는다.
+        """
+        if isinstance(data, dict):
+            # 구버전 저장 파일
+            faction, trust, is_hostile, memories = (
+                data["faction"], data["trust"], data["is_hostile"],
+                data["memories"])
+        else:
+            faction, trust, is_hostile, memories = data
+        self.faction = Faction.from_save(faction)
+        self.trust = trust
+        self.is_hostile = is_hostile
+        self.memories = deque(memories, maxlen=_MEMORY_LIMIT)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'NPC':
+        npc = cls(
+            name=data["name"],
+            faction=Faction.from_save(data["faction"]),
+            initial_trust=data["trust"]
+        )
+        npc.memories = deque(data["memories"], maxlen=_MEMORY_LIMIT)
+        npc.is_hostile = data["is_hostile"]
+        return npc
+
+
+class Location:
+    """장소 클래스"""
+    __slots__ = ("name", "description", "danger_level", "faction", "kind",
+                 "npcs", "items", "connected_locations", "_connected_set",
+                 "is_locked")
+
+    def __init__(self, name: str, description: str, faction: Faction, 
+                 danger_level: int = 1, is_locked: bool = False):
+        self.name = name
+        self.description = description
+        self.faction = faction
+        self.kind = _LOCATION_KINDS.get(name, LocationKind.GENERIC)
+        self.danger_level = danger_level
+        self.is_locked = is_locked
+        self.npcs = {}  # 이름 → NPC (이름 조회/제거가 잦다)
+        self.items = []
+        self.connected_locations = ()  # 불변 - _CONNECTIONS 튜플을 공유
+        self._connected_set = frozenset()  # O(1) 멤버십 검사용
+
+    def add_npc(self, npc: NPC):
+        self.npcs[npc.name] = npc
+
+    def add_item(self, item: Item):
+        self.items.append(item)
+
+    def connect_location(self, location_name: str):
+        if location_name not in self._connected_set:
+            self._connected_set = self._connected_set | {location_name}
+            self.connected_locations = self.connected_locations + (location_name,)
+            
+    def unlock(self):
+        self.is_locked = False
+
+
+class Character:
+    """플레이어 캐릭터 클래스"""
+    __slots__ = ("name", "origin", "job", "stats", "money", "inventory",
+                 "equippable", "inventory_by_name", "items_by_type",
+                 "skills", "skill_names",
+                 "_equipped_weapon", "_equipped_armor",
+                 "faction_affinity", "is_cursed", "nightmares", "buffs",
+                 "buffs_by_type",
+                 "debuffs", "in_combat", "turn_action_taken", "_stats_dirty",
+                 "_cached_attack", "_cached_defense", "_cached_dodge")
+
+
+    # 능력치는 개별 int 속성 대신 하나의 연속 배열(SoA)에 담고
+    # 기존 이름 그대로 property로 노출한다
+    max_health = _stat_property(STAT_MAX_HEALTH)
+    health = _stat_property(STAT_HEALTH)
+    max_stamina = _stat_property(STAT_MAX_STAMINA)
+    stamina = _stat_property(STAT_STAMINA)
+    max_focus = _stat_property(STAT_MAX_FOCUS)
+    focus = _stat_property(STAT_FOCUS)
+    defense = _stat_property(STAT_DEFENSE)
+    sanity = _stat_property(STAT_SANITY)
+    base_attack = _stat_property(STAT_BASE_ATTACK)
+    base_defense = _stat_property(STAT_BASE_DEFENSE)
+    experience = _stat_property(STAT_EXPERIENCE)
+    level = _stat_property(STAT_LEVEL)
+
+    # 장비 교체도 캐시 무효화를 거치도록 property로 감싼다
+    @property
+    def equipped_weapon(self) -> Optional[Item]:
+        return self._equipped_weapon
+
+    @equipped_weapon.setter
+    def equipped_weapon(self, weapon: Optional[Item]):
+        self._equipped_weapon = weapon
+        self._stats_dirty = True
+
+    @property
+    def equipped_armor(self) -> Optional[Item]:
+        return self._equipped_armor
+
+    @equipped_armor.setter
+    def equipped_armor(self, armor: Optional[Item]):
+        self._equipped_armor = armor
+        self._stats_dirty = True
+
+    def __init__(self, name: str, origin: Origin):
+        # 전투 수치 캐시 - 능력치/장비/버프가 바뀔 때만 재계산한다
+        self._stats_dirty = True
+        self._cached_attack = 0
+        self._cached_defense = 0
+        self._cached_dodge = 0
+
+        self.name = name
+        self.origin = origin
+        self.job = JobPath.WANDERER
+        self.faction_affinity = self._get_initial_faction(origin)
+
+        # 능력치 배열 (인덱스는 STAT_* 상수 참조)
+        self.stats = array('i', _DEFAULT_STATS)
+        self.stats[STAT_BASE_ATTACK] = self._get_initial_attack(origin)
+        self.stats[STAT_BASE_DEFENSE] = self._get_initial_defense(origin)
+
+        # 인벤토리
+        self.inventory = []
+        self.equippable = []  # 무기/방어구만 모은 색인 (메뉴 스캔 비용 절감)
+        self.inventory_by_name = {}   # 이름 → [Item] (소지 여부 O(1) 판정)
+        self.items_by_type = {}       # ItemType → [Item]
+        self.equipped_weapon = None
+        self.equipped_armor = None
+        self.skills = []
+        self.skill_names = set()  # 기술명 O(1) 멤버십 검사용
+        self.money = self._get_initial_money(origin)  # 화폐 추가
+        
+        # 전투 상태
+        self.in_combat = False
+        self.turn_action_taken = False
+        
+        # 상태 이상
+        self.is_cursed = False  # 저주 상태
+        self.nightmares = []    # 악몽/환각
+        self.buffs = []         # 버프 리스트
+        self.buffs_by_type = {}  # type → [buff] (함정 등 종류별 O(1) 조회)
+        self.debuffs = []       # 디버프 리스트
+        
+    def _get_initial_faction(self, origin: Origin) -> Dict[Faction, int]:
+        """출신에 따른 초기 세력 친화도"""
+        # 게임 중 변하는 값이므로 테이블의 사본을 돌려준다
+        return dict(_INITIAL_FACTIONS[origin])
+
+    def _get_initial_attack(self, origin: Origin) -> int:
+        """출신에 따른 초기 공격력"""
+        return _INITIAL_ATTACK[origin]
+
+    def _get_initial_defense(self, origin: Origin) -> int:
+        """출신에 따른 초기 방어력"""
+        return _INITIAL_DEFENSE[origin]
+
+    def _get_initial_money(self, origin: Origin) -> int:
+        """출신에 따른 초기 자금"""
+        return _INITIAL_MONEY[origin]
+    
+    def take_damage(self, damage: int):
+        """데미지 받기"""
+        actual_damage = max(0, damage - self.defense)
+        self.health -= actual_damage
+        return actual_damage
+        
+    def heal(self, amount: int):
+        """체력 회복"""
+        self.health = min(self.max_health, self.health + amount)
+        
+    def use_stamina(self, amount: int) -> bool:
+        """기력 사용"""
+        if self.stamina >= amount:
+            self.stamina -= amount
+            return True
+        return False
+        
+    def use_focus(self, amount: int) -> bool:
+        """집중도 사용"""
+        if self.focus >= amount:
+            self.focus -= amount
+            return True
+        return False
+        
+    def rest(self, multiplier: int = 1):
+        """휴식 - multiplier로 회복량을 배수 적용 (은신처 등)"""
+        self.stamina = min(self.max_stamina, self.stamina + 30 * multiplier)
+        self.focus = min(self.max_focus, self.focus + 20 * multiplier)
+        self.health = min(self.max_health, self.health + 10 * multiplier)
+        
+    def add_item(self, item: Item):
+        """아이템 획득"""
+        self.inventory.append(item)
+        if item.item_type in _EQUIPPABLE_TYPES:
+            self.equippable.append(item)
+        self.inventory_by_name.setdefault(item.name, []).append(item)
+        self.items_by_type.setdefault(item.item_type, []).append(item)
+
+    def remove_first_by_name(self, name: str) -> Optional[Item]:
+        """이름으로 첫 아이템 하나를 제거하고 돌려준다 (없으면 None)"""
+        items = self.inventory_by_name.get(name)
+        if not items:
+            return None
+        item = items[0]
+        self.remove_item(item)
+        return item
+
+    def remove_item(self, item: Item):
+        """아이템 제거 - 색인들도 함께 갱신한다"""
+        self.inventory.remove(item)
+        if item.item_type in _EQUIPPABLE_TYPES:
+            self.equippable.remove(item)
+        named = self.inventory_by_name[item.name]
+        named.remove(item)
+        if not named:
+            del self.inventory_by_name[item.name]
+        self.items_by_type[item.item_type].remove(item)
+
+
+    def equip_weapon(self, weapon: Item):
+        """무기 장착"""
+        if weapon.item_type == ItemType.WEAPON and weapon.durability > 0:
+            self.equipped_weapon = weapon
+            
+    def equip_armor(self, armor: Item):
+        """방어구 장착"""
+        if armor.item_type == ItemType.ARMOR and armor.durability > 0:
+            self.equipped_armor = armor
+            
+    def learn_skill(self, skill: Skill):
+        """기술 습득"""
+        if skill.name not in self.skill_names:
+            self.skills.append(skill)
+            self.skill_names.add(skill.name)
+            
+    def add_buff(self, buff: dict):
+        """버프 추가 - 전투 수치 캐시를 무효화한다"""
+        self.buffs.append(buff)
+        self.buffs_by_type.setdefault(buff["type"], []).append(buff)
+        self._stats_dirty = True
+
+    def remove_buff(self, buff: dict):
+        """버프 제거 - 종류별 색인도 함께 갱신한다"""
+        self.buffs.remove(buff)
+        typed = self.buffs_by_type[buff["type"]]
+        typed.remove(buff)
+        if not typed:
+            del self.buffs_by_type[buff["type"]]
+        self._stats_dirty = True
+
+    def _reindex_buffs(self):
+        """버프 목록 일괄 교체 후 종류별 색인 재구성"""
+        index = {}
+        for buff in self.buffs:
+            index.setdefault(buff["type"], []).append(buff)
+        self.buffs_by_type = index
+
+    def _recompute_combat_stats(self):
+        """전투 수치 캐시 재계산 - 버프 목록을 한 번만 훑는다"""
+        weapon_power = self._equipped_weapon.power if self._equipped_weapon else 0
+        self._cached_attack = self.base_attack + weapon_power
+
+        armor_defense = self._equipped_armor.defense if self._equipped_armor else 0
+        total_defense = self.base_defense + armor_defense
+        dodge = 10 + (self.focus // 20)
+        for buff in self.buffs:
+            buff_type = buff["type"]
+            if buff_type == "defense":
+                total_defense += buff["value"]
+            elif buff_type == "dodge":
+                dodge += buff["value"]
+        self._cached_defense = total_defense
+        self._cached_dodge = min(dodge, 75)  # 최대 75%
+        self._stats_dirty = False
+
+    def get_total_attack(self) -> int:
+        """총 공격력 계산"""
+        if self._stats_dirty:
+            self._recompute_combat_stats()
+        return self._cached_attack
+
+    def get_total_defense(self) -> int:
+        """총 방어력 계산"""
+        if self._stats_dirty:
+            self._recompute_combat_stats()
+        return self._cached_defense
+
+    def get_dodge_chance(self) -> int:
+        """회피율 계산"""
+        if self._stats_dirty:
+            self._recompute_combat_stats()
+        return self._cached_dodge
+        
+    def advance_job(self):
+        """직업 승급"""
+        if self.job in _JOB_PROGRESSION and self.level >= (_JOB_INDEX[self.job] + 1) * 5:
+            self.job = _JOB_PROGRESSION[self.job]
+            self.max_health += 20
+            self.max_stamina += 20
+            self.max_focus += 20
+            self.base_attack += 5
+            self.base_defense += 5
+            return True
+        return False
+    
+    def gain_experience(self, amount: int):
+        """경험치 획득"""
+        self.experience += amount
+        while self.experience >= self.level * 100:
+            self.experience -= self.level * 100
+            self.level += 1
+            self.max_health += 10
+            self.max_stamina += 10
+            self.max_focus += 10
+            self.base_attack += 2
+            self.base_defense += 2
+            
+    def to_dict(self) -> dict:
+        """저장용 딕셔너리 변환"""
+        return {
+            "name": self.name,
+            "origin": self.origin.value,
+            "job": self.job.value,
+            "faction_affinity": {k.value: v for k, v in self.faction_affinity.items()},
+            "stats": {
+                "max_health": self.max_health,
+                "health": self.health,
+                "max_stamina": self.max_stamina,
+                "stamina": self.stamina,
+                "max_focus": self.max_focus,
+                "focus": self.focus,
+                "defense": self.defense,
+                "sanity": self.sanity,
+                "base_attack": self.base_attack,
+                "base_defense": self.base_defense
+            },
+            "inventory": [item.to_dict() for item in self.inventory],
+            "equipped_weapon": self.equipped_weapon.to_dict() if self.equipped_weapon else None,
+            "equipped_armor": self.equipped_armor.to_dict() if self.equipped_armor else None,
+            "skills": [skill.to_dict() for skill in self.skills],
+            "experience": self.experience,
+            "level": self.level,
+            "money": self.money,
+            "is_cursed": self.is_cursed,
+            "nightmares": self.nightmares,
+            "buffs": self.buffs,
+            "debuffs": self.debuffs
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Character':
+        """딕셔너리에서 캐릭터 복원"""
+        character = cls(data["name"], Origin(data["origin"]))
+        character.job = JobPath.from_save(data["job"])
+        character.faction_affinity = {Faction.from_save(k): v for k, v in data["faction_affinity"].items()}
+        
+        stats = data["stats"]
+        character.max_health = stats["max_health"]
+        character.health = stats["health"]
+        character.max_stamina = stats["max_stamina"]
+        character.stamina = stats["stamina"]
+        character.max_focus = stats["max_focus"]
+        character.focus = stats["focus"]
+        character.defense = stats["defense"]
+        character.sanity = stats["sanity"]
+        character.base_attack = stats["base_attack"]
+        character.base_defense = stats["base_defense"]
+        
+        character.inventory = []
+        for item_data in data["inventory"]:
+            character.add_item(Item.from_dict(item_data))
+        if data["equipped_weapon"]:
+            character.equipped_weapon = Item.from_dict(data["equipped_weapon"])
+        if data["equipped_armor"]:
+            character.equipped_armor = Item.from_dict(data["equipped_armor"])
+            
+        character.skills = [Skill.from_dict(skill) for skill in data["skills"]]
+        character.skill_names = {skill.name for skill in character.skills}
+        character.experience = data["experience"]
+        character.level = data["level"]
+        character.money = data.get("money", 50)  # 구버전 호환성
+        character.is_cursed = data.get("is_cursed", False)
+        character.nightmares = data.get("nightmares", [])
+        character.buffs = data.get("buffs", [])
+        character._reindex_buffs()
+        character.debuffs = data.get("debuffs", [])
+        
+        return character
+
+
+# 분노 모드 행동 가중 패턴 (공격 2/3, 강공격 1/3)
+_RAGE_PATTERNS = ("strong_attack", "attack", "attack")
+
+
+class Enemy:
+    """적 클래스"""
+    __slots__ = ("name", "health", "max_health", "attack", "defense",
+                 "experience_reward", "loot", "stance", "rage_mode",
+                 "combat_patterns", "on_spawn")
+
+    def __init__(self, name: str, health: int, attack: int, defense: int,
+                 experience_reward: int, loot: List[Item] = None,
+                 combat_patterns: List[str] = None,
+                 on_spawn: Optional[Callable[["Game"], None]] = None):
+        self.name = name
+        self.max_health = health
+        self.health = health
+        self.attack = attack
+        self.defense = defense
+        self.experience_reward = experience_reward
+        self.loot = loot or []
+        # 패턴은 불변이므로 튜플로 고정 (random.choice 재시퀀싱 비용 제거)
+        self.combat_patterns = tuple(combat_patterns) if combat_patterns else ("attack",)
+        # 등장 시 특수 연출 훅 - 이름 비교 분기 대신 원형이 지정한다
+        self.on_spawn = on_spawn
+        self.rage_mode = False
+        self.stance = "normal"  # normal, defensive, aggressive
+        
+    def take_damage(self, damage: int) -> int:
+        """데미지 받기"""
+        actual_damage = max(0, damage - self.defense)
+        self.health -= actual_damage
+        
+        # 체력이 30% 이하로 떨어지면 분노 모드
+        if self.health <= self.max_health * 0.3 and not self.rage_mode:
+            self.rage_mode = True
+            self.attack = int(self.attack * 1.5)
+            
+        return actual_damage
+        
+    def is_alive(self) -> bool:
+        """생존 여부"""
+        return self.health > 0
+        
+    def get_attack_damage(self) -> int:
+        """공격 데미지 계산"""
+        return _resolve_enemy_damage(self.attack, _jitter_pool.next(),
+                                     self.rage_mode, self.stance)
+        
+    def choose_action(self, player_last_action: str = None) -> str:
+        """AI 행동 선택"""
+        if self.rage_mode:
+            # 분노 모드에서는 공격적
+            return _RAGE_PATTERNS[_rng_pool.next_index(len(_RAGE_PATTERNS))]
+
+        if player_last_action == "defend":
+            # 플레이어가 방어 중이면 강공격
+            return "strong_attack"
+        elif player_last_action == "dodge":
+            # 플레이어가 회피 중이면 견제
+            return "feint"
+
+        # 일반 패턴
+        patterns = self.combat_patterns
+        if len(patterns) == 1:
+            return patterns[0]
+        return patterns[_rng_pool.next_index(len(patterns))]
+
+
+# 자주 걸리는 버프의 원형 사전.
+# 사용처에서는 dict(...)로 얕은 복사를 떠서 턴 수를 독립적으로 깎는다.
+_BUFF_COMBAT_DODGE = {"type": "dodge", "turns": 2, "value": 30}
+_BUFF_COMBAT_DEFEND = {"type": "defense", "turns": 1, "value": 15}
+_BUFF_RITUAL_ATTACK = {"type": "attack", "turns": 10, "value": 20}
+_BUFF_RITUAL_DEFENSE = {"type": "defense", "turns": 10, "value": 10}
+_BUFF_TRAP = {"type": "trap", "turns": 5, "value": 30}
+_BUFF_TALISMAN = {"type": "defense", "turns": 10, "value": 5}
+_BUFF_POISON_BLADE = {"type": "poison", "turns": 3, "value": 10}
+
+
+# 매 턴 반복 조립되는 전투 메시지 템플릿.
+# 색상 코드까지 미리 이어 붙여 두고 가변 부분만 format으로 채운다.
+_MSG_ALREADY_ACTED = "이미 이번 턴에 행동했습니다!"
+_MSG_NO_STAMINA = "기력이 부족합니다!"
+_MSG_ATTACK_HIT = "공격 성공! {dmg}의 피해를 입혔습니다. (적 체력: {hp}/{max_hp})"
+_MSG_ATTACK_WEAPON_BREAK = ("공격 성공! {dmg}의 피해를 입혔습니다.\n"
+                            f"{Colors.RED}무기가 파괴되었습니다!{Colors.RESET}")
+_MSG_ATTACK_RAGE = ("공격 성공! {dmg}의 피해를 입혔습니다.\n"
+                    f"{Colors.RED}{{name}}이(가) 분노합니다!{Colors.RESET}")
+_MSG_AMBUSH_HIT = "기습 성공! {dmg}의 큰 피해를 입혔습니다!"
+_MSG_SKILL_HIT = "{skill} 발동! {dmg}의 피해를 입혔습니다!"
+_MSG_ENEMY_DODGED = "{name}의 공격을 회피했습니다!"
+_MSG_ENEMY_HIT = "{name}의 공격! {dmg}의 피해를 받았습니다. (체력: {hp}/{max_hp})"
+_MSG_ENEMY_ARMOR_BREAK = ("{name}의 공격! {dmg}의 피해를 받았습니다.\n"
+                          f"{Colors.RED}방어구가 파괴되었습니다!{Colors.RESET}")
+_MSG_ENEMY_STRONG_HIT = "{name}의 강공격! {dmg}의 큰 피해를 받았습니다!"
+_MSG_ENEMY_FEINT = "{name}이(가) 견제합니다! 집중력이 흐트러집니다."
+_MSG_ENEMY_DEFEND = "{name}이(가) 방어 자세를 취했습니다."
+_MSG_ENEMY_TAUNT = "{name}이(가) 당신을 조롱합니다! 정신력이 흔들립니다."
+_MSG_ENEMY_CONFUSED = "{name}이(가) 이상한 행동을 취합니다..."
+
+# 전투 HUD 한 줄 템플릿 - 색상 접두/접미는 상수부에 미리 붙인다
+_COMBAT_HEADER = f"{Colors.RED}=== 전 투 ==={Colors.RESET}"
+_HUD_ENEMY_HP = f"체력: {Colors.RED}{{}}/{{}}{Colors.RESET}"
+_HUD_HP = f"체력: {Colors.GREEN}{{}}/{{}}{Colors.RESET}"
+_HUD_STAMINA = f"기력: {Colors.YELLOW}{{}}/{{}}{Colors.RESET}"
+_HUD_FOCUS = f"집중: {Colors.CYAN}{{}}/{{}}{Colors.RESET}"
+
+
+def _ghost_appear(game: "Game"):
+    """귀신들린 자 등장 연출 - 정신력을 깎는다"""
+    print(f"{Colors.MAGENTA}불길한 기운이 주변을 감쌉니다...{Colors.RESET}")
+    game.player.sanity -= 5
+
+
+# 일회성 조우 적의 원형 사양 등록부.
+# 호출마다 인자 리터럴(특히 패턴 리스트)을 새로 만들지 않도록
+# (체력, 공격, 방어, 경험치, 전리품, 패턴 튜플)을 한 번만 정의해 둔다.
+# 전리품이 items_database를 참조하는 적은 Game.__init__의 조우 테이블에 있다.
+_ENEMY_TEMPLATES = {
+    "원혼 무리": (100, 25, 20, 80, None, ("attack", "taunt", "taunt")),
+    "밀교 신도": (60, 15, 8, 30, None, ("attack", "strong_attack")),
+    "분노한 망나니": (90, 22, 12, 50, None, ("attack", "strong_attack", "taunt")),
+    "경비병": (70, 15, 10, 30, None, None),
+    "무장한 행상인": (60, 14, 8, 25, None, None),
+    "도적 두목": (80, 20, 12, 40, None, None),
+    "적대 주민": (80, 15, 10, 50, None, None),
+}
+
+
+class EnemyPool:
+    """적 객체 풀 - 조우마다 새로 할당하는 대신 이름별로 재사용한다"""
+    __slots__ = ("_free",)
+
+    def __init__(self):
+        self._free: Dict[str, List[Enemy]] = {}
+
+    def acquire(self, name: str, health: int, attack: int, defense: int,
+                experience_reward: int, loot: List[Item] = None,
+                combat_patterns: List[str] = None,
+                on_spawn: Optional[Callable[["Game"], None]] = None) -> Enemy:
+        """풀에서 꺼내 필드를 재설정하거나, 없으면 새로 만든다"""
+        bucket = self._free.get(name)
+        if not bucket:
+            return Enemy(name, health, attack, defense, experience_reward,
+                         loot, combat_patterns, on_spawn)
+        enemy = bucket.pop()
+        enemy.max_health = health
+        enemy.health = health
+        enemy.attack = attack
+        enemy.defense = defense
+        enemy.experience_reward = experience_reward
+        enemy.loot = loot or []
+        enemy.combat_patterns = (tuple(combat_patterns) if combat_patterns
+                                 else ("attack",))
+        enemy.on_spawn = on_spawn
+        enemy.rage_mode = False
+        enemy.stance = "normal"
+        return enemy
+
+    def acquire_template(self, name: str, display_name: str = None) -> Enemy:
+        """_ENEMY_TEMPLATES에 등록된 사양으로 적을 꺼낸다
+
+        display_name이 주어지면 표시 이름만 바꿔 쓴다
+        (예: 적대화된 NPC, 번호 붙은 신도).
+        """
+        return self.acquire(display_name or name, *_ENEMY_TEMPLATES[name])
+
+    def release(self, enemy: Enemy):
+        """전투가 끝난 적을 풀로 되돌린다"""
+        self._free.setdefault(enemy.name, []).append(enemy)
+
+
+# Combat 상태 플래그 비트 (hasattr 검사 대신 정수 비트마스크 사용)
+_FLAG_RAGE_ANNOUNCED = 1
+
+
+class Combat:
+    """전투 시스템"""
+    __slots__ = ("player", "enemy", "turn_count", "combat_log", "is_active",
+                 "player_last_action", "_flags")
+
+    def __init__(self, player: Character, enemy: Enemy):
+        self.player = player
+        self.enemy = enemy
+        self.turn_count = 0
+        self.combat_log = []
+        self.is_active = True
+        self.player_last_action = None
+        self._flags = 0
+        
+    def player_attack(self) -> str:
+        """플레이어 공격"""
+        if self.player.turn_action_taken:
+            return _MSG_ALREADY_ACTED
+            
+        self.player.turn_action_taken = True
+        self.player_last_action = "attack"
+        
+        # 스태미나 체크
+        stamina_cost = 10
+        if self.player.stamina < stamina_cost:
+            return _MSG_NO_STAMINA
+            
+        self.player.use_stamina(stamina_cost)
+        
+        # 명중률 계산 (집중도와 피로도 영향)
+        hit, damage = _resolve_attack(self.player.get_total_attack(),
+                                      self.player.focus, self.player.stamina,
+                                      _rng_pool.next(), _randint(-5, 10))
+
+        if hit:
+            actual_damage = self.enemy.take_damage(damage)
+            
+            # 무기 내구도 감소
+            if self.player.equipped_weapon:
+                self.player.equipped_weapon.durability -= 1
+                if self.player.equipped_weapon.durability <= 0:
+                    return _MSG_ATTACK_WEAPON_BREAK.format(dmg=actual_damage)
+                    
+            # 적 분노 모드 체크
+            if self.enemy.rage_mode and not (self._flags & _FLAG_RAGE_ANNOUNCED):
+                self._flags |= _FLAG_RAGE_ANNOUNCED
+                return _MSG_ATTACK_RAGE.format(dmg=actual_damage, name=self.enemy.name)
+                
+            return _MSG_ATTACK_HIT.format(dmg=actual_damage, hp=self.enemy.health,
+                                          max_hp=self.enemy.max_health)
+        else:
+            return "공격이 빗나갔습니다!"
+            
+    def player_dodge(self) -> str:
+        """플레이어 회피"""
+        if self.player.turn_action_taken:
+            return _MSG_ALREADY_ACTED
+            
+        self.player.turn_action_taken = True
+        self.player_last_action = "dodge"
+        
+        if not self.player.use_stamina(15):
+            return _MSG_NO_STAMINA
+            
+        # 회피 버프 추가 (2턴 지속)
+        self.player.add_buff(dict(_BUFF_COMBAT_DODGE))
+        return "회피 자세를 취했습니다. 다음 공격을 피할 확률이 증가합니다."
+        
+    def player_defend(self) -> str:
+        """플레이어 방어"""
+        if self.player.turn_action_taken:
+            return _MSG_ALREADY_ACTED
+            
+        self.player.turn_action_taken = True
+        self.player_last_action = "defend"
+        
+        # 방어 버프 추가 (1턴 지속)
+        self.player.add_buff(dict(_BUFF_COMBAT_DEFEND))
+        self.player.stamina = max(0, self.player.stamina - 5)
+        return "방어 자세를 취했습니다. 받는 피해가 감소합니다."
+        
+    def player_ambush(self) -> str:
+        """플레이어 기습"""
+        if self.player.turn_action_taken:
+            return _MSG_ALREADY_ACTED
+            
+        self.player.turn_action_taken = True
+        
+        if not self.player.use_stamina(20) or not self.player.use_focus(20):
+            return "기력이나 집중도가 부족합니다!"
+            
+        hit, damage = _resolve_ambush(self.player.get_total_attack(),
+                                      self.player.level, _rng_pool.next())
+        if hit:
+            actual_damage = self.enemy.take_damage(damage)
+            return _MSG_AMBUSH_HIT.format(dmg=actual_damage)
+        else:
+            return "기습에 실패했습니다! 적에게 반격당합니다!"
+            
+    def player_use_skill(self, skill: Skill) -> str:
+        """플레이어 기술 사용"""
+        if self.player.turn_action_taken:
+            return _MSG_ALREADY_ACTED
+            
+        self.player.turn_action_taken = True
+        
+        if not self.player.use_stamina(skill.stamina_cost) or not self.player.use_focus(skill.focus_cost):
+            return f"{skill.name} 사용에 필요한 기력이나 집중도가 부족합니다!"
+            
+        damage = _resolve_skill_damage(self.player.get_total_attack(),
+                                       skill.damage_multiplier)
+        actual_damage = self.enemy.take_damage(damage)
+        return _MSG_SKILL_HIT.format(skill=skill.name, dmg=actual_damage)
+        
+    def enemy_turn(self) -> str:
+        """적 턴"""
+        if not self.enemy.is_alive():
+            return ""
+            
+        # 회피 체크
+        if _rng_pool.next() <= self.player.get_dodge_chance():
+            return _MSG_ENEMY_DODGED.format(name=self.enemy.name)
+            
+        # 적 AI 행동 결정
+        action = self.enemy.choose_action(self.player_last_action)
+        
+        if action == "attack":
+            damage = self.enemy.get_attack_damage()
+            actual_damage = self.player.take_damage(damage)
+            
+            # 방어구 내구도 감소
+            if self.player.equipped_armor:
+                self.player.equipped_armor.durability -= 1
+                if self.player.equipped_armor.durability <= 0:
+                    return _MSG_ENEMY_ARMOR_BREAK.format(name=self.enemy.name,
+                                                         dmg=actual_damage)
+                    
+            return _MSG_ENEMY_HIT.format(name=self.enemy.name, dmg=actual_damage,
+                                         hp=self.player.health,
+                                         max_hp=self.player.max_health)
+            
+        elif action == "strong_attack":
+            damage = int(self.enemy.get_attack_damage() * 1.5)
+            actual_damage = self.player.take_damage(damage)
+            return _MSG_ENEMY_STRONG_HIT.format(name=self.enemy.name, dmg=actual_damage)
+            
+        elif action == "feint":
+            # 견제 - 플레이어 집중도 감소
+            self.player.focus = max(0, self.player.focus - 15)
+            return _MSG_ENEMY_FEINT.format(name=self.enemy.name)
+            
+        elif action == "defend":
+            self.enemy.defense += 5
+            self.enemy.stance = "defensive"
+            return _MSG_ENEMY_DEFEND.format(name=self.enemy.name)
+            
+        elif action == "taunt":
+            # 도발 - 플레이어 정신력 감소
+            self.player.sanity -= 5
+            return _MSG_ENEMY_TAUNT.format(name=self.enemy.name)
+            
+        else:
+            return _MSG_ENEMY_CONFUSED.format(name=self.enemy.name)
+            
+    def end_turn(self):
+        """턴 종료"""
+        self.turn_count += 1
+        self.player.turn_action_taken = False
+        
+        # 버프/디버프 턴 감소 - 감소 후 한 번의 재구성으로 만료분을 걷어낸다
+        # (복사본 순회 + O(n) remove 반복 대신 단일 패스)
+        player = self.player
+        for buff in player.buffs:
+            buff["turns"] -= 1
+        player.buffs = [b for b in player.buffs if b["turns"] > 0]
+        player._reindex_buffs()
+        player._stats_dirty = True
+
+        for debuff in player.debuffs:
+            debuff["turns"] -= 1
+        player.debuffs = [d for d in player.debuffs if d["turns"] > 0]
+            
+    def check_combat_end(self) -> Optional[str]:
+        """전투 종료 확인"""
+        if self.player.health <= 0:
+            self.is_active = False
+            return "death"
+        elif not self.enemy.is_alive():
+            self.is_active = False
+            return "victory"
+        return None
+
+
+# 월드 지형 스펙 - 토폴로지는 정적 데이터이므로 모듈 상수로 고정.
+# (이름, 설명, 세력, 위험도, 잠김 여부)
+_LOCATION_SPEC: Tuple[Tuple[str, str, Faction, int, bool], ...] = (
+    # 시작 지점
+    ("폐허가 된 마을", "전쟁으로 황폐해진 마을. 썩은 냄새가 진동한다.",
+     Faction.NEUTRAL, 1, False),
+    # 세력별 주요 거점
+    ("경복궁", "왕권의 마지막 보루. 근위병들이 삼엄하게 경비를 서고 있다.",
+     Faction.PALACE, 3, True),
+    ("밀교 사원", "이상한 주문 소리가 들려오는 음침한 사원.",
+     Faction.CULT, 4, False),
+    ("암시회 은신처", "어둠 속에 숨겨진 지하 조직의 본거지.",
+     Faction.SHADOW_GUILD, 4, True),
+    ("민중 집회소", "봉기를 준비하는 백성들이 모이는 곳.",
+     Faction.PEOPLE_ALLIANCE, 2, False),
+    ("이방인 주막", "각지에서 온 이방인들이 모이는 주막.",
+     Faction.FOREIGNER_UNION, 2, False),
+    # 중립 지역
+    ("시장", "활기찬 시장. 온갖 물건들이 거래된다.",
+     Faction.NEUTRAL, 1, False),
+    ("유곽", "화려한 등불 아래 은밀한 거래가 이루어지는 곳.",
+     Faction.NEUTRAL, 2, False),
+    ("산속 은거지", "세상과 단절된 은둔자의 거처.",
+     Faction.NEUTRAL, 3, False),
+    # 위험 지역
+    ("처형장", "피비린내가 진동하는 공개 처형장.",
+     Faction.NEUTRAL, 5, False),
+    ("저주받은 숲", "들어간 자가 돌아오지 못한다는 숲.",
+     Faction.NEUTRAL, 5, True),
+)
+
+# NPC 활동 시간표 - 24비트 마스크 (LSB = 0시).
+# 비교 연쇄 대신 시프트+AND 한 번으로 판정한다. 미등록 NPC는 항상 활동.
+def _hours_mask(hours) -> int:
+    mask = 0
+    for hour in hours:
+        mask |= 1 << hour
+    return mask
+
+
+_ALL_HOURS = 0xFFFFFF
+_ACTIVE_HOURS: Dict[str, int] = {
+    "기생 월향": _hours_mask((20, 21, 22, 23, 0, 1, 2, 3)),  # 밤에만
+    "망나니": _hours_mask(range(10, 16)),                    # 낮에만
+    "밀교 사제": _hours_mask((22, 23, 0, 1, 2)),             # 밤에 더 활발
+}
+
+_CONNECTIONS: Dict[str, Tuple[str, ...]] = {
+    "폐허가 된 마을": ("시장", "민중 집회소", "이방인 주막"),
+    "시장": ("폐허가 된 마을", "유곽", "처형장", "밀교 사원"),
+    "민중 집회소": ("폐허가 된 마을", "시장"),
+    "이방인 주막": ("폐허가 된 마을", "유곽", "산속 은거지"),
+    "유곽": ("시장", "이방인 주막", "암시회 은신처"),
+    "산속 은거지": ("이방인 주막", "저주받은 숲"),
+    "밀교 사원": ("시장", "경복궁"),
+    "처형장": ("시장", "경복궁"),
+    "경복궁": ("밀교 사원", "처형장"),
+    "암시회 은신처": ("유곽",),
+    "저주받은 숲": ("산속 은거지",),
+}
+
+
+# 전 지점 쌍 최단 경로 테이블.
+# 그래프가 정적이므로 11개 노드 각각에서 BFS를 한 번씩 돌려
+# 거리와 첫 이동지를 import 시점에 굳혀 둔다 (조회는 O(1)).
+def _build_route_tables() -> Tuple[Dict[str, Dict[str, int]],
+                                   Dict[str, Dict[str, str]]]:
+    distances = {}
+    next_hops = {}
+    for start in _CONNECTIONS:
+        dist = {start: 0}
+        hop = {}
+        queue = deque((start,))
+        while queue:
+            node = queue.popleft()
+            for neighbor in _CONNECTIONS[node]:
+                if neighbor not in dist:
+                    dist[neighbor] = dist[node] + 1
+                    hop[neighbor] = neighbor if node == start else hop[node]
+                    queue.append(neighbor)
+        distances[start] = dist
+        next_hops[start] = hop
+    return distances, next_hops
+
+
+_DISTANCES, _NEXT_HOPS = _build_route_tables()
+
+
+# 저주 효과 문구 - 적용 로직은 _apply_curse_effects에서 문구 식별로 분기
+_CURSE_NIGHTMARE = "악몽이 현실로 스며듭니다..."
+_CURSE_DRAIN = "체력이 서서히 빠져나갑니다..."
+_CURSE_UNFOCUS = "집중력이 흐트러집니다..."
+_CURSE_EFFECTS = (_CURSE_NIGHTMARE, _CURSE_DRAIN, _CURSE_UNFOCUS)
+
+
+class Game:
+    """메인 게임 클래스"""
+    def __init__(self):
+        self.player = None
+        self.current_location = None
+        self.locations = {}
+        self.npcs = {}
+        self.current_combat = None
+        self.enemy_pool = EnemyPool()  # 적 객체 재사용 풀
+        self._buf: List[str] = []  # 화면 출력 조립 버퍼
+        # 연출 대기 생략 모드 (자동 테스트/빠른 재시작용)
+        self.fast_mode = bool(os.environ.get("RPG_FAST"))
+        # 타이핑/페이드 연출 일괄 출력 모드 (메인 메뉴에서 토글)
+        self.fast_text = False
+        self._last_frame = None  # 직전에 그린 프레임 (동일 프레임 재출력 방지)
+        # NPC 이름 → 특수 대화 핸들러
+        self._npc_dialog = {
+            "상인 김씨": self._dialog_merchant,
+            "봉기군 수장 박씨": self._dialog_rebel_leader,
+            "서역 용병 아둘라": self._dialog_mercenary,
+            "기생 월향": self._dialog_courtesan,
+            "밀교 사제": self._dialog_priest,
+            "망나니": self._dialog_executioner,
+        }
+        self.is_running = True
+        
+        # 게임 이벤트 플래그 (딕셔너리 구조로 개선)
+        self.game_flags = {
+            "병사_구조": False,
+            "용병_고용": False,
+            "밀교_의식_정보": False,
+            "암시회_지하_정보": False,
+            "왕실_첩자_정보": False,
+            "밀교_비밀_목격": False,
+            "유곽_정보_획득": False,
+            "봉기_참여": False,
+            "고문_가담": False,
+            "밀교_혈맹": False,
+            "궁궐_지하_무기고_정보": False,
+            "밀교_음모_인지": False,
+            "무기_밀수_정보": False,
+            "이방인_반란_정보": False,
+            "호위대장_반역_정보": False,
+            "혼령_퀘스트": False
+        }
+        self.permanent_consequences = []  # 영구적 결과 저장
+        self._set_time(12)  # 게임 내 시간 (0-23)
+        self.death_cause = ""  # 사망 원인
+        self._last_save_payload = None  # 직전 저장 내용 (변경 없으면 쓰기 생략)
+        
+        # 기본 아이템 생성
+        self.items_database = self._create_items()
+        
+        # 기본 기술 생성
+        self.skills_database = self._create_skills()
+
+        # 조우 테이블 - 호출마다 Enemy 4기를 새로 만들지 않도록
+        # acquire 인자 튜플로 한 번만 구성한다 (전리품 참조도 여기서 해석)
+        potion = self.items_database["회복약"]
+        police_sword = self.items_database["포도청 검"]
+        self._night_enemy_specs = (
+            ("도적", 50, 12, 5, 20, [potion],
+             ("attack", "feint", "strong_attack")),
+            ("굶주린 늑대", 40, 15, 3, 15, None,
+             ("attack", "attack", "strong_attack")),
+            ("밤의 살인귀", 80, 20, 10, 50, None,
+             ("attack", "feint", "strong_attack", "taunt")),
+            ("귀신들린 자", 60, 18, 8, 35, None,
+             ("attack", "taunt", "strong_attack"), _ghost_appear),
+        )
+        self._day_enemy_specs = (
+            ("관군 병사", 70, 16, 12, 30, [police_sword],
+             ("attack", "defend", "strong_attack")),
+            ("탈영병", 60, 14, 8, 25, None,
+             ("attack", "feint")),
+            ("미친 수도승", 70, 18, 10, 35, None,
+             ("attack", "taunt", "strong_attack")),
+            ("노상강도", 55, 13, 7, 20, [potion],
+             ("attack", "feint", "defend")),
+        )
+
+        # 상점 목록 - 메뉴를 열 때마다 다시 만들지 않도록 한 번만 구성
+        self._shop_catalog = [
+            ("포도청 검", self.items_database["포도청 검"], 200),
+            ("가죽 갑옷", self.items_database["가죽 갑옷"], 150),
+            ("회복약", self.items_database["회복약"], 50),
+            ("철갑옷", self.items_database["철갑옷"], 500),
+        ]
+
+    def _create_items(self) -> Dict[str, Item]:
+        """기본 아이템 데이터베이스 생성 (모듈 템플릿의 사본)"""
+        return {name: copy.copy(item) for name, item in _ITEM_TEMPLATES.items()}
+
+    def _create_skills(self) -> Dict[str, Skill]:
+        """기본 기술 데이터베이스 생성 (모듈 템플릿의 사본)"""
+        return {name: copy.copy(skill) for name, skill in _SKILL_TEMPLATES.items()}
+        
+    def _create_locations(self):
+        """게임 월드 생성 - 모듈 상수 스펙을 한 번에 전개한다"""
+        locations = self.locations
+        for name, description, faction, danger, locked in _LOCATION_SPEC:
+            locations[name] = Location(name, description, faction,
+                                       danger_level=danger, is_locked=locked)
+
+        # 연결 설정 - 목록과 멤버십 셋을 함께 채운다
+        for name, connected in _CONNECTIONS.items():
+            location = locations[name]
+            # _CONNECTIONS의 튜플을 그대로 공유 (복사/재할당 없음)
+            location.connected_locations = connected
+            location._connected_set = frozenset(connected)
+
+        # NPC 배치
+        self._place_npcs()
+
+        # 자주 참조하는 장소는 dict 조회 없이 바로 쓸 수 있게 잡아둔다
+        self._cult_temple = locations["밀교 사원"]
+        self._cursed_forest = locations["저주받은 숲"]
+
+        # 아이템 배치
+        self._place_items()
+
+    def distance(self, from_name: str, to_name: str) -> int:
+        """두 장소 사이의 최단 이동 횟수 (도달 불가면 -1)"""
+        return _DISTANCES[from_name].get(to_name, -1)
+
+    def next_hop(self, from_name: str, to_name: str) -> Optional[str]:
+        """to_name으로 가는 최단 경로의 첫 이동지"""
+        return _NEXT_HOPS[from_name].get(to_name)
+        
+    def _place_npcs(self):
+        """NPC 배치"""
+        # 시장 NPC
+        merchant = NPC("상인 김씨", Faction.NEUTRAL, 60)
+        self.npcs["상인 김씨"] = merchant
+        self.locations["시장"].add_npc(merchant)
+        
+        # 민중 집회소 NPC
+        rebel_leader = NPC("봉기군 수장 박씨", Faction.PEOPLE_ALLIANCE, 40)
+        self.npcs["봉기군 수장 박씨"] = rebel_leader
+        self.locations["민중 집회소"].add_npc(rebel_leader)
+        
+        # 이방인 주막 NPC
+        foreign_merc = NPC("서역 용병 아둘라", Faction.FOREIGNER_UNION, 50)
+        self.npcs["서역 용병 아둘라"] = foreign_merc
+        self.locations["이방인 주막"].add_npc(foreign_merc)
+        
+        # 유곽 NPC
+        courtesan = NPC("기생 월향", Faction.NEUTRAL, 50)
+        self.npcs["기생 월향"] = courtesan
+        self.locations["유곽"].add_npc(courtesan)
+        
+        # 처형장 NPC
+        executioner = NPC("망나니", Faction.PALACE, 20)
+        self.npcs["망나니"] = executioner
+        self.locations["처형장"].add_npc(executioner)
+        
+        # 밀교 사원 NPC
+        cult_priest = NPC("밀교 사제", Faction.CULT, 30)
+        self.npcs["밀교 사제"] = cult_priest
+        self.locations["밀교 사원"].add_npc(cult_priest)
+        
+    def _place_items(self):
+        """아이템 배치"""
+        # 시작 지점 아이템
+        self.locations["폐허가 된 마을"].add_item(self.items_database["녹슨 검"])
+        self.locations["폐허가 된 마을"].add_item(self.items_database["누더기 옷"])
+        
+        # 시장 아이템
+        self.locations["시장"].add_item(self.items_database["가죽 갑옷"])
+        self.locations["시장"].add_item(self.items_database["회복약"])
+        
+        # 밀교 사원 아이템
+        self.locations["밀교 사원"].add_item(self.items_database["독약"])
+        
+        # 이방인 주막 아이템
+        self.locations["이방인 주막"].add_item(self.items_database["비밀 문서"])
+        
+    def clear_screen(self):
+        """화면 지우기 - 셸 프로세스 생성 없이 ANSI 시퀀스로 처리"""
+        sys.stdout.write(_CLEAR_SEQ)
+        sys.stdout.flush()
+        
+    def display_title(self):
+        """타이틀 화면"""
+        self.clear_screen()
+        print(_BAR)
+        print(_TITLE)
+        print(_BAR)
+        print(f"{Colors.DIM}극사실주의 다크 판타지 RPG{Colors.RESET}")
+        print(f"{Colors.DIM}Ver {GameConstants.VERSION}{Colors.RESET}")
+        print(_BAR)
+        print()
+        
+    def main_menu(self) -> str:
+        """메인 메뉴"""
+        while True:
+            self.display_title()
+            print("1. 새 게임")
+            summary = self.peek_save()
+            if summary:
+                print(f"2. 이어하기 ({summary['name']} / Lv.{summary['level']} / {summary['origin']})")
+            else:
+                print("2. 이어하기")
+            print("3. 종료")
+            print(f"4. 빠른 텍스트: {'켜짐' if self.fast_text else '꺼짐'}")
+            print()
+
+            choice = input(_PROMPT).strip()
+
+            if choice in ["1", "2", "3"]:
+                return choice
+            elif choice == "4":
+                # 타이핑/페이드 연출을 일괄 출력으로 접는 토글
+                self.fast_text = not self.fast_text
+            else:
+                print(f"{Colors.RED}올바른 선택지를 입력하세요.{Colors.RESET}")
+                self._pause(1)
+                
+    def create_character(self):
+        """캐릭터 생성"""
+        self.clear_screen()
+        print(f"{Colors.BOLD}캐릭터 생성{Colors.RESET}")
+        print(_THIN_BAR)
+        
+        # 이름 입력
+        name = ""
+        while not name:
+            name = input(f"{Colors.YELLOW}이름을 입력하세요 >> {Colors.RESET}").strip()
+            
+        # 출신 선택
+        print(f"\n{Colors.BOLD}출신 선택:{Colors.RESET}")
+        origins = list(Origin)
+        for i, origin in enumerate(origins, 1):
+            print(f"{i}. {origin.value}")
+            
+        origin_choice = None
+        while origin_choice is None:
+            choice = self._prompt_choice(f"{Colors.YELLOW}출신 선택 >> {Colors.RESET}",
+                                         1, len(origins))
+            if choice is not None:
+                origin_choice = origins[choice - 1]
+                
+        # 캐릭터 생성
+        self.player = Character(name, origin_choice)
+        
+        # 출신별 초기 스토리
+        self._show_origin_story(origin_choice)
+        
+        # 월드 생성
+        self._create_locations()
+        self.current_location = self.locations["폐허가 된 마을"]
+        
+        print(f"\n{Colors.GREEN}캐릭터가 생성되었습니다!{Colors.RESET}")
+        self._pause(2)
+        
+    def _show_origin_story(self, origin: Origin):
+        """출신별 배경 스토리"""
+        self.clear_screen()
+        print(f"{Colors.BOLD}당신의 과거...{Colors.RESET}\n")
+
+        # 서사 텍스트는 캐릭터 생성 시에만 필요 - 첫 호출 때 지연 import
+        import dialog_text
+        for line in dialog_text.get(origin.name):
+            print(line)
+
+        if origin == Origin.FALLEN_NOBLE:
+            self.player.add_item(self.items_database["왕실 인장"])
+            print(f"\n{Colors.GREEN}[왕실 인장]을 소지하고 있습니다.{Colors.RESET}")
+        elif origin == Origin.BANDIT_OUTCAST:
+            self.player.learn_skill(self.skills_database["일섬"])
+            print(f"\n{Colors.GREEN}[일섬] 기술을 습득했습니다.{Colors.RESET}")
+        else:  # WAR_ORPHAN
+            self.player.stamina = self.player.max_stamina + 20
+            self.player.max_stamina += 20
+            print(f"\n{Colors.GREEN}극한의 생존력으로 최대 기력이 증가했습니다.{Colors.RESET}")
+
+        input(_PRESS_ENTER)
+        
+    def _state_dict(self) -> dict:
+        """저장 대상 상태를 순수 JSON 친화 구조로 모은다.
+
+        라이브 객체(player)는 그대로 넣고 _json_default가 인코딩 중에
+        펼친다. 세계 데이터는 이름으로만 기록해 load_game이 미리 만든
+        사전에서 역참조한다.
+        """
+        return {
+            "version": GameConstants.VERSION,
+            "player": self.player,
+            "current_location": self.current_location.name,
+            "game_time": self.game_time,
+            "npc_schema": list(_NPC_FIELDS),
+            "npcs": {name: npc.to_state() for name, npc in self.npcs.items()},
+            "game_flags": self.game_flags,
+            "permanent_consequences": self.permanent_consequences,
+            "unlocked_locations": [name for name, loc in self.locations.items() if not loc.is_locked]
+        }
+
+    def save_game(self):
+        """게임 저장"""
+        try:
+            encoded = _json_encode(self._state_dict())
+            # 상태가 그대로면 디스크를 건드리지 않는다
+            if encoded == self._last_save_payload:
+                print(f"{Colors.GREEN}게임이 저장되었습니다.{Colors.RESET}")
+                return True
+
+            # 반복되는 한글 문자열이 많아 압축 효율이 좋다
+            payload = gzip.compress(encoded)
+            # 임시 파일에 쓰고 교체해 저장 중 중단돼도 기존 파일을 지킨다
+            tmp_path = GameConstants.SAVE_FILE_PATH + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                # 교체 전에 디스크 도달 보장 - 전원 차단 시 빈 파일 방지
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, GameConstants.SAVE_FILE_PATH)
+            self._last_save_payload = encoded
+            print(f"{Colors.GREEN}게임이 저장되었습니다.{Colors.RESET}")
+            return True
+        except Exception as e:
+            print(f"{Colors.RED}저장 실패: {e}{Colors.RESET}")
+            return False
+            
+    def peek_save(self) -> Optional[dict]:
+        """저장 파일 요약 읽기.
+
+        메인 메뉴 표시용으로 이름/레벨/출신만 뽑아낸다.
+        객체 재구성(load_game) 없이 JSON 헤더만 읽는다.
+        """
+        if not os.path.exists(GameConstants.SAVE_FILE_PATH):
+            return None
+        try:
+            with open(GameConstants.SAVE_FILE_PATH, 'rb') as f:
+                raw = f.read()
+            if raw[:2] == _GZIP_MAGIC:
+                raw = gzip.decompress(raw)
+            player = _json_decode(raw)["player"]
+            return {
+                "name": player["name"],
+                "level": player["level"],
+                "origin": player["origin"],
+            }
+        except Exception:
+            return None
+
+    def load_game(self) -> bool:
+        """게임 불러오기"""
+        if not os.path.exists(GameConstants.SAVE_FILE_PATH):
+            print(f"{Colors.RED}저장 파일이 없습니다.{Colors.RESET}")
+            return False
+            
+        try:
+            with open(GameConstants.SAVE_FILE_PATH, 'rb') as f:
+                raw = f.read()
+
+            # 매직 바이트로 형식 판별 - 구버전 평문 JSON 저장도 그대로 읽힌다
+            if raw[:2] == _GZIP_MAGIC:
+                raw = gzip.decompress(raw)
+            save_data = _json_decode(raw)
+
+
+            # 플레이어 복원
+            self.player = Character.from_dict(save_data["player"])
+
+            # 월드 생성 - 이미 만들어져 있으면 재구축하지 않는다
+            if not self.locations:
+                self._create_locations()
+
+            # 현재 위치 복원
+            self.current_location = self.locations[save_data["current_location"]]
+
+            # 게임 시간 복원
+            self._set_time(save_data.get("game_time", 12))
+
+            # NPC 상태 복원 - 객체 교체 대신 제자리 갱신 (장소 참조 유지)
+            for name, npc_data in save_data["npcs"].items():
+                npc = self.npcs.get(name)
+                if npc is not None:
+                    npc.apply_state(npc_data)
+                    
+            # 게임 플래그 복원
+            self.game_flags = save_data.get("game_flags", self.game_flags)
+            
+            # 영구 결과 복원
+            self.permanent_consequences = save_data.get("permanent_consequences", [])
+            
+            # 잠금 해제된 장소 복원
+            for location_name in save_data["unlocked_locations"]:
+                if location_name in self.locations:
+                    self.locations[location_name].unlock()
+
+            self._last_save_payload = None
+            print(f"{Colors.GREEN}게임을 불러왔습니다.{Colors.RESET}")
+            return True
+            
+        except Exception as e:
+            print(f"{Colors.RED}불러오기 실패: {e}{Colors.RESET}")
+            return False
+            
+    def _pause(self, seconds: float):
+        """연출용 대기 - 빠른 진행 모드(RPG_FAST)에서는 건너뛴다"""
+        if not self.fast_mode:
+            time.sleep(seconds)
+
+    def _skippable_pause(self, seconds: float) -> bool:
+        """키 입력으로 단축할 수 있는 연출 대기. 입력이 있었으면 True"""
+        if self.fast_mode:
+            return False
+        return _kbwait(seconds)
+
+    def _emit(self, line: str):
+        """프레임 버퍼에 한 줄 추가 (print 대체)"""
+        self._buf.append(line)
+
+    def _flush(self):
+        """버퍼에 모인 줄들을 stdout에 한 번의 쓰기로 내보낸다"""
+        if self._buf:
+            self._buf.append("")
+            sys.stdout.write("\n".join(self._buf))
+            self._buf.clear()
+
+    def display_status(self, flush: bool = True):
+        """플레이어 상태 표시"""
+        p = self.player
+        emit = self._emit
+        emit(f"\n{Colors.BOLD}=== 상태 ==={Colors.RESET}")
+        emit(f"이름: {p.name} | 출신: {p.origin.value} | 직업: {p.job.label}")
+        emit(f"레벨: {p.level} | 경험치: {p.experience}/{p.level * 100} | 금전: {p.money}냥")
+        emit(f"체력: {Colors.RED}{p.health}/{p.max_health}{Colors.RESET} | "
+             f"기력: {Colors.YELLOW}{p.stamina}/{p.max_stamina}{Colors.RESET} | "
+             f"집중: {Colors.CYAN}{p.focus}/{p.max_focus}{Colors.RESET}")
+        emit(f"공격력: {p.get_total_attack()} | 방어력: {p.get_total_defense()} | "
+             f"정신력: {p.sanity}/100")
+
+        if p.equipped_weapon:
+            emit(f"무기: {p.equipped_weapon.name} (+{p.equipped_weapon.enhancement_level})")
+        if p.equipped_armor:
+            emit(f"방어구: {p.equipped_armor.name} (+{p.equipped_armor.enhancement_level})")
+
+        # 상태 이상 표시
+        if p.is_cursed:
+            emit(f"{Colors.MAGENTA}[저주받음]{Colors.RESET}")
+        if p.sanity < 30:
+            emit(f"{Colors.RED}[정신 불안정]{Colors.RESET}")
+        if p.nightmares:
+            emit(f"{Colors.DIM}[악몽에 시달림]{Colors.RESET}")
+        if flush:
+            self._flush()
+            
+    def display_location(self, flush: bool = True):
+        """현재 위치 표시"""
+        loc = self.current_location
+        
+        # 시간대 표시
+        emit = self._emit
+        time_str = self._get_time_string()
+        emit(f"\n{Colors.DIM}[{time_str}]{Colors.RESET}")
+
+        emit(f"\n{Colors.BOLD}=== {loc.name} ==={Colors.RESET}")
+
+        # 시간대별 설명
+        if self._is_night:
+            emit(f"{Colors.DIM}{loc.description} 어둠이 모든 것을 감싸고 있다...{Colors.RESET}")
+        else:
+            emit(f"{Colors.DIM}{loc.description}{Colors.RESET}")
+
+        emit(f"위험도: {_DANGER_STARS[loc.danger_level]}")
+
+        if loc.npcs:
+            emit(f"\n{Colors.CYAN}인물:{Colors.RESET}")
+            for npc in loc.npcs.values():
+                # 시간대별 NPC 활동
+                if self._is_npc_active(npc):
+                    emit(f"  - {npc.name}")
+                else:
+                    emit(f"  - {Colors.DIM}{npc.name} (자는 중){Colors.RESET}")
+
+        if loc.items:
+            emit(f"\n{Colors.YELLOW}아이템:{Colors.RESET}")
+            for item in loc.items:
+                emit(f"  - {item.name}")
+        if flush:
+            self._flush()
+                
+    def _set_time(self, t: int):
+        """게임 시간 변경 - 파생 값(_is_night, _time_str)을 한 곳에서 갱신"""
+        t %= 24
+        self.game_time = t
+        self._is_night = t >= 20 or t < 6
+        if 6 <= t < 12:
+            self._time_str = "아침"
+        elif 12 <= t < 17:
+            self._time_str = "낮"
+        elif 17 <= t < 20:
+            self._time_str = "저녁"
+        else:
+            self._time_str = "밤"
+
+    def _get_time_string(self) -> str:
+        """시간대 문자열 반환"""
+        return self._time_str
+            
+    def _is_npc_active(self, npc: NPC) -> bool:
+        """NPC 활동 시간 체크 (시간표 비트마스크 판정)"""
+        return bool((_ACTIVE_HOURS.get(npc.name, _ALL_HOURS) >> self.game_time) & 1)
+            
+    def location_menu(self):
+        """위치 메뉴"""
+        while self.is_running and not self.current_combat:
+            self._render_location_frame()
+
+            # 암살 의뢰 확인
+            self._check_assassination_contracts()
+
+            # 저주 효과 적용
+            if self.player.is_cursed:
+                self._apply_curse_effects()
+
+            choice = input(_PROMPT_NL).strip()
+
+            if choice == "8":
+                break
+            method_name = self._LOCATION_ACTIONS.get(choice)
+            if method_name is not None:
+                # 행동이 화면을 바꿨을 수 있으니 다음 턴은 무조건 다시 그린다
+                self._last_frame = None
+                getattr(self, method_name)()
+            else:
+                print(f"{Colors.RED}올바른 선택지를 입력하세요.{Colors.RESET}")
+                self._pause(1)
+
+    _MENU_BLOCK = (f"\n{Colors.BOLD}행동 선택:{Colors.RESET}\n"
+                   "1. 이동\n2. 탐색\n3. 대화\n4. 인벤토리\n"
+                   "5. 휴식\n6. 저장\n7. 특수 행동\n8. 메인 메뉴로")
+
+    def _render_location_frame(self):
+        """상태+위치+행동 메뉴를 한 프레임으로 조립해 그린다
+
+        직전 프레임과 내용이 같으면(잘못된 입력 직후 등) 지우기와
+        다시 그리기를 모두 생략한다 - 더블 버퍼링의 터미널판.
+        """
+        self.display_status(flush=False)
+        self.display_location(flush=False)
+        self._emit(self._MENU_BLOCK)
+        frame = "\n".join(self._buf)
+        self._buf.clear()
+        if frame == self._last_frame:
+            return
+        self._last_frame = frame
+        sys.stdout.write(_CLEAR_SEQ + frame + "\n")
+
+    # 위치 메뉴 선택 → 핸들러 메서드 (if/elif 체인 대신 O(1) 디스패치)
+    _LOCATION_ACTIONS = {
+        "1": "move_location",
+        "2": "explore_location",
+        "3": "talk_to_npc",
+        "4": "inventory_menu",
+        "5": "rest",
+        "6": "_save_and_pause",
+        "7": "special_actions",
+    }
+
+    def _prompt_choice(self, prompt: str, lo: int, hi: int) -> Optional[int]:
+        """[lo, hi] 범위의 정수 입력을 받는다
+
+        잘못 입력하는 흔한 경로에서 예외를 일으키지 않도록
+        int() 전에 isdecimal로 검증한다. 범위를 벗어나면 None.
+        """
+        s = input(prompt).strip()
+        if s.isdecimal():
+            value = int(s)
+            if lo <= value <= hi:
+                return value
+        print(_MSG_BAD_NUMBER)
+        self._pause(_ERROR_DELAY)
+        return None
+
+    def _save_and_pause(self):
+        """메뉴용 저장 래퍼"""
+        self.save_game()
+        self._pause(1)
+                
+    def _check_assassination_contracts(self):
+        """암살 의뢰 진행 확인"""
+        for consequence in self.permanent_consequences[:]:
+            if "_암살_의뢰" in consequence and _rand() < 0.3:
+                target_name = consequence.replace("_암살_의뢰", "")
+                print(f"\n{Colors.RED}암살자가 {target_name}을(를) 제거했습니다...{Colors.RESET}")
+                
+                # NPC 제거 - 이름 키로 O(1) 삭제
+                for location in self.locations.values():
+                    location.npcs.pop(target_name, None)
+                            
+                # 의뢰 완료
+                self.permanent_consequences.remove(consequence)
+                self.permanent_consequences.append(f"{target_name}_암살_완료")
+                self._pause(2)
+                
+    def _apply_curse_effects(self):
+        """저주 효과 적용"""
+        if _rand() < 0.1:
+            print(f"\n{Colors.MAGENTA}저주가 당신을 괴롭힙니다...{Colors.RESET}")
+            player = self.player
+            # 효과는 고정 3종 - 클로저/lambda 생성 없이 직접 필드를 깎는다
+            effect_text = _CURSE_EFFECTS[_rng_pool.next_index(3)]
+            if effect_text is _CURSE_NIGHTMARE:
+                player.sanity -= 5
+            elif effect_text is _CURSE_DRAIN:
+                player.health -= 5
+            else:
+                player.focus = max(0, player.focus - 10)
+            print(f"{Colors.DIM}{effect_text}{Colors.RESET}")
+            self._pause(1)
+            
+    def move_location(self):
+        """위치 이동"""
+        # 핫 루프에서 반복되는 속성 조회를 지역 변수로 고정
+        locations = self.locations
+        connected = self.current_location.connected_locations
+        print(f"\n{Colors.BOLD}이동 가능한 장소:{Colors.RESET}")
+        available_locations = []
+
+        for i, location_name in enumerate(connected, 1):
+            location = locations[location_name]
+            if not location.is_locked:
+                available_locations.append(location)
+                danger_indicator = _DANGER_STARS[location.danger_level]
+                print(f"{i}. {location.name} (위험도: {danger_indicator})")
+            else:
+                print(f"{i}. {Colors.DIM}??? (잠김){Colors.RESET}")
+                
+        print("0. 취소")
+        
+        choice = self._prompt_choice(f"\n{Colors.YELLOW}이동할 장소 >> {Colors.RESET}",
+                                     0, len(connected))
+        if not choice:
+            return
+        destination_name = connected[choice - 1]
+        destination = locations[destination_name]
+
+        if destination.is_locked:
+            print(f"{Colors.RED}아직 갈 수 없는 곳입니다.{Colors.RESET}")
+            self._pause(1)
+        else:
+            # 시간 경과
+            self._set_time(self.game_time + 1)
+
+            self.current_location = destination
+            print(f"{Colors.GREEN}{destination.name}(으)로 이동했습니다.{Colors.RESET}")
+
+            # 밤 이동 시 위험도 증가
+            danger_modifier = 1.5 if self._is_night else 1.0
+
+            # 이동 시 랜덤 이벤트 발생 가능
+            if _rand() * 100 < destination.danger_level * 10 * danger_modifier:
+                self.random_encounter()
+            else:
+                self._pause(1)
+            
+    def explore_location(self):
+        """현재 위치 탐색"""
+        print(f"\n{Colors.CYAN}주변을 살펴봅니다...{Colors.RESET}")
+        self._pause(1)
+        
+        # 시간대별 특수 발견
+        if self._check_time_based_discovery():
+            return
+        
+        # 아이템 발견
+        loc = self.current_location
+        if loc.items and _rand() < 0.7:
+            found_item = _choice(loc.items)
+            print(f"\n{Colors.GREEN}[{found_item.name}]을(를) 발견했습니다!{Colors.RESET}")
+            print(f"{Colors.DIM}{found_item.description}{Colors.RESET}")
+            
+            choice = input("\n획득하시겠습니까? (y/n) >> ").strip().lower()
+            if choice == 'y':
+                self.player.add_item(found_item)
+                loc.items.remove(found_item)
+                print(f"{Colors.GREEN}[{found_item.name}]을(를) 획득했습니다.{Colors.RESET}")
+                
+                # 특수 효과 처리
+                if found_item.special_effect == "암시회 은신처 해금":
+                    self.locations["암시회 은신처"].unlock()
+                    print(f"{Colors.YELLOW}암시회 은신처의 위치를 알게 되었습니다!{Colors.RESET}")
+                elif found_item.special_effect == "궁궐 출입 가능":
+                    self.locations["경복궁"].unlock()
+                    print(f"{Colors.YELLOW}이제 경복궁에 들어갈 수 있습니다!{Colors.RESET}")
+        else:
+            print(f"{Colors.DIM}특별한 것은 없는 것 같다...{Colors.RESET}")
+            
+        # 랜덤 이벤트
+        if _rand() < 0.3:
+            self.random_encounter()
+            
+        input(_PRESS_ENTER)
+        
+    def _check_time_based_discovery(self) -> bool:
+        """시간대별 특수 발견"""
+        # 자정 특수 이벤트
+        if self.game_time == 0 and self.current_location.kind is LocationKind.TEMPLE:
+            print(f"\n{Colors.MAGENTA}자정... 사원 깊은 곳에서 이상한 빛이 새어나옵니다...{Colors.RESET}")
+            print("숨겨진 지하 통로를 발견했습니다!")
+            
+            choice = input("들어가시겠습니까? (y/n) >> ").strip().lower()
+            if choice == 'y':
+                self._secret_underground_passage()
+            return True
+            
+        # 새벽 특수 이벤트
+        elif 3 <= self.game_time <= 5 and self.current_location.kind is LocationKind.EXECUTION:
+            print(f"\n{Colors.DIM}새벽안개 속에서 떠도는 혼령들이 보입니다...{Colors.RESET}")
+            self.player.sanity -= 10
+            
+            if self.player.sanity < 50:
+                print(f"{Colors.RED}혼령들이 속삭입니다: '우리처럼 되어라...'{Colors.RESET}")
+                self._ghost_encounter()
+            return True
+            
+        return False
+        
+    def _secret_underground_passage(self):
+        """비밀 지하 통로 이벤트"""
+        print(f"\n{Colors.MAGENTA}지하 깊은 곳으로 내려갑니다...{Colors.RESET}")
+        self._pause(1)
+        
+        print("고대의 제단을 발견했습니다!")
+        print("\n1. 제단에 피를 바친다")
+        print("2. 제단을 파괴한다")
+        print("3. 조용히 돌아간다")
+        
+        choice = input(_PROMPT_NL).strip()
+        
+        if choice == "1":
+            print(f"\n{Colors.RED}당신의 피가 제단에 스며듭니다...{Colors.RESET}")
+            self.player.health -= 30
+            
+            # 강력한 아이템 획득
+            legendary_weapon = Item("마검 혈귀", ItemType.WEAPON, 
+                                  "피를 갈구하는 저주받은 검", power=80)
+            self.player.add_item(legendary_weapon)
+            print(f"\n{Colors.MAGENTA}[마검 혈귀]를 획득했습니다!{Colors.RESET}")
+            
+            self.player.is_cursed = True
+            self.player.nightmares.append("피의 제단")
+            
+        elif choice == "2":
+            print(f"\n{Colors.YELLOW}제단을 파괴합니다!{Colors.RESET}")
+            print("갑자기 지진이 일어납니다!")
+            
+            # 밀교파와 영구 적대
+            self.player.faction_affinity[Faction.CULT] = -100
+            print(f"{Colors.RED}밀교파가 당신을 이단으로 선포했습니다!{Colors.RESET}")
+            
+            # 붕괴로 인한 부상
+            self.player.health -= 20
+            print("무너지는 돌에 맞아 부상을 입었습니다!")
+            
+    def _ghost_encounter(self):
+        """유령 조우 이벤트"""
+        print(f"\n{Colors.MAGENTA}처형당한 자들의 혼령이 나타났습니다...{Colors.RESET}")
+        
+        if "고문_집행자" in self.permanent_consequences:
+            print(f"{Colors.RED}'네가... 네가 우리를 죽였다...!'{Colors.RESET}")
+            print("혼령들이 당신을 공격합니다!")
+            
+            # 특수 적 - 물리 공격 효과 감소
+            ghost = self.enemy_pool.acquire_template("원혼 무리")
+            ghost.defense = 30  # 물리 방어력 높음
+            self.start_combat(ghost)
+        else:
+            print("혼령들이 슬픈 눈으로 당신을 바라봅니다...")
+            print(f"{Colors.CYAN}'우리의 원한을 풀어주오...'{Colors.RESET}")
+            
+            # 퀘스트 제공
+            self.game_flags["혼령_퀘스트"] = True
+            
+    def talk_to_npc(self):
+        """NPC와 대화"""
+        if not self.current_location.npcs:
+            print(f"{Colors.DIM}대화할 사람이 없습니다.{Colors.RESET}")
+            self._pause(_ERROR_DELAY)
+            return
+            
+        active_npcs = [npc for npc in self.current_location.npcs.values() if self._is_npc_active(npc)]
+        if not active_npcs:
+            print(f"{Colors.DIM}깨어있는 사람이 없습니다.{Colors.RESET}")
+            self._pause(_ERROR_DELAY)
+            return
+            
+        print(f"\n{Colors.BOLD}대화 상대 선택:{Colors.RESET}")
+        for i, npc in enumerate(active_npcs, 1):
+            print(f"{i}. {npc.name}")
+        print("0. 취소")
+        
+        choice = self._prompt_choice(_PROMPT_NL, 0, len(active_npcs))
+        if choice:
+            npc = active_npcs[choice - 1]
+            self.npc_interaction(npc)
+            
+    def npc_interaction(self, npc: NPC):
+        """NPC 상호작용"""
+        self.clear_screen()
+        print(f"{Colors.BOLD}=== {npc.name} ==={Colors.RESET}")
+        print(npc.get_reaction())
+        
+        # NPC 기억 표시
+        if npc.memories:
+            recent_memory = npc.memories[-1]
+            if "배신" in recent_memory["action"]:
+                print(f"{Colors.RED}(당신의 배신을 기억하고 있다...){Colors.RESET}")
+            elif "도움" in recent_memory["action"]:
+                print(f"{Colors.GREEN}(당신의 도움을 기억하고 있다...){Colors.RESET}")
+        
+        if npc.is_hostile:
+            print(f"\n{Colors.RED}{npc.name}이(가) 공격해옵니다!{Colors.RESET}")
+            enemy = self.enemy_pool.acquire_template("적대 주민", npc.name)
+            self.start_combat(enemy)
+            return
+            
+        # 출신별 대화 옵션
+        dialogue_options = self._get_origin_based_dialogue(npc)
+        
+        # NPC별 특수 대화 - 이름별 핸들러 레지스트리로 O(1) 디스패치
+        handler = self._npc_dialog.get(npc.name)
+        if handler is not None:
+            handler(npc, dialogue_options)
+
+        # 기본 선택지
+        dialogue_options.append(("돌아가기", None))
+        
+        # 선택지 표시
+        print(f"\n{Colors.BOLD}선택:{Colors.RESET}")
+        for i, (text, _) in enumerate(dialogue_options, 1):
+            print(f"{i}. {text}")
+            
+        choice = self._prompt_choice(_PROMPT_NL, 1, len(dialogue_options))
+        if choice is not None:
+            _, action = dialogue_options[choice - 1]
+            if action:
+                action()
+            
+        input(_PRESS_ENTER)
+        
+    def _dialog_merchant(self, npc: NPC, dialogue_options: list):
+        """상인 김씨 특수 대화"""
+        print("\n'어서 오시게. 무엇을 찾으시나?'")
+        if npc.trust >= 50:
+            print("'믿을만한 손님이군. 특별한 물건도 보여드리지.'")
+            dialogue_options.extend([
+                ("거래하기", lambda: self.shop_menu(npc)),
+                ("정보 구매", lambda: self.buy_information(npc))
+            ])
+        else:
+            dialogue_options.extend([
+                ("거래하기", lambda: self.shop_menu(npc))
+            ])
+
+    def _dialog_rebel_leader(self, npc: NPC, dialogue_options: list):
+        """봉기군 수장 박씨 특수 대화"""
+        print("\n'양반놈들을 몰아내고 새 세상을 열 것이오!'")
+
+        # 출신별 반응
+        if self.player.origin == Origin.FALLEN_NOBLE:
+            print(f"{Colors.YELLOW}(그가 당신을 의심스럽게 바라본다...){Colors.RESET}")
+            npc.adjust_trust(-10)
+        elif self.player.origin == Origin.WAR_ORPHAN:
+            print(f"{Colors.GREEN}(동병상련의 눈빛을 보낸다...){Colors.RESET}")
+            npc.adjust_trust(10)
+
+        if self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] >= 60:
+            dialogue_options.extend([
+                ("봉기에 참여하기", lambda: self.join_rebellion(npc)),
+                ("정보 공유", lambda: self.share_information(npc))
+            ])
+
+    def _dialog_mercenary(self, npc: NPC, dialogue_options: list):
+        """서역 용병 아둘라 특수 대화"""
+        print("\n'돈만 준다면 뭐든 해주지.'")
+
+        # 도적 출신은 특별 대우
+        if self.player.origin == Origin.BANDIT_OUTCAST:
+            print(f"{Colors.CYAN}'오... 같은 길을 걸었던 자군. 특별히 해주지.'{Colors.RESET}")
+            dialogue_options.append(("암살 의뢰 (도적 출신 전용)", lambda: self.assassination_contract(npc)))
+
+        dialogue_options.extend([
+            ("용병 고용", lambda: self.hire_mercenary(npc)),
+            ("전투 기술 배우기", lambda: self.learn_combat_skill(npc))
+        ])
+
+    def _dialog_courtesan(self, npc: NPC, dialogue_options: list):
+        """기생 월향 특수 대화"""
+        print("\n'어서 오세요, 나리...'")
+
+        # 양반 출신은 특별 대우
+        if self.player.origin == Origin.FALLEN_NOBLE:
+            print(f"{Colors.CYAN}'아... 옛 영화가 느껴지는군요. 특별히 모시겠습니다.'{Colors.RESET}")
+            dialogue_options.append(("비밀 정보 거래 (양반 전용)", lambda: self.secret_info_trade(npc)))
+
+        dialogue_options.extend([
+            ("정보 구매 (50냥)", lambda: self.buy_courtesan_info(npc)),
+            ("밤을 보내기 (100냥)", lambda: self.spend_night(npc))
+        ])
+
+    def _dialog_priest(self, npc: NPC, dialogue_options: list):
+        """밀교 사제 특수 대화"""
+        print("\n'고통을 통해 초월에 이르는 길...'")
+
+        dialogue_options.extend([
+            ("교리에 대해 묻기", lambda: self.ask_doctrine(npc)),
+            ("금지된 지식 구매 (300냥)", lambda: self.buy_forbidden_knowledge(npc))
+        ])
+
+        # 자정 특수 이벤트
+        if self.game_time == 0:
+            dialogue_options.append(("심야 의식 참여", lambda: self.midnight_ritual(npc)))
+
+    def _dialog_executioner(self, npc: NPC, dialogue_options: list):
+        """망나니 특수 대화"""
+        print("\n'피의 냄새가 그리운가? 크크크...'")
+        if self.current_location.kind is LocationKind.EXECUTION:
+            dialogue_options.append(("고문 참관", lambda: self.witness_torture()))
+
+    def _get_origin_based_dialogue(self, npc: NPC):
+        """출신별 기본 대화 옵션"""
+        options = []
+        
+        if self.player.origin == Origin.FALLEN_NOBLE:
+            options.append(("위엄있게 명령하기", lambda: self.noble_command(npc)))
+            if npc.faction == Faction.PALACE:
+                options.append(("가문의 이름으로 호소하기", lambda: self.family_appeal(npc)))
+                
+        elif self.player.origin == Origin.BANDIT_OUTCAST:
+            options.append(("은밀히 거래 제안", lambda: self.shady_deal(npc)))
+            if npc.faction in _SHADOW_FACTIONS:
+                options.append(("동업자 코드로 대화", lambda: self.criminal_code(npc)))
+                
+        elif self.player.origin == Origin.WAR_ORPHAN:
+            options.append(("동정심에 호소하기", lambda: self.sympathy_appeal(npc)))
+            if npc.faction == Faction.PEOPLE_ALLIANCE:
+                options.append(("고통의 경험 공유", lambda: self.share_suffering(npc)))
+                
+        return options
+        
+    def noble_command(self, npc: NPC):
+        """양반 출신 - 위엄있게 명령"""
+        print(f"\n당신은 양반의 위엄으로 {npc.name}에게 명령합니다.")
+        
+        if npc.faction == Faction.PALACE or npc.trust >= 60:
+            print(f"{Colors.GREEN}{npc.name}이(가) 고개를 숙입니다.{Colors.RESET}")
+            npc.adjust_trust(5)
+        else:
+            print(f"{Colors.RED}'시대가 바뀌었소. 양반 나부랭이가...'{Colors.RESET}")
+            npc.adjust_trust(-15)
+            npc.remember_action("양반_명령_거부")
+            
+    def family_appeal(self, npc: NPC):
+        """양반 출신 - 가문 호소"""
+        print(f"\n당신은 몰락한 가문의 영광을 언급합니다.")
+        print(f"{Colors.CYAN}'우리 가문은 한때 왕실의 신임을 받았소...'{Colors.RESET}")
+        
+        if "왕실 인장" in self.player.inventory_by_name:
+            print(f"{Colors.GREEN}왕실 인장을 보인 {npc.name}의 태도가 달라집니다!{Colors.RESET}")
+            npc.adjust_trust(20)
+            npc.remember_action("왕실_인장_확인")
+        else:
+            print(f"{Colors.DIM}{npc.name}이(가) 시큰둥해합니다.{Colors.RESET}")
+            
+    def shady_deal(self, npc: NPC):
+        """도적 출신 - 은밀한 거래"""
+        print(f"\n당신은 {npc.name}에게 은밀히 속삭입니다.")
+        
+        if npc.faction in _DEAL_FACTIONS:
+            print(f"{Colors.GREEN}'흥미로운 제안이군... 들어보지.'{Colors.RESET}")
+            npc.adjust_trust(10)
+        else:
+            print(f"{Colors.RED}'수상한 놈... 꺼져!'{Colors.RESET}")
+            npc.adjust_trust(-10)
+            
+    def criminal_code(self, npc: NPC):
+        """도적 출신 - 범죄자 암호"""
+        print(f"\n당신은 도적들만 아는 은어로 말합니다.")
+        print(f"{Colors.CYAN}'달빛 아래 그림자가 춤춘다...'{Colors.RESET}")
+        
+        print(f"{Colors.GREEN}{npc.name}이(가) 같은 은어로 답합니다!{Colors.RESET}")
+        print("'...그리고 칼날은 침묵한다.'")
+        
+        npc.adjust_trust(25)
+        npc.remember_action("동업자_확인")
+        
+        # 특별 보상
+        if "암시회 은신처" in self.locations and self.locations["암시회 은신처"].is_locked:
+            print(f"\n{Colors.YELLOW}암시회 은신처의 위치를 알려줍니다!{Colors.RESET}")
+            self.locations["암시회 은신처"].unlock()
+            
+    def sympathy_appeal(self, npc: NPC):
+        """전쟁 고아 - 동정심 호소"""
+        print(f"\n당신은 전쟁으로 잃은 모든 것을 이야기합니다.")
+        
+        if npc.trust >= 40 or npc.faction == Faction.PEOPLE_ALLIANCE:
+            print(f"{Colors.GREEN}{npc.name}의 눈가가 촉촉해집니다.{Colors.RESET}")
+            npc.adjust_trust(15)
+            
+            # 작은 도움
+            if self.player.health < self.player.max_health:
+                print(f"{Colors.GREEN}약초를 건네줍니다. 체력이 회복됩니다!{Colors.RESET}")
+                self.player.heal(20)
+        else:
+            print(f"{Colors.DIM}'안타깝지만... 모두가 고통받고 있소.'{Colors.RESET}")
+            
+    def share_suffering(self, npc: NPC):
+        """전쟁 고아 - 고통 공유"""
+        print(f"\n당신은 전쟁의 참상을 생생히 묘사합니다.")
+        print(f"{Colors.DIM}불타는 마을... 비명소리... 죽어가는 부모...{Colors.RESET}")
+        
+        self.player.sanity -= 5
+        npc.adjust_trust(20)
+        npc.remember_action("전쟁_경험_공유")
+        
+        print(f"{Colors.GREEN}{npc.name}이(가) 당신을 동지로 받아들입니다.{Colors.RESET}")
+        self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] += 15
+        
+    def shop_menu(self, merchant: NPC):
+        """상점 메뉴"""
+        items_list = self._shop_catalog
+        n = len(items_list)
+
+        while True:
+            self.clear_screen()
+            emit = self._emit
+            emit(f"\n{Colors.BOLD}=== 상점 ==={Colors.RESET}")
+            emit(f"보유 금액: {Colors.YELLOW}{self.player.money}냥{Colors.RESET}\n")
+
+            for i, (name, item, price) in enumerate(items_list, 1):
+                emit(f"{i}. {name} - {price}냥")
+                emit(f"   {Colors.DIM}{item.description}{Colors.RESET}")
+
+            emit("0. 나가기")
+            self._flush()
+
+            choice = self._prompt_choice(_PROMPT_BUY, 0, n)
+            if choice is None:
+                continue
+            if choice == 0:
+                break
+
+            name, item, price = items_list[choice - 1]
+
+            if self.player.money >= price:
+                self.player.money -= price
+                self.player.add_item(item.clone())
+                print(f"\n{Colors.GREEN}[{name}]을(를) 구매했습니다!{Colors.RESET}")
+                merchant.adjust_trust(5)
+            else:
+                print("\n" + _MSG_NO_MONEY)
+
+            self._pause(1.5)
+                
+    def buy_information(self, npc: NPC):
+        """정보 구매"""
+        print("\n'이런 정보들이 있소...'")
+        print("1. 저주받은 숲의 비밀 (100냥)")
+        print("2. 밀교파의 음모 (200냥)")
+        print("3. 돌아가기")
+        
+        choice = input(_PROMPT_NL).strip()
+        if choice == "1" and self.player.money >= 100:
+            self.player.money -= 100
+            print(f"\n{Colors.CYAN}'저주받은 숲 깊은 곳에 전설의 무기가 숨겨져 있다고 하오.'{Colors.RESET}")
+            self.locations["저주받은 숲"].unlock()
+            npc.adjust_trust(5)
+        elif choice == "2" and self.player.money >= 200:
+            self.player.money -= 200
+            print(f"\n{Colors.CYAN}'밀교파가 왕실 전복을 꾀하고 있소. 조심하시오.'{Colors.RESET}")
+            self.game_flags["밀교_음모_인지"] = True
+            npc.adjust_trust(5)
+            
+    def join_rebellion(self, npc: NPC):
+        """봉기 참여"""
+        print(f"\n{Colors.RED}경고: 봉기에 참여하면 왕실과 적대 관계가 됩니다!{Colors.RESET}")
+        choice = input("정말 참여하시겠습니까? (y/n) >> ").strip().lower()
+        
+        if choice == 'y':
+            self.player.faction_affinity[Faction.PALACE] -= 50
+            self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] += 30
+            self.game_flags["봉기_참여"] = True
+            print(f"\n{Colors.GREEN}봉기군에 합류했습니다!{Colors.RESET}")
+            npc.adjust_trust(20)
+            npc.remember_action("봉기_참여")
+            
+            # 봉기군 무기 지급
+            rebel_sword = Item("봉기군 검", ItemType.WEAPON, "거친 만듦새지만 단단한 검", power=20)
+            self.player.add_item(rebel_sword)
+            print(f"{Colors.GREEN}[봉기군 검]을 받았습니다!{Colors.RESET}")
+            
+    def share_information(self, npc: NPC):
+        """정보 공유"""
+        shared_something = False
+        
+        if self.game_flags.get("밀교_의식_정보", False):
+            print("\n밀교파의 음모에 대해 알려주었습니다.")
+            npc.adjust_trust(15)
+            npc.remember_action("밀교파_정보_공유")
+            shared_something = True
+            
+        if self.game_flags.get("무기_밀수_정보", False):
+            print("\n암시회의 무기 밀수 계획을 알려주었습니다.")
+            npc.adjust_trust(20)
+            npc.remember_action("무기_밀수_정보_공유")
+            shared_something = True
+            
+        if shared_something:
+            print(f"\n{Colors.GREEN}신뢰도가 상승했습니다!{Colors.RESET}")
+        else:
+            print("\n공유할 만한 정보가 없습니다.")
+            
+    def assassination_contract(self, npc: NPC):
+        """도적 출신 전용 - 암살 계약"""
+        print(f"\n{Colors.RED}'제거해야 할 대상이 있나?'{Colors.RESET}")
+        print("'200냥이면 누구든 조용히 사라지게 해주지.'")
+        
+        if self.player.money >= 200:
+            # 암살 대상 선택
+            targets = ["밀교 사제", "봉기군 수장 박씨", "상인 김씨"]
+            print("\n암살 대상:")
+            for i, target in enumerate(targets, 1):
+                print(f"{i}. {target}")
+            print("0. 취소")
+            
+            choice = self._prompt_choice(_PROMPT_NL, 0, len(targets))
+            if choice:
+                target_name = targets[choice - 1]
+                self.player.money -= 200
+                self.permanent_consequences.append(f"{target_name}_암살_의뢰")
+                print(f"\n{Colors.RED}'3일 내로 처리하겠네...'{Colors.RESET}")
+                npc.remember_action(f"암살_의뢰_{target_name}")
+                
+    def hire_mercenary(self, npc: NPC):
+        """용병 고용"""
+        print("\n'하루에 50냥. 전투에서 도움을 주지.'")
+        
+        if self.player.money >= 50:
+            choice = input("고용하시겠습니까? (y/n) >> ").strip().lower()
+            if choice == 'y':
+                self.player.money -= 50
+                self.game_flags["용병_고용"] = True
+                print(f"{Colors.GREEN}용병을 고용했습니다! 다음 전투에서 도움을 받습니다.{Colors.RESET}")
+                npc.adjust_trust(5)
+                
+    def learn_combat_skill(self, npc: NPC):
+        """전투 기술 학습"""
+        available_skills = []
+        
+        # 학습 가능한 기술 확인
+        if "연환격" not in self.player.skill_names:
+            available_skills.append(("연환격", 100))
+        if "회전베기" not in self.player.skill_names and self.player.level >= 5:
+            available_skills.append(("회전베기", 200))
+            
+        if not available_skills:
+            print("더 이상 배울 기술이 없습니다.")
+            return
+            
+        print("\n학습 가능한 기술:")
+        for i, (skill_name, price) in enumerate(available_skills, 1):
+            skill = self.skills_database[skill_name]
+            print(f"{i}. {skill_name} - {price}냥")
+            print(f"   {Colors.DIM}{skill.description}{Colors.RESET}")
+        print("0. 취소")
+        
+        choice = self._prompt_choice(_PROMPT_NL, 0, len(available_skills))
+        if choice:
+            skill_name, price = available_skills[choice - 1]
+            if self.player.money >= price:
+                self.player.money -= price
+                self.player.learn_skill(self.skills_database[skill_name])
+                print(f"{Colors.GREEN}[{skill_name}] 기술을 습득했습니다!{Colors.RESET}")
+                npc.adjust_trust(10)
+            else:
+                print(_MSG_NO_MONEY)
+            
+    def secret_info_trade(self, npc: NPC):
+        """양반 전용 - 비밀 정보 거래"""
+        print(f"\n{Colors.CYAN}'아, 나리께서는 특별한 정보를 원하시는군요...'{Colors.RESET}")
+        print("'궁중의 비밀, 세력들의 음모... 300냥이면 알려드리죠.'")
+        
+        if self.player.money >= 300:
+            choice = input("구매하시겠습니까? (y/n) >> ").strip().lower()
+            if choice == 'y':
+                self.player.money -= 300
+                print(f"\n{Colors.MAGENTA}[극비 정보 획득]{Colors.RESET}")
+                print("1. 왕실 내부에 밀교파 첩자가 있습니다.")
+                print("2. 암시회가 대규모 무기 밀수를 준비 중입니다.")
+                print("3. 이방인연합이 반란을 계획하고 있습니다.")
+                
+                self.game_flags["왕실_첩자_정보"] = True
+                self.game_flags["무기_밀수_정보"] = True
+                self.game_flags["이방인_반란_정보"] = True
+                self.locations["저주받은 숲"].unlock()
+                print(f"\n{Colors.YELLOW}저주받은 숲의 비밀 통로를 알게 되었습니다!{Colors.RESET}")
+                
+    def buy_courtesan_info(self, npc: NPC):
+        """기생 정보 구매"""
+        if self.player.money >= 50:
+            self.player.money -= 50
+            
+            # 랜덤 정보 제공
+            info_text, event_flag = _choice(_COURTESAN_RUMORS)
+            print(f"\n{Colors.CYAN}'{info_text}고 하더군요...'{Colors.RESET}")
+            self.game_flags[event_flag] = True
+            npc.adjust_trust(10)
+        else:
+            print(_MSG_NO_MONEY)
+            
+    def spend_night(self, npc: NPC):
+        """유곽에서 밤 보내기"""
+        if self.player.money >= 100:
+            self.player.money -= 100
+            
+            print(f"\n{Colors.DIM}화려한 등불 아래, 달콤한 향이 가득한 방...{Colors.RESET}")
+            self._pause(1)
+            
+            # 선택적 묘사
+            print("\n1. 담소를 나눈다 (안전)")
+            print("2. 깊은 밤을 보낸다 (체력/정신력 대폭 회복)")
+            print("3. 금기를 넘는다 (특별한 효과, 정신력 감소)")
+            
+            choice = input(_PROMPT_NL).strip()
+            
+            if choice == "1":
+                print(f"\n{Colors.GREEN}편안한 대화로 마음이 안정됩니다.{Colors.RESET}")
+                self.player.sanity = min(100, self.player.sanity + 10)
+                self.player.stamina = self.player.max_stamina
+                
+            elif choice == "2":
+                print(f"\n{Colors.DIM}열정적인 밤이 지나갑니다...{Colors.RESET}")
+                self.player.health = self.player.max_health
+                self.player.stamina = self.player.max_stamina
+                self.player.focus = self.player.max_focus
+                self.player.sanity = min(100, self.player.sanity + 20)
+                npc.adjust_trust(20)
+                
+            elif choice == "3":
+                print(f"\n{Colors.RED}금기의 쾌락에 빠져듭니다...{Colors.RESET}")
+                print(f"{Colors.DIM}이성을 잃고 본능에 충실한 밤...{Colors.RESET}")
+                
+                # 특별한 효과
+                self.player.max_stamina += 10
+                self.player.stamina = self.player.max_stamina
+                self.player.sanity -= 15
+                npc.adjust_trust(30)
+                npc.remember_action("금기의_밤")
+                
+                # 특수 능력 획득
+                if _rand() < 0.3:
+                    print(f"\n{Colors.MAGENTA}타락한 쾌락 속에서 이상한 깨달음을 얻었습니다...{Colors.RESET}")
+                    self.player.base_attack += 3
+                    
+            # 시간 경과
+            self._set_time(6)  # 다음날 아침
+            self._pause(2)
+        else:
+            print(_MSG_NO_MONEY)
+            
+    def ask_doctrine(self, npc: NPC):
+        """교리 문답"""
+        print(f"\n{Colors.CYAN}'우리는 고통을 통해 초월에 이른다...'{Colors.RESET}")
+        print("밀교 사제가 금지된 경전을 펼칩니다.")
+        
+        self.player.sanity -= 5
+        self.player.focus += 10
+        npc.adjust_trust(5)
+        
+        print(f"\n{Colors.DIM}이상한 깨달음이 당신의 정신을 파고듭니다...{Colors.RESET}")
+        
+    def buy_forbidden_knowledge(self, npc: NPC):
+        """금지된 지식 구매"""
+        print("\n'300냥이면 금지된 비술을 가르쳐주지...'")
+        
+        if self.player.money >= 300:
+            choice = input("구매하시겠습니까? (y/n) >> ").strip().lower()
+            if choice == 'y':
+                self.player.money -= 300
+                
+                # 랜덤 비술 습득
+                available = [s for s in _FORBIDDEN_SKILLS if s not in self.player.skill_names]
+                
+                if available:
+                    skill_name = _choice(available)
+                    self.player.learn_skill(self.skills_database[skill_name])
+                    print(f"{Colors.MAGENTA}[{skill_name}] 비술을 전수받았습니다!{Colors.RESET}")
+                    self.player.sanity -= 15
+                else:
+                    print("더 이상 배울 비술이 없습니다.")
+                    self.player.money += 300  # 환불
+        else:
+            print(_MSG_NO_MONEY)
+            
+    def midnight_ritual(self, npc: NPC):
+        """심야 의식 이벤트"""
+        print(f"\n{Colors.MAGENTA}자정의 종이 울리고, 의식이 시작됩니다...{Colors.RESET}")
+        print("검은 두건의 신도들이 원을 그리며 둘러섭니다.")
+        
+        print("\n1. 피의 맹세를 한다 (영구적 변화)")
+        print("2. 관찰만 한다")
+        print("3. 의식을 방해한다")
+        
+        choice = input(_PROMPT_NL).strip()
+        
+        if choice == "1":
+            print(f"\n{Colors.RED}당신은 손목을 그어 피를 제단에 바칩니다...{Colors.RESET}")
+            self.player.health -= 20
+            self.player.is_cursed = True
+            self.permanent_consequences.append("밀교_혈맹")
+            
+            # 영구적 능력 변화
+            self.player.max_focus += 30
+            self.player.base_attack += 5
+            self.player.sanity = max(0, self.player.sanity - 30)
+            
+            print(f"{Colors.MAGENTA}어둠의 힘이 당신의 영혼에 각인됩니다...{Colors.RESET}")
+            print(f"{Colors.GREEN}집중력과 공격력이 영구적으로 상승했습니다!{Colors.RESET}")
+            print(f"{Colors.RED}하지만 당신의 영혼은 영원히 저주받았습니다...{Colors.RESET}")
+            
+            # 특수 기술 획득
+            if "천지개벽" not in self.player.skill_names:
+                print(f"\n{Colors.MAGENTA}금지된 기술 [천지개벽]을 깨달았습니다!{Colors.RESET}")
+                self.player.learn_skill(self.skills_database["천지개벽"])
+                
+            # 다른 세력과의 관계 파탄
+            self.player.faction_affinity[Faction.PALACE] = 0
+            self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] = 0
+            print(f"\n{Colors.RED}왕실과 백성연맹과의 모든 관계가 단절되었습니다!{Colors.RESET}")
+            
+            npc.adjust_trust(50)
+            npc.remember_action("혈맹_체결")
+            
+        elif choice == "2":
+            print(f"\n{Colors.CYAN}당신은 의식의 비밀을 목격했습니다.{Colors.RESET}")
+            self.game_flags["밀교_비밀_목격"] = True
+            self.player.sanity -= 5
+            npc.adjust_trust(5)
+            
+        elif choice == "3":
+            print(f"\n{Colors.RED}당신은 의식을 방해했습니다!{Colors.RESET}")
+            print("분노한 신도들이 공격해옵니다!")
+            
+            # 다수의 적과 전투
+            for i in range(3):
+                if self.player.health <= 0:
+                    break
+                enemy = self.enemy_pool.acquire_template("밀교 신도", f"밀교 신도 {i+1}")
+                print(f"\n{Colors.RED}[{enemy.name}]이(가) 나타났습니다!{Colors.RESET}")
+                self.start_combat(enemy)
+                
+            self.player.faction_affinity[Faction.CULT] -= 50
+            npc.adjust_trust(-100)
+            npc.is_hostile = True
+            
+        input(_PRESS_ENTER)
+        
+    def witness_torture(self):
+        """고문 참관 - 개선된 버전"""
+        print(f"\n{Colors.RED}처형장에서 끔찍한 고문이 진행되고 있습니다.{Colors.RESET}")
+        
+        # 고문 대상 확인
+        victim = "반역자" if self.game_flags.get("왕실_첩자_정보", False) else "무고한 백성"
+        print(f"고문받는 자: {victim}")
+        
+        print("\n1. 고문을 지켜본다")
+        print("2. 고문을 중단시킨다") 
+        print("3. 직접 참여한다 (극도로 잔혹함)")
+        print("4. 정보를 캐낸다")
+        print("5. 자리를 떠난다")
+        
+        choice = input(_PROMPT_NL).strip()
+        
+        if choice == "1":
+            print(f"\n{Colors.DIM}비명과 신음 소리가 처형장을 가득 채웁니다...{Colors.RESET}")
+            print("당신은 차가운 눈으로 광경을 지켜봅니다.")
+            self.player.sanity -= 10
+            self.player.faction_affinity[Faction.PALACE] += 5
+            
+        elif choice == "2":
+            print(f"\n{Colors.GREEN}당신은 고문을 중단시켰습니다.{Colors.RESET}")
+            self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] += 10
+            self.player.faction_affinity[Faction.PALACE] -= 10
+            
+            # 망나니와 전투 가능성
+            if _rand() < 0.5:
+                print(f"\n{Colors.RED}망나니가 분노하여 공격해옵니다!{Colors.RESET}")
+                enemy = self.enemy_pool.acquire_template("분노한 망나니")
+                self.start_combat(enemy)
+                
+        elif choice == "3":
+            print(f"\n{Colors.RED}당신은 직접 고문 도구를 들었습니다...{Colors.RESET}")
+            print(f"{Colors.DIM}피가 당신의 손을 적십니다. 희생자의 눈에서 생기가 사라집니다...{Colors.RESET}")
+            
+            self.player.sanity -= 40
+            self.player.nightmares.append("고문한 자의 얼굴")
+            self.player.faction_affinity[Faction.PALACE] += 20
+            self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] -= 30
+            self.game_flags["고문_가담"] = True
+            self.permanent_consequences.append("고문_집행자")
+            
+            # 특수 기술 습득
+            if "회전베기" not in self.player.skill_names:
+                print(f"\n{Colors.MAGENTA}잔혹한 경험으로 [회전베기] 기술을 깨달았습니다...{Colors.RESET}")
+                self.player.learn_skill(self.skills_database["회전베기"])
+                
+            # 영구적 변화
+            print(f"\n{Colors.RED}당신의 손은 이제 영원히 피로 물들었습니다...{Colors.RESET}")
+            self._apply_permanent_consequence("고문_집행자")
+            
+        elif choice == "4":
+            print(f"\n당신은 고문을 이용해 정보를 캐냅니다...")
+            
+            if victim == "반역자":
+                print(f"{Colors.CYAN}'암시회가... 궁궐 지하에... 무기를...'{Colors.RESET}")
+                self.game_flags["궁궐_지하_무기고_정보"] = True
+                print(f"\n{Colors.YELLOW}중요한 정보를 얻었습니다!{Colors.RESET}")
+            else:
+                print(f"{Colors.DIM}희생자는 아무것도 모릅니다...{Colors.RESET}")
+                self.player.sanity -= 20
+                
+        input(_PRESS_ENTER)
+        
+    def _apply_permanent_consequence(self, consequence: str):
+        """영구 결과 적용"""
+        if consequence == "고문_집행자":
+            # 모든 NPC의 초기 신뢰도 감소
+            for npc in self.npcs.values():
+                if npc.faction != Faction.PALACE:
+                    npc.adjust_trust(-20)
+                    
+    def inventory_menu(self):
+        """인벤토리 메뉴"""
+        while True:
+            self.clear_screen()
+            emit = self._emit
+            emit(f"{Colors.BOLD}=== 인벤토리 ==={Colors.RESET}")
+            emit(f"금전: {Colors.YELLOW}{self.player.money}냥{Colors.RESET}\n")
+
+            if not self.player.inventory:
+                emit(f"{Colors.DIM}소지품이 없습니다.{Colors.RESET}")
+            else:
+                # 장착 참조는 루프 밖에서 한 번만 읽고 동일성(is)으로 비교한다
+                weapon = self.player.equipped_weapon
+                armor = self.player.equipped_armor
+                for i, item in enumerate(self.player.inventory, 1):
+                    enhancement = f" (+{item.enhancement_level})" if item.enhancement_level > 0 else ""
+                    durability = f" (내구도: {item.durability}%)" if item.item_type in _EQUIPPABLE_TYPES else ""
+
+                    # 장착 중인 아이템 표시
+                    equipped = ""
+                    if item is weapon or item is armor:
+                        equipped = _EQUIPPED_TAG
+
+                    emit(f"{i}. {item.name}{enhancement}{durability}{equipped}")
+                    emit(f"   {Colors.DIM}{item.description}{Colors.RESET}")
+
+            emit("\n1. 장비 장착")
+            emit("2. 아이템 사용")
+            emit("3. 아이템 강화")
+            emit("4. 아이템 버리기")
+            emit("0. 돌아가기")
+            self._flush()
+
+            choice = input(_PROMPT_NL).strip()
+            
+            if choice == "0":
+                break
+            elif choice == "1":
+                self.equip_item()
+            elif choice == "2":
+                self.use_item()
+            elif choice == "3":
+                self.enhance_item()
+            elif choice == "4":
+                self.drop_item()
+                
+    def equip_item(self):
+        """아이템 장착"""
+        if not self.player.inventory:
+            return
+            
+        equippable = [item for item in self.player.equippable if item.durability > 0]
+
+        if not equippable:
+            print(f"{Colors.DIM}장착 가능한 아이템이 없습니다.{Colors.RESET}")
+            self._pause(_ERROR_DELAY)
+            return
+            
+        print("\n장착할 아이템:")
+        for i, item in enumerate(equippable, 1):
+            print(f"{i}. {item.name}")
+            
+        print("0. 취소")
+        
+        choice = self._prompt_choice(_PROMPT_NL, 0, len(equippable))
+        if not choice:
+            return
+        item = equippable[choice - 1]
+
+        if item.item_type == ItemType.WEAPON:
+            self.player.equip_weapon(item)
+            print(f"{Colors.GREEN}[{item.name}]을(를) 장착했습니다.{Colors.RESET}")
+        elif item.item_type == ItemType.ARMOR:
+            self.player.equip_armor(item)
+            print(f"{Colors.GREEN}[{item.name}]을(를) 장착했습니다.{Colors.RESET}")
+
+        self._pause(1)
+            
+    def use_item(self):
+        """아이템 사용"""
+        if not self.player.inventory:
+            return
+            
+        usable_items = self.player.items_by_type.get(ItemType.SPECIAL, [])
+        if not usable_items:
+            print(f"{Colors.DIM}사용할 수 있는 아이템이 없습니다.{Colors.RESET}")
+            self._pause(_ERROR_DELAY)
+            return
+            
+        print("\n사용 가능한 아이템:")
+        for i, item in enumerate(usable_items, 1):
+            print(f"{i}. {item.name} - {item.special_effect}")
+            
+        print("0. 취소")
+        
+        choice = self._prompt_choice(_PROMPT_NL, 0, len(usable_items))
+        if not choice:
+            return
+        item = usable_items[choice - 1]
+
+        if item.name == "회복약":
+            self.player.heal(50)
+            self.player.remove_item(item)
+            print(f"{Colors.GREEN}체력을 50 회복했습니다!{Colors.RESET}")
+        elif item.name == "독약":
+            print(f"{Colors.RED}독약은 전투나 암살에 사용됩니다.{Colors.RESET}")
+        else:
+            print(f"{Colors.DIM}여기서는 사용할 수 없습니다.{Colors.RESET}")
+
+        self._pause(1)
+
+    def enhance_item(self):
+        """아이템 강화"""
+        enhanceable = [item for item in self.player.equippable if item.durability > 0]
+
+        if not enhanceable:
+            print(f"{Colors.DIM}강화할 수 있는 아이템이 없습니다.{Colors.RESET}")
+            self._pause(_ERROR_DELAY)
+            return
+            
+        emit = self._emit
+        emit("\n강화 가능한 아이템:")
+        for i, item in enumerate(enhanceable, 1):
+            emit(f"{i}. {item.name} (+{item.enhancement_level}) - 성공률: {80 - item.enhancement_level * 15}%")
+
+        emit("0. 취소")
+        self._flush()
+        
+        choice = self._prompt_choice(_PROMPT_NL, 0, len(enhanceable))
+        if not choice:
+            return
+        item = enhanceable[choice - 1]
+
+        print(f"\n{Colors.YELLOW}[{item.name}] 강화를 시도합니다...{Colors.RESET}")
+        self._pause(1)
+
+        success, result_type = item.enhance()
+        # 강화/저주/파괴는 장착 중인 아이템의 power·defense·내구도를 바꿀 수
+        # 있으므로 전투 수치 캐시를 무효화한다
+        self.player._stats_dirty = True
+
+        if success:
+            print(f"{Colors.GREEN}강화 성공! [{item.name}] (+{item.enhancement_level}){Colors.RESET}")
+        else:
+            if result_type == "normal":
+                print(f"{Colors.YELLOW}강화 실패!{Colors.RESET}")
+            elif result_type == "damaged":
+                print(f"{Colors.RED}강화 실패! 내구도가 크게 감소했습니다!{Colors.RESET}")
+            elif result_type == "destroyed":
+                print(f"{Colors.RED}강화 대실패! [{item.name}]이(가) 파괴되었습니다!{Colors.RESET}")
+                self.player.remove_item(item)
+                if self.player.equipped_weapon is item:
+                    self.player.equipped_weapon = None
+                elif self.player.equipped_armor is item:
+                    self.player.equipped_armor = None
+            elif result_type == "cursed":
+                print(f"{Colors.MAGENTA}강화 실패! 아이템에 저주가 걸렸습니다!{Colors.RESET}")
+                print(f"{Colors.DIM}불길한 기운이 아이템을 감싸고 있다...{Colors.RESET}")
+
+        self._pause(2)
+            
+    def drop_item(self):
+        """아이템 버리기"""
+        if not self.player.inventory:
+            return
+            
+        print("\n버릴 아이템 번호를 입력하세요 (0: 취소):")
+        choice = self._prompt_choice(_PROMPT, 0, len(self.player.inventory))
+        if not choice:
+            return
+        item = self.player.inventory[choice - 1]
+
+        confirm = input(f"\n정말 [{item.name}]을(를) 버리시겠습니까? (y/n) >> ").strip().lower()
+        if confirm == 'y':
+            self.player.remove_item(item)
+            self.current_location.add_item(item)
+            print(f"{Colors.YELLOW}[{item.name}]을(를) 버렸습니다.{Colors.RESET}")
+
+            # 장착 중인 아이템 체크
+            if item is self.player.equipped_weapon:
+                self.player.equipped_weapon = None
+            elif item is self.player.equipped_armor:
+                self.player.equipped_armor = None
+
+        self._pause(1)
+            
+    def rest(self):
+        """휴식"""
+        print(f"\n{Colors.CYAN}잠시 휴식을 취합니다...{Colors.RESET}")
+        
+        # 악몽 체크
+        if self.player.sanity < 30 or self.player.nightmares:
+            print(f"\n{Colors.RED}불안한 잠에 빠집니다...{Colors.RESET}")
+            self._nightmare_event()
+        else:
+            self.player.rest()
+            
+            # 휴식 중 랜덤 이벤트
+            if _rand() < 0.2:
+                print(f"\n{Colors.RED}휴식 중 습격을 받았습니다!{Colors.RESET}")
+                self.random_encounter()
+            else:
+                print(f"\n{Colors.GREEN}충분한 휴식을 취했습니다.{Colors.RESET}")
+                print("체력, 기력, 집중도가 일부 회복되었습니다.")
+                
+                # 저주 체크
+                if self.player.is_cursed:
+                    print(f"{Colors.MAGENTA}저주가 당신의 정신을 갉아먹습니다...{Colors.RESET}")
+                    self.player.sanity -= 5
+                    
+                # 시간 경과
+                self._set_time(self.game_time + 3)
+                self._pause(2)
+                
+    def _nightmare_event(self):
+        """악몽 이벤트"""
+        print(f"\n{Colors.MAGENTA}{_choice(_NIGHTMARE_LINES)}{Colors.RESET}")
+        self.player.sanity -= 10
+        self.player.stamina = max(0, self.player.stamina - 20)
+        
+        # 극심한 정신 불안정
+        if self.player.sanity <= 0:
+            print(f"\n{Colors.RED}정신이 완전히 붕괴했습니다!{Colors.RESET}")
+            self.death_cause = "광기에 빠져 스스로 목숨을 끊었습니다..."
+            self.player_death()
+            
+    # 장소/출신별 특수 행동 테이블 - 메뉴를 열 때마다 분기 트리를 타지 않는다
+    _LOC_SPECIAL_ACTIONS = {
+        "처형장": (("처형 집행", "_execute_prisoner"),),
+        "유곽": (("정보 거래", "_information_broker"),),
+    }
+    _ORIGIN_SPECIAL_ACTIONS = {
+        Origin.FALLEN_NOBLE: (("권세 회복 시도", "_restore_authority"),),
+        Origin.BANDIT_OUTCAST: (("은밀한 도둑질", "_stealth_theft"),),
+        Origin.WAR_ORPHAN: (("생존 기술 사용", "_survival_skills"),),
+    }
+
+    def special_actions(self):
+        """특수 행동 메뉴"""
+        print(f"\n{Colors.BOLD}특수 행동:{Colors.RESET}")
+
+        actions = []
+
+        # 시간 조건이 걸린 행동만 남은 동적 분기
+        if self.current_location.kind is LocationKind.TEMPLE and self.game_time == 0:
+            actions.append(("심야 의식 수행", "_midnight_special_ritual"))
+
+        actions += self._LOC_SPECIAL_ACTIONS.get(self.current_location.name, ())
+        actions += self._ORIGIN_SPECIAL_ACTIONS.get(self.player.origin, ())
+
+        # 상태별 특수 행동
+        if self.player.is_cursed:
+            actions.append(("저주 해제 시도", "_attempt_curse_removal"))
+
+        if not actions:
+            print(f"{Colors.DIM}특별한 행동이 없습니다.{Colors.RESET}")
+            self._pause(_ERROR_DELAY)
+            return
+
+        for i, (name, _) in enumerate(actions, 1):
+            print(f"{i}. {name}")
+        print("0. 돌아가기")
+
+        choice = self._prompt_choice(_PROMPT_NL, 0, len(actions))
+        if choice:
+            getattr(self, actions[choice - 1][1])()
+            
+    def _midnight_special_ritual(self):
+        """심야 특수 의식"""
+        print(f"\n{Colors.MAGENTA}어둠의 힘이 절정에 달했습니다...{Colors.RESET}")
+        
+        # 특수 능력 일시 강화
+        self.player.add_buff(dict(_BUFF_RITUAL_ATTACK))
+        self.player.add_buff(dict(_BUFF_RITUAL_DEFENSE))
+        
+        print(f"{Colors.GREEN}어둠의 축복을 받았습니다!{Colors.RESET}")
+        print("일시적으로 전투력이 크게 상승했습니다!")
+        
+        self.player.sanity -= 15
+        input(_PRESS_ENTER)
+        
+    # 선택지 번호 → 처리 메서드 (_LOCATION_ACTIONS와 같은 방식)
+    _EXECUTE_ACTIONS = {"1": "_execute_kill", "2": "_execute_mercy"}
+
+    def _execute_prisoner(self):
+        """죄수 처형"""
+        print(f"\n{Colors.RED}처형대에 죄수가 끌려옵니다...{Colors.RESET}")
+
+        print("\n1. 직접 처형한다")
+        print("2. 자비를 베푼다")
+        print("3. 구경만 한다")
+
+        choice = input(_PROMPT_NL).strip()
+
+        handler = self._EXECUTE_ACTIONS.get(choice)
+        if handler:
+            getattr(self, handler)()
+
+        input(_PRESS_ENTER)
+
+    def _execute_kill(self):
+        """처형 집행"""
+        print(f"\n{Colors.RED}당신의 칼날이 죄수의 목을 베었습니다...{Colors.RESET}")
+        self.player.sanity -= 20
+        self.player.faction_affinity[Faction.PALACE] += 15
+        self.player.money += 50
+        print(f"{Colors.YELLOW}처형 수당으로 50냥을 받았습니다.{Colors.RESET}")
+
+        # 처형 기술 습득
+        if _rand() < 0.3:
+            if "일섬" not in self.player.skill_names:
+                print(f"\n{Colors.MAGENTA}깨끗한 참수로 [일섬] 기술을 깨달았습니다!{Colors.RESET}")
+                self.player.learn_skill(self.skills_database["일섬"])
+
+    def _execute_mercy(self):
+        """죄수 석방"""
+        print(f"\n{Colors.GREEN}당신은 죄수를 몰래 풀어주었습니다.{Colors.RESET}")
+        self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] += 20
+        self.player.faction_affinity[Faction.PALACE] -= 20
+        
+    def _information_broker(self):
+        """정보 거래소"""
+        print(f"\n{Colors.CYAN}은밀한 정보들이 오가는 곳입니다...{Colors.RESET}")
+        
+        if self.player.money >= 100:
+            print("\n100냥으로 중요 정보를 살 수 있습니다.")
+            choice = input("구매하시겠습니까? (y/n) >> ").strip().lower()
+            
+            if choice == 'y':
+                self.player.money -= 100
+                secret_name, secret_method = _choice(self._BROKER_SECRETS)
+                print(f"\n{Colors.YELLOW}[{secret_name}]의 정보를 얻었습니다!{Colors.RESET}")
+                getattr(self, secret_method)()
+
+        input(_PRESS_ENTER)
+
+    # 정보 거래소 비밀 목록 - 호출마다 람다 3개를 만들지 않는다
+    _BROKER_SECRETS = (
+        ("밀교파 지하 제단의 위치", "_grant_sacred_book"),
+        ("왕실 비자금 은닉처", "_grant_hidden_funds"),
+        ("전설의 무기 소재지", "_grant_legendary_sword"),
+    )
+
+    def _grant_sacred_book(self):
+        """밀교 사원에 금지된 경전 배치"""
+        self._cult_temple.items.append(
+            Item("금지된 경전", ItemType.STORY, "밀교의 비밀이 담긴 책"))
+
+    def _grant_hidden_funds(self):
+        """왕실 비자금 획득"""
+        self.player.money += 500
+
+    def _grant_legendary_sword(self):
+        """저주받은 숲에 명검 청홍 배치"""
+        self._cursed_forest.items.append(self.items_database["명검 청홍"])
+        
+    def _restore_authority(self):
+        """양반 - 권세 회복"""
+        print(f"\n{Colors.CYAN}당신은 옛 가문의 권위를 되찾으려 합니다...{Colors.RESET}")
+        
+        if "왕실 인장" in self.player.inventory_by_name:
+            print(f"{Colors.GREEN}왕실 인장의 힘으로 일부 권한을 되찾았습니다!{Colors.RESET}")
+            
+            # 모든 NPC 신뢰도 소폭 상승
+            for npc in self.npcs.values():
+                if npc.faction == Faction.PALACE:
+                    npc.adjust_trust(15)
+                else:
+                    npc.adjust_trust(5)
+                    
+            print("사람들이 당신을 다시 존중하기 시작합니다.")
+        else:
+            print(f"{Colors.DIM}권위를 증명할 방법이 없습니다...{Colors.RESET}")
+            
+        input(_PRESS_ENTER)
+        
+    def _stealth_theft(self):
+        """도적 - 은밀한 도둑질"""
+        print(f"\n{Colors.CYAN}주변을 살피며 훔칠 만한 것을 찾습니다...{Colors.RESET}")
+        
+        # 성공률 계산 (집중도와 레벨 영향)
+        success_rate = 50 + (self.player.focus // 10) + (self.player.level * 2)
+        
+        if _rand() * 100 < success_rate:
+            print(f"{Colors.GREEN}성공적으로 물건을 훔쳤습니다!{Colors.RESET}")
+            
+            stolen_money = _randint(20, 100)
+            self.player.money += stolen_money
+            print(f"{Colors.YELLOW}{stolen_money}냥을 획득했습니다!{Colors.RESET}")
+            
+            # 가끔 특별한 아이템도 훔침
+            if _rand() < 0.2:
+                special_item = self.items_database[_choice(_THEFT_LOOT)]
+                self.player.add_item(special_item)
+                print(f"{Colors.GREEN}[{special_item.name}]도 함께 훔쳤습니다!{Colors.RESET}")
+                
+        else:
+            print(f"{Colors.RED}들켰습니다!{Colors.RESET}")
+            
+            # 경비병과 전투
+            guard = self.enemy_pool.acquire_template("경비병")
+            self.start_combat(guard)
+            
+        input(_PRESS_ENTER)
+        
+    def _survival_skills(self):
+        """전쟁고아 - 생존 기술"""
+        print(f"\n{Colors.CYAN}극한의 환경에서 익힌 생존 기술을 사용합니다...{Colors.RESET}")
+        
+        print("\n1. 약초 채집 (체력 회복)")
+        print("2. 함정 설치 (다음 전투에서 유리)")
+        print("3. 은신처 만들기 (안전한 휴식)")
+        
+        choice = input(_PROMPT_NL).strip()
+
+        handler = self._SURVIVAL_ACTIONS.get(choice)
+        if handler:
+            getattr(self, handler)()
+
+        input(_PRESS_ENTER)
+
+    _SURVIVAL_ACTIONS = {
+        "1": "_survival_forage",
+        "2": "_survival_trap",
+        "3": "_survival_shelter",
+    }
+
+    def _survival_forage(self):
+        """약초 채집"""
+        print(f"\n{Colors.GREEN}치료용 약초를 찾았습니다!{Colors.RESET}")
+        self.player.heal(30)
+        self.player.stamina = min(self.player.max_stamina, self.player.stamina + 20)
+
+    def _survival_trap(self):
+        """함정 설치"""
+        print(f"\n{Colors.GREEN}교묘한 함정을 설치했습니다!{Colors.RESET}")
+        self.player.add_buff(dict(_BUFF_TRAP))
+        print("다음 전투에서 적이 함정에 걸릴 확률이 있습니다.")
+
+    def _survival_shelter(self):
+        """은신처 휴식"""
+        print(f"\n{Colors.GREEN}안전한 은신처를 만들었습니다!{Colors.RESET}")
+        self.player.rest(multiplier=2)  # 두 배 회복
+        self.player.sanity = min(100, self.player.sanity + 10)
+        print("편안한 휴식으로 정신력도 회복되었습니다.")
+        
+    def _attempt_curse_removal(self):
+        """저주 해제 시도"""
+        print(f"\n{Colors.MAGENTA}저주를 풀기 위해 노력합니다...{Colors.RESET}")
+        
+        if self.current_location.kind is LocationKind.TEMPLE:
+            print("밀교 사제가 당신을 바라봅니다.")
+            print(f"{Colors.CYAN}'그 저주는... 스스로 받아들인 것. 쉽게 풀리지 않을 것이오.'{Colors.RESET}")
+            
+            if self.player.money >= 1000:
+                print("\n'1000냥과 당신의 피를 바친다면... 시도는 해볼 수 있소.'")
+                choice = input("시도하시겠습니까? (y/n) >> ").strip().lower()
+                
+                if choice == 'y':
+                    self.player.money -= 1000
+                    self.player.health -= 50
+                    
+                    if _rand() < 0.3:
+                        print(f"\n{Colors.GREEN}저주가 풀렸습니다!{Colors.RESET}")
+                        self.player.is_cursed = False
+                        self.player.sanity += 20
+                    else:
+                        print(f"\n{Colors.RED}저주가 더욱 강해졌습니다...{Colors.RESET}")
+                        self.player.sanity -= 10
+                        self.player.nightmares.append("실패한 정화 의식")
+        else:
+            print(f"{Colors.DIM}이곳에서는 저주를 풀 수 없습니다...{Colors.RESET}")
+            print("밀교 사원을 찾아가보세요.")
+            
+        input(_PRESS_ENTER)
+        
+    # 비전투 조우 테이블 (텍스트, 처리 메서드 이름) - 호출마다 재조립하지 않는다
+    _ENCOUNTER_EVENTS = (
+        ("상인을 만났습니다.", "merchant_encounter"),
+        ("부상당한 병사를 발견했습니다.", "wounded_soldier_event"),
+        ("수상한 문서를 발견했습니다.", "mysterious_document_event"),
+        ("길 잃은 아이를 만났습니다.", "lost_child_event"),
+    )
+    _DISCOVERIES = (
+        ("낡은 지도", "특별한 장소가 표시된 지도다.", "_old_map_discovery"),
+        ("신비한 약초", "체력을 회복시키는 약초다.", "_herb_discovery"),
+        ("부적", "불길한 기운이 느껴지는 부적이다.", "_talisman_discovery"),
+    )
+
+    def random_encounter(self):
+        """랜덤 조우"""
+        encounter_type = _choice(("combat", "event", "discovery"))
+
+        if encounter_type == "combat":
+            # 시간대와 위치에 따른 적 선택
+            specs = self._night_enemy_specs if self._is_night else self._day_enemy_specs
+
+            # 위험도에 따른 적 선택
+            danger_level = self.current_location.danger_level
+            suitable = specs[:min(danger_level + 1, len(specs))]
+            enemy = self.enemy_pool.acquire(*_choice(suitable))
+
+            print(f"\n{Colors.RED}[{enemy.name}]이(가) 나타났습니다!{Colors.RESET}")
+
+            # 원형이 지정한 등장 연출 (이름 비교 분기 대신 다형 디스패치)
+            if enemy.on_spawn:
+                enemy.on_spawn(self)
+
+            self._pause(1)
+            self.start_combat(enemy)
+
+        elif encounter_type == "event":
+            event_text, event_method = _choice(self._ENCOUNTER_EVENTS)
+            print(f"\n{Colors.CYAN}{event_text}{Colors.RESET}")
+            self._pause(1)
+            getattr(self, event_method)()
+
+        else:  # discovery
+            print(f"\n{Colors.GREEN}숨겨진 무언가를 발견했습니다!{Colors.RESET}")
+            self._pause(1)
+
+            name, desc, method = _choice(self._DISCOVERIES)
+            print(f"\n[{name}]: {desc}")
+            getattr(self, method)()
+            
+    def _old_map_discovery(self):
+        """낡은 지도 발견"""
+        choice = input("\n지도를 살펴보시겠습니까? (y/n) >> ").strip().lower()
+        if choice == 'y':
+            # 랜덤하게 잠긴 장소 하나 해금
+            locked_locations = [loc for loc in self.locations.values() if loc.is_locked]
+            if locked_locations:
+                unlock_loc = _choice(locked_locations)
+                unlock_loc.unlock()
+                print(f"{Colors.YELLOW}[{unlock_loc.name}]의 위치를 발견했습니다!{Colors.RESET}")
+            else:
+                print("지도가 너무 낡아 알아볼 수 없습니다...")
+                
+    def _herb_discovery(self):
+        """약초 발견"""
+        choice = input("\n약초를 먹어보시겠습니까? (y/n) >> ").strip().lower()
+        if choice == 'y':
+            self.player.heal(30)
+            print(f"{Colors.GREEN}체력이 30 회복되었습니다!{Colors.RESET}")
+            
+    def _talisman_discovery(self):
+        """부적 발견"""
+        choice = input("\n부적을 가져가시겠습니까? (y/n) >> ").strip().lower()
+        if choice == 'y':
+            if _rand() < 0.5:
+                print(f"{Colors.GREEN}부적이 당신을 보호합니다!{Colors.RESET}")
+                self.player.add_buff(dict(_BUFF_TALISMAN))
+            else:
+                print(f"{Colors.RED}저주받은 부적이었습니다!{Colors.RESET}")
+                self.player.sanity -= 10
+                self.player.nightmares.append("저주받은 부적")
+                
+    def merchant_encounter(self):
+        """행상인 조우"""
+        print("\n'여행자여, 좋은 물건이 있소!'")
+        print("\n1. 거래하기")
+        print("2. 무시하고 지나가기")
+        print("3. 협박하기 (도적 출신)")
+        
+        choice = input(_PROMPT_NL).strip()
+
+        handler = self._MERCHANT_ACTIONS.get(choice, "_merchant_ignore")
+        getattr(self, handler)()
+
+        input(_PRESS_ENTER)
+
+    _MERCHANT_ACTIONS = {"1": "_merchant_trade", "3": "_merchant_threaten"}
+
+    def _merchant_trade(self):
+        """행상인과 거래"""
+        print("\n행상인이 물건을 보여줍니다...")
+        items_for_sale = _PEDDLER_WARES
+
+        for i, (name, price) in enumerate(items_for_sale, 1):
+            print(f"{i}. {name} - {price}냥")
+        print("0. 취소")
+
+        buy_choice = self._prompt_choice(_PROMPT_NL, 0, len(items_for_sale))
+        if buy_choice:
+            item_name, price = items_for_sale[buy_choice - 1]
+            if self.player.money >= price:
+                self.player.money -= price
+                self.player.add_item(self.items_database[item_name])
+                print(f"{Colors.GREEN}[{item_name}]을(를) 구매했습니다!{Colors.RESET}")
+            else:
+                print(_MSG_NO_MONEY)
+
+    def _merchant_threaten(self):
+        """행상인 협박 (도적 출신 전용)"""
+        if self.player.origin != Origin.BANDIT_OUTCAST:
+            self._merchant_ignore()
+            return
+
+        print(f"\n{Colors.RED}당신은 행상인을 위협합니다!{Colors.RESET}")
+        if _rand() < 0.6:
+            print(f"{Colors.GREEN}행상인이 겁에 질려 물건을 내놓습니다!{Colors.RESET}")
+            self.player.add_item(self.items_database["회복약"])
+            self.player.money += 20
+        else:
+            print(f"{Colors.RED}행상인이 숨겨둔 무기를 꺼냅니다!{Colors.RESET}")
+            enemy = self.enemy_pool.acquire_template("무장한 행상인")
+            self.start_combat(enemy)
+
+    def _merchant_ignore(self):
+        """행상인 무시"""
+        print("\n행상인을 무시하고 지나갑니다.")
+        
+    def wounded_soldier_event(self):
+        """부상병 이벤트"""
+        print("\n피를 흘리며 쓰러져 있는 병사를 발견했습니다.")
+        print("\n1. 도와주기")
+        print("2. 무시하기")
+        print("3. 소지품을 뒤지기")
+        
+        choice = input(_PROMPT_NL).strip()
+
+        handler = self._SOLDIER_ACTIONS.get(choice)
+        if handler:
+            getattr(self, handler)()
+
+        input(_PRESS_ENTER)
+
+    _SOLDIER_ACTIONS = {"1": "_soldier_help", "3": "_soldier_loot"}
+
+    def _soldier_help(self):
+        """부상병 치료"""
+        if self.player.remove_first_by_name("회복약"):
+            print(f"\n{Colors.GREEN}회복약을 사용해 병사를 치료했습니다.{Colors.RESET}")
+            print("병사가 감사를 표하며 정보를 알려줍니다.")
+            print(f"{Colors.CYAN}'밀교파가 수상한 움직임을 보이고 있소. 조심하시오.'{Colors.RESET}")
+            self.game_flags["병사_구조"] = True
+            self.player.sanity += 5
+            self.player.faction_affinity[Faction.PALACE] += 10
+        else:
+            print("치료할 수단이 없습니다...")
+
+    def _soldier_loot(self):
+        """부상병 소지품 약탈"""
+        print(f"\n{Colors.RED}죽어가는 병사의 소지품을 뒤집니다...{Colors.RESET}")
+        self.player.sanity -= 10
+        if _rand() < 0.5:
+            self.player.add_item(self.items_database["포도청 검"])
+            print(f"{Colors.GREEN}[포도청 검]을 획득했습니다.{Colors.RESET}")
+            self.player.money += 30
+            print(f"{Colors.YELLOW}30냥을 획득했습니다.{Colors.RESET}")
+        else:
+            print("아무것도 없습니다.")
+        
+    def mysterious_document_event(self):
+        """수상한 문서 이벤트"""
+        print("\n길바닥에 떨어진 문서를 발견했습니다.")
+        print("암호로 쓰여있지만, 일부 내용을 해독할 수 있을 것 같습니다.")
+        
+        if self.player.focus >= 50:
+            print(f"\n{Colors.GREEN}문서를 해독했습니다!{Colors.RESET}")
+            print("저주받은 숲에 대한 정보가 적혀있습니다.")
+            self.locations["저주받은 숲"].unlock()
+            self.player.use_focus(20)
+            
+            # 추가 정보
+            print(f"{Colors.CYAN}'달이 없는 밤, 숲의 중심에서 피의 의식이...'{Colors.RESET}")
+            self.game_flags["저주받은_숲_의식_정보"] = True
+        else:
+            print(f"\n{Colors.RED}집중력이 부족해 해독할 수 없습니다.{Colors.RESET}")
+            
+        input(_PRESS_ENTER)
+        
+    def lost_child_event(self):
+        """길 잃은 아이 이벤트"""
+        print("\n울고 있는 아이를 발견했습니다.")
+        print("\n1. 부모를 찾아주기")
+        print("2. 무시하기")
+        print("3. 아이를 이용하기 (사악함)")
+        
+        choice = input(_PROMPT_NL).strip()
+
+        handler = self._CHILD_ACTIONS.get(choice)
+        if handler:
+            getattr(self, handler)()
+
+        input(_PRESS_ENTER)
+
+    _CHILD_ACTIONS = {"1": "_child_find_parents", "3": "_child_exploit"}
+
+    def _child_find_parents(self):
+        """아이 부모 찾아주기"""
+        print("\n아이의 부모를 찾아 나섭니다...")
+        self._pause(1)
+
+        if _rand() < 0.7:
+            print(f"\n{Colors.GREEN}부모를 찾았습니다!{Colors.RESET}")
+            print("감사의 표시로 작은 보상을 받았습니다.")
+            self.player.sanity += 10
+            self.player.money += 20
+            self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] += 5
+        else:
+            print(f"\n{Colors.RED}함정이었습니다! 도적들이 나타납니다!{Colors.RESET}")
+            enemy = self.enemy_pool.acquire_template("도적 두목")
+            self.start_combat(enemy)
+
+    def _child_exploit(self):
+        """아이를 이용하기"""
+        print(f"\n{Colors.RED}당신은 아이를 미끼로 사용합니다...{Colors.RESET}")
+        self.player.sanity -= 30
+        self.player.nightmares.append("울부짖는 아이")
+
+        # 사악한 보상
+        self.player.money += 100
+        print(f"{Colors.YELLOW}아이를 팔아 100냥을 얻었습니다...{Colors.RESET}")
+        self.permanent_consequences.append("아동_인신매매")
+
+        # 모든 선한 세력과의 관계 악화
+        self.player.faction_affinity[Faction.PEOPLE_ALLIANCE] -= 50
+        self.player.faction_affinity[Faction.PALACE] -= 20
+        
+    def start_combat(self, enemy: Enemy):
+        """전투 시작"""
+        self.current_combat = Combat(self.player, enemy)
+        self.player.in_combat = True
+        
+        print(f"\n{Colors.RED}=== 전투 시작! ==={Colors.RESET}")
+        
+        # 용병 체크
+        if self.game_flags.get("용병_고용", False):
+            print(f"{Colors.GREEN}고용한 용병이 전투에 참여합니다!{Colors.RESET}")
+            enemy.health = int(enemy.health * 0.8)  # 적 체력 20% 감소
+            self.game_flags["용병_고용"] = False  # 1회성 소모
+            
+        # 함정 체크
+        traps = self.player.buffs_by_type.get("trap")
+        trap_buff = traps[0] if traps else None
+
+        if trap_buff and _rand() * 100 < trap_buff["value"]:
+            print(f"{Colors.GREEN}적이 함정에 걸렸습니다!{Colors.RESET}")
+            damage = 30
+            enemy.health -= damage
+            print(f"적이 {damage}의 피해를 입었습니다!")
+            self.player.remove_buff(trap_buff)
+            
+        self._pause(1)
+        
+        while self.current_combat.is_active:
+            self.combat_turn()
+            
+        # 전투 종료 처리
+        result = self.current_combat.check_combat_end()
+        if result == "victory":
+            self.combat_victory(enemy)
+        elif result == "death":
+            self.player_death()
+            
+        self.current_combat = None
+        self.player.in_combat = False
+        # 다음 조우에서 같은 이름의 적을 재사용할 수 있게 풀로 반환
+        self.enemy_pool.release(enemy)
+        
+    _COMBAT_MENU_BLOCK = (f"\n{Colors.BOLD}행동 선택:{Colors.RESET}\n"
+                          "1. 공격\n2. 회피\n3. 방어\n"
+                          "4. 기습\n5. 기술\n6. 아이템")
+
+    # 전투 선택지 1~4 → Combat 메서드 (5, 6은 Game 쪽 메뉴라 분기 유지)
+    _COMBAT_ACTIONS = {
+        "1": "player_attack",
+        "2": "player_dodge",
+        "3": "player_defend",
+        "4": "player_ambush",
+    }
+
+    def combat_turn(self):
+        """전투 턴"""
+        self.clear_screen()
+        enemy = self.current_combat.enemy
+        p = self.player
+        emit = self._emit
+        emit(_COMBAT_HEADER)
+        emit(f"\n{enemy.name}")
+        emit(_HUD_ENEMY_HP.format(enemy.health, enemy.max_health))
+
+        emit(f"\n{p.name}")
+        emit(_HUD_HP.format(p.health, p.max_health))
+        emit(_HUD_STAMINA.format(p.stamina, p.max_stamina))
+        emit(_HUD_FOCUS.format(p.focus, p.max_focus))
+
+        if self.player.turn_action_taken:
+            emit(f"\n{Colors.DIM}이미 행동을 완료했습니다. 적의 턴입니다...{Colors.RESET}")
+            self._flush()
+            self._pause(1)
+            enemy_action = self.current_combat.enemy_turn()
+            if enemy_action:
+                print(f"\n{enemy_action}")
+            self.current_combat.end_turn()
+            self._pause(2)
+        else:
+            emit(self._COMBAT_MENU_BLOCK)
+            self._flush()
+
+            choice = input(_PROMPT_NL).strip()
+
+            action = self._COMBAT_ACTIONS.get(choice)
+            if action:
+                result = getattr(self.current_combat, action)()
+            elif choice == "5":
+                result = self.skill_menu_combat()
+            elif choice == "6":
+                result = self.combat_item_use()
+            else:
+                print(f"{Colors.RED}올바른 선택지를 입력하세요.{Colors.RESET}")
+                self._pause(1)
+                return
+                
+            if result:
+                print(f"\n{result}")
+                self._pause(2)
+                
+        # 전투 종료 확인
+        end_result = self.current_combat.check_combat_end()
+        if end_result:
+            self.current_combat.is_active = False
+            
+    def skill_menu_combat(self) -> str:
+        """전투 중 기술 메뉴"""
+        if not self.player.skills:
+            return "사용할 수 있는 기술이 없습니다!"
+            
+        print(f"\n{Colors.BOLD}사용 가능한 기술:{Colors.RESET}")
+        for i, skill in enumerate(self.player.skills, 1):
+            print(f"{i}. {skill.name} (기력: {skill.stamina_cost}, 집중: {skill.focus_cost})")
+            print(f"   {Colors.DIM}{skill.description}{Colors.RESET}")
+            
+        print("0. 취소")
+        
+        choice = self._prompt_choice(_PROMPT_NL, 0, len(self.player.skills))
+        if not choice:
+            return ""
+        return self.current_combat.player_use_skill(self.player.skills[choice - 1])
+            
+    def combat_item_use(self) -> str:
+        """전투 중 아이템 사용"""
+        usable_items = self.player.items_by_type.get(ItemType.SPECIAL, [])
+                       
+        if not usable_items:
+            return "사용할 수 있는 아이템이 없습니다!"
+            
+        print(f"\n{Colors.BOLD}사용 가능한 아이템:{Colors.RESET}")
+        for i, item in enumerate(usable_items, 1):
+            print(f"{i}. {item.name}")
+            
+        print("0. 취소")
+        
+        choice = self._prompt_choice(_PROMPT_NL, 0, len(usable_items))
+        if not choice:
+            return ""
+        item = usable_items[choice - 1]
+
+        if item.name == "회복약":
+            self.player.heal(50)
+            self.player.remove_item(item)
+            self.player.turn_action_taken = True
+            return f"{Colors.GREEN}체력을 50 회복했습니다!{Colors.RESET}"
+        elif item.name == "독약":
+            # 독약을 무기에 바름
+            if self.player.equipped_weapon:
+                self.player.add_buff(dict(_BUFF_POISON_BLADE))
+                self.player.remove_item(item)
+                self.player.turn_action_taken = True
+                return f"{Colors.MAGENTA}무기에 독을 발랐습니다!{Colors.RESET}"
+            else:
+                return "무기가 없어 독을 바를 수 없습니다!"
+        else:
+            return "전투 중에는 사용할 수 없습니다!"
+            
+    def combat_victory(self, enemy: Enemy):
+        """전투 승리"""
+        print(f"\n{Colors.GREEN}=== 승 리! ==={Colors.RESET}")
+        print(f"{enemy.name}을(를) 물리쳤습니다!")
+        
+        # 경험치 획득
+        self.player.gain_experience(enemy.experience_reward)
+        print(f"경험치 +{enemy.experience_reward}")
+        
+        # 레벨업 확인
+        if self.player.experience == 0:  # 레벨업 했다면
+            print(f"{Colors.YELLOW}레벨 업! 현재 레벨: {self.player.level}{Colors.RESET}")
+            
+            # 직업 승급 확인
+            if self.player.advance_job():
+                print(f"{Colors.MAGENTA}직업이 [{self.player.job.label}](으)로 승급했습니다!{Colors.RESET}")
+                
+        # 전리품 획득
+        if enemy.loot:
+            print(f"\n{Colors.YELLOW}전리품 발견:{Colors.RESET}")
+            for item in enemy.loot:
+                print(f"- {item.name}")
+                self.player.add_item(item)
+                
+        # 금전 획득
+        money_reward = _randint(10, 50) + (enemy.experience_reward // 2)
+        self.player.money += money_reward
+        print(f"금전 +{money_reward}냥")
+        
+        # 특수 승리 보상
+        if enemy.name == "원혼 무리" and "혼령_퀘스트" in self.game_flags:
+            print(f"\n{Colors.MAGENTA}혼령들이 성불했습니다...{Colors.RESET}")
+            self.player.sanity += 20
+            print(f"{Colors.GREEN}정신력이 회복되었습니다!{Colors.RESET}")
+            
+        input(_PRESS_ENTER)
+        
+    def player_death(self):
+        """플레이어 사망"""
+        self.clear_screen()
+        
+        # 타이핑 효과로 사망 메시지 출력.
+        # 색상 코드는 줄당 한 번만 쓰고, 글자는 print 래퍼 없이 직접 쓴다
+        # (글자마다 이스케이프 20여 바이트를 곁들이던 쓰기량을 1/10 이하로).
+        out = sys.stdout
+        if self.fast_text:
+            # 빠른 텍스트 - 타이핑 없이 전체를 한 번에 쓰고 한 번만 쉰다
+            out.write(Colors.RED + "\n".join(_DEATH_TYPING_LINES)
+                      + Colors.RESET + "\n")
+            out.flush()
+            self._pause(0.8)
+        else:
+            # 가능하면 TextIOWrapper를 우회해 글자를 바이트로 직접 쓴다
+            # (글자당 인코딩+버퍼 잠금 비용 제거, flush 호출도 불필요)
+            try:
+                fd = out.fileno()
+            except (AttributeError, OSError, ValueError):
+                fd = None  # 리다이렉트된 스트림 - 텍스트 경로 유지
+            if fd is None:
+                for message in _DEATH_TYPING_LINES:
+                    out.write(Colors.RED)
+                    for char in message:
+                        out.write(char)
+                        out.flush()
+                        self._pause(0.05)
+                    out.write(Colors.RESET + "\n")
+                    self._pause(0.8)
+            else:
+                out.flush()  # 기존 버퍼와 순서가 섞이지 않게 비우고 시작
+                for message in _DEATH_TYPING_LINES:
+                    os.write(fd, Colors.RED_B)
+                    for char in message:
+                        os.write(fd, char.encode("utf-8"))
+                        self._pause(0.05)
+                    os.write(fd, Colors.RESET_B + b"\n")
+                    self._pause(0.8)
+        
+        print()
+        print(_BAR)
+        print(_DEATH_HEADER)
+        print(_BAR)
+        print()
+        
+        # 사망 원인별 메시지
+        if self.death_cause:
+            print(_colorize(self.death_cause, Colors.DIM))
+        else:
+            print(_colorize("당신의 여정은 여기서 끝났습니다...", Colors.DIM))
+
+        print(_colorize(
+            f"레벨 {self.player.level}에서 {self.current_location.name}에서 사망",
+            Colors.DIM))
+        print()
+        
+        # 영구 사망 경고
+        print(_BAR)
+        print(_MSG_PERMADEATH)
+        print(_MSG_STORY_ENDS)
+        print(_BAR)
+        
+        # 세이브 파일 자동 삭제 (영구 사망) - 존재 확인 없이 바로 지운다
+        try:
+            os.unlink(GameConstants.SAVE_FILE_PATH)
+            print(f"\n{Colors.RED}운명의 기록이 소멸되었습니다...{Colors.RESET}")
+        except FileNotFoundError:
+            pass
+        except OSError:
+            pass
+        
+        # 페이드 아웃 효과 (빠른 텍스트에서는 3회 대기를 1회로 접는다)
+        self._pause(2)
+        for dots in _FADE_DOTS:
+            print(dots)
+            if self.fast_text:
+                continue
+            # 키 입력이 있으면 남은 페이드를 건너뛴다
+            if self._skippable_pause(1):
+                break
+        if self.fast_text:
+            self._pause(1)
+            
+        input(f"\n{Colors.DIM}Enter를 눌러 어둠 속으로...{Colors.RESET}")
+        self.is_running = False
+        
+    def reset_state(self):
+        """게임 오버 후 재시작 준비 - __init__ 전체 재실행 대신 제자리 초기화.
+
+        아이템/기술 카탈로그, 조우 테이블, 상점 목록, 대화 디스패치처럼
+        불변인 데이터는 유지하고 한 판 동안 변한 상태만 되돌린다.
+        장소/NPC는 비워 두면 다음 게임 시작 시 새로 만들어진다.
+        """
+        self.player = None
+        self.current_location = None
+        self.locations.clear()
+        self.npcs.clear()
+        self.current_combat = None
+        self._buf.clear()
+        self._last_frame = None
+        self.is_running = True
+        for flag in self.game_flags:
+            self.game_flags[flag] = False
+        self.permanent_consequences.clear()
+        self._set_time(12)
+        self.death_cause = ""
+        self._last_save_payload = None
+        # 카탈로그 아이템은 강화(power/defense ×1.2)·저주(name/special_effect
+        # 변이)·내구도로 판 중에 변형됐을 수 있어 원본 템플릿 값으로 복구한다.
+        # 사전 키는 원래 이름 그대로라 저주로 개명된 아이템도 찾아진다.
+        for name, item in self.items_database.items():
+            template = _ITEM_TEMPLATES[name]
+            for field in _ITEM_FIELDS:
+                setattr(item, field, getattr(template, field))
+
+    def run(self):
+        """게임 실행
+
+        의도적으로 동기 루프다. asyncio 전환을 보류한 근거는 PERF.md 참고.
+        """
+        while True:
+            choice = self.main_menu()
+            
+            if choice == "1":  # 새 게임
+                self.create_character()
+                self.location_menu()
+                
+            elif choice == "2":  # 이어하기
+                if self.load_game():
+                    self._pause(1)
+                    self.location_menu()
+                else:
+                    input(f"\n{Colors.DIM}Enter를 눌러 계속...{Colors.RESET}")
+                    
+            elif choice == "3":  # 종료
+                print(f"\n{Colors.DIM}조선의 어둠은 계속됩니다...{Colors.RESET}")
+                self._pause(1)
+                break
+                
+            # 게임 오버 후 리셋 - 불변 데이터는 유지한 채 상태만 되돌린다
+            self.reset_state()
+
+
+def _sigint_handler(signum, frame):
+    """Ctrl-C 처리 - 색상 잔류 없이 터미널을 복구하고 즉시 종료"""
+    sys.stdout.write(f"{Colors.RESET}\n\n{Colors.RED}강제 종료됨{Colors.RESET}\n")
+    raise SystemExit(0)
+
+
+def main():
+    """메인 함수"""
+    signal.signal(signal.SIGINT, _sigint_handler)
+    try:
+        game = Game()
+        game.run()
+    except Exception as e:
+        print(f"\n{Colors.RED}오류 발생: {e}{Colors.RESET}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        # 어떤 경로로 끝나도 ANSI 속성이 터미널에 남지 않게 한다
+        sys.stdout.write(Colors.RESET)
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file